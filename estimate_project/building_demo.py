@@ -2,6 +2,71 @@ from tkinter import *
 from tkinter import messagebox
 from idlelib.tooltip import Hovertip
 
+from labor_rate import DAILY_WORK_HOURS, labor_rate_provider
+
+
+class CostBreakdown:
+    """
+    Immutable costs of one set of demolition project inputs.
+
+    Every cost is computed once, when the breakdown is created, in the order
+    the estimate builds on itself: man-hours, equipment, and disposal make up
+    the job cost, overhead is a share of the job cost, and the bid is the
+    total cost times the profit markup.
+
+    Attributes:
+        total_sqft, equipment_cost, disposal_cost, num_days, num_guys, 
+        num_hours, cost_per_man_hour: The inputs the costs were computed from.
+        man_hours_cost (float): num_days * num_guys * num_hours * cost_per_man_hour.
+        job_cost (float): Man-hours, equipment, and disposal costs.
+        overhead_cost (float): job_cost * overhead_percentage.
+        total_cost (float): job_cost + overhead_cost.
+        bid_price (float): total_cost * profit.
+        cost_per_sqft (float): bid_price / total_sqft, or 0.0 without square footage.
+        profit_margin (float): Percent of the bid left after the job cost, 
+        rounded to 2 places, or 0.0 without a bid.
+    """
+
+    __slots__ = ("total_sqft", "equipment_cost", "disposal_cost", "num_days", "num_guys",
+                 "num_hours", "cost_per_man_hour", "man_hours_cost", "job_cost",
+                 "overhead_cost", "total_cost", "bid_price", "cost_per_sqft", "profit_margin")
+
+    def __init__(self, total_sqft, equipment_cost, disposal_cost, num_days, num_guys,
+                 num_hours, cost_per_man_hour, overhead_percentage, profit):
+        man_hours_cost = num_days * num_guys * num_hours * cost_per_man_hour
+        job_cost = man_hours_cost + equipment_cost + disposal_cost
+        overhead_cost = job_cost * overhead_percentage
+        total_cost = job_cost + overhead_cost
+        bid_price = total_cost * profit
+        cost_per_sqft = bid_price / total_sqft if total_sqft else 0.0
+        profit_margin = round(((bid_price - job_cost) / bid_price) * 100, 2) if bid_price else 0.0
+
+        set_slot = object.__setattr__
+        set_slot(self, "total_sqft", total_sqft)
+        set_slot(self, "equipment_cost", equipment_cost)
+        set_slot(self, "disposal_cost", disposal_cost)
+        set_slot(self, "num_days", num_days)
+        set_slot(self, "num_guys", num_guys)
+        set_slot(self, "num_hours", num_hours)
+        set_slot(self, "cost_per_man_hour", cost_per_man_hour)
+        set_slot(self, "man_hours_cost", man_hours_cost)
+        set_slot(self, "job_cost", job_cost)
+        set_slot(self, "overhead_cost", overhead_cost)
+        set_slot(self, "total_cost", total_cost)
+        set_slot(self, "bid_price", bid_price)
+        set_slot(self, "cost_per_sqft", cost_per_sqft)
+        set_slot(self, "profit_margin", profit_margin)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
 
 class BuildingDemo:
     """
@@ -15,9 +80,14 @@ class BuildingDemo:
         num_days (int): The estimated number of days for the project.
         num_guys (int): The estimated number of workers.
         num_hours (int): The number of work hours per day (default is 10).
+        cost_per_man_hour (float): Loaded labor cost per man-hour, taken from the 
+        shared labor rate provider when the project is created.
         bid_price (float): The calculated bid price for the project (initialized to 0.0).
 
     Methods: 
+        cost_breakdown() -> CostBreakdown:
+            Returns the costs of the current inputs, computed once per input set.
+
         calculate_cost_per_sqft() -> float:
             Calculates and prints the estimated cost per square foot.
 
@@ -31,7 +101,7 @@ class BuildingDemo:
             Calculates the total disposal cost for the project.
 
         calculate_job_cost() -> float:
-            Calculates and prints the total job cost for the project.
+            Calculates the total job cost for the project.
 
         calculate_bid_price() -> float:
             Calculates and prints the bid price for the project.
@@ -55,12 +125,12 @@ class BuildingDemo:
             Launches a new Tkinter window for entering demolition project details.
     """
     
-    DAILY_WORK_HOURS = 10
-    COST_PER_MAN_HOUR = 30
+    DAILY_WORK_HOURS = DAILY_WORK_HOURS
     PROFIT = 1.35
     OVERHEAD_PERCENTAGE = 0.1
+    labor_rate_provider = labor_rate_provider
 
-    def __init__(self, description, structure_type, total_sqft: int = 0, 
+    def __init__(self, description, structure_type="Other", total_sqft: int = 0, 
                  total_equipment_cost: int = 0, total_disposal_cost: int = 0, 
                  num_days: int = 0, num_guys: int = 0):
         self.description = description
@@ -71,62 +141,69 @@ class BuildingDemo:
         self.num_days = num_days
         self.num_guys = num_guys
         self.num_hours = self.DAILY_WORK_HOURS
+        # Cached for a day by the provider, so creating a project does not query PostgreSQL
+        self.cost_per_man_hour = self.labor_rate_provider.get_rate()
         self.bid_price = 0.0 # Initialize bid price
+        self._cost_breakdown = None
+        self._cost_breakdown_inputs = None
+
+    def cost_breakdown(self) -> CostBreakdown:
+        """
+        Returns the cost breakdown of the current inputs.
+
+        The breakdown is cached and only recomputed when an input, the labor
+        rate, OVERHEAD_PERCENTAGE, or PROFIT has changed since the last call.
+        """
+        inputs = (self.total_sqft, self.total_equipment_cost, self.total_disposal_cost,
+                  self.num_days, self.num_guys, self.num_hours, self.cost_per_man_hour,
+                  self.OVERHEAD_PERCENTAGE, self.PROFIT)
+        if inputs != self._cost_breakdown_inputs:
+            self._cost_breakdown = CostBreakdown(*inputs)
+            self._cost_breakdown_inputs = inputs
+        return self._cost_breakdown
 
     def calculate_cost_per_sqft(self) -> float:
         """
         Calculates the estimated cost per square foot.
         """
-        if self.bid_price == 0.0:
-            self.calculate_bid_price()
-        price_per_sqft = self.bid_price / self.total_sqft
-        return price_per_sqft
+        return self.cost_breakdown().cost_per_sqft
 
     def calculate_man_hours(self) -> float:
         """
         Calculates the total man-hours cost for the project.
         """
-        total_man_hours = self.num_days * self.num_guys * self.num_hours * \
-                            self.COST_PER_MAN_HOUR
-        return total_man_hours
+        return self.cost_breakdown().man_hours_cost
 
     def calculate_equipment_cost(self) -> float:
         """
         Calculates the total equipment cost for the project.
         """
-        equipment_cost = self.total_equipment_cost
-        return equipment_cost
+        return self.cost_breakdown().equipment_cost
 
     def calculate_disposal_cost(self) -> float:
         """
         Calculates the total disposal cost for the project. 
         """
-        disposal_cost = self.total_disposal_cost
-        return disposal_cost
+        return self.cost_breakdown().disposal_cost
 
     def calculate_job_cost(self) -> float:
         """
-        Calculates and prints the total job cost for the project.
+        Calculates the total job cost for the project.
         """
-        job_cost = self.calculate_man_hours() + self.calculate_equipment_cost() \
-                        + self.calculate_disposal_cost()
-        # print(f"The estimated job cost is: ${job_cost:,.2f}")
-        return job_cost
+        return self.cost_breakdown().job_cost
 
     def calculate_bid_price(self) -> float:
         """
         Calculates the bid price for the project.
         """
-        total_cost = self.calculate_total_cost()
-        self.bid_price = total_cost * self.PROFIT
+        self.bid_price = self.cost_breakdown().bid_price
         return self.bid_price
     
     def calculate_overhead_cost(self) -> float:
         """
         Calculates the overhead costs for the project.
         """
-        overhead_cost = self.calculate_job_cost() * self.OVERHEAD_PERCENTAGE
-        return overhead_cost
+        return self.cost_breakdown().overhead_cost
     
     def on_closing_estimates(self, info):
         if info:
@@ -137,22 +214,26 @@ class BuildingDemo:
         """
         Generates a detailed report of the project.
         """
+        # Every figure comes from one breakdown, so each cost is computed once
+        breakdown = self.cost_breakdown()
+        self.bid_price = breakdown.bid_price
         report = (
             f"{self.description} Project Report\n"
             f"-----------------------------------\n"
             f"Description: {self.description}\n"
             f"Structure Type: {self.structure_type}\n"
-            f"Total SqFt: {self.total_sqft}\n"
-            f"Number of Days: {self.num_days}\n"
-            f"Number of Workers: {self.num_guys}\n"
-            f"Total Man-Hours Cost: ${self.calculate_man_hours():,.2f}\n"
-            f"Total Equipment Budget: ${self.calculate_equipment_cost():,.2f}\n"
-            f"Total Disposal Budget: ${self.calculate_disposal_cost():,.2f}\n"
-            f"Total Job Cost: ${self.calculate_job_cost():,.2f}\n"
-            f"Overhead Cost: ${self.calculate_overhead_cost():,.2f}\n"
-            f"Bid Price: ${self.calculate_bid_price():,.2f}\n"
-            f"Price Per SqFt: ${self.calculate_cost_per_sqft():.2f}\n"
-            f"Profit Margin: {self.calculate_profit_margin():.2f}%\n"
+            f"Total SqFt: {breakdown.total_sqft}\n"
+            f"Number of Days: {breakdown.num_days}\n"
+            f"Number of Workers: {breakdown.num_guys}\n"
+            f"Labor Rate: ${breakdown.cost_per_man_hour:,.2f} per man-hour\n"
+            f"Total Man-Hours Cost: ${breakdown.man_hours_cost:,.2f}\n"
+            f"Total Equipment Budget: ${breakdown.equipment_cost:,.2f}\n"
+            f"Total Disposal Budget: ${breakdown.disposal_cost:,.2f}\n"
+            f"Total Job Cost: ${breakdown.job_cost:,.2f}\n"
+            f"Overhead Cost: ${breakdown.overhead_cost:,.2f}\n"
+            f"Bid Price: ${breakdown.bid_price:,.2f}\n"
+            f"Price Per SqFt: ${breakdown.cost_per_sqft:.2f}\n"
+            f"Profit Margin: {breakdown.profit_margin:.2f}%\n"
         )
 
         return report
@@ -161,9 +242,10 @@ class BuildingDemo:
         """
         Validates the input data for the project.
         """
-        if self.total_sqft <= 0 or self.total_equipment_cost < 0 or \
-           self.total_disposal_cost < 0 or self.num_days <= 0 or \
-           self.num_guys <= 0:
+        breakdown = self.cost_breakdown()
+        if breakdown.total_sqft <= 0 or breakdown.equipment_cost < 0 or \
+           breakdown.disposal_cost < 0 or breakdown.num_days <= 0 or \
+           breakdown.num_guys <= 0:
             print("Invalid input data. Please check the values.")
             return False
         return True
@@ -172,16 +254,13 @@ class BuildingDemo:
         """
         Calculates the profit margin for the project.
         """
-        job_cost = self.calculate_job_cost()
-        profit_margin = round(((self.bid_price - job_cost) / self.bid_price) * 100, 2)
-        return profit_margin
+        return self.cost_breakdown().profit_margin
 
     def calculate_total_cost(self) -> float:
         """
         Calculates the total cost of the project.
         """
-        total_cost = self.calculate_job_cost() + self.calculate_overhead_cost()
-        return total_cost
+        return self.cost_breakdown().total_cost
     
     def create_tooltip(self, widget, text):
         """Creates tooltips for the tkinter launch_demo_window widgets"""
@@ -245,8 +324,9 @@ class BuildingDemo:
         num_guys_label = Label(demo_project_window, text="Total Number of Workers")
         num_guys_label.grid(column=0, row=4, padx=5, pady=5)
         self.create_tooltip(num_guys_label, "Calculates man hours based off number of days."
-                    "\nHours are set to 10 and hourly rate is set at $30 per hour\n"
-                    "plus a 35% markup by default.")
+                    f"\nHours are set to {self.num_hours} and the hourly rate is "
+                    f"${self.cost_per_man_hour:,.2f}\n(from the last 12 months of payroll "
+                    "and expenses)\nplus a 35% markup by default.")
         num_guys_input = Entry(demo_project_window)
         num_guys_input.grid(column=1, row=4, padx=5, pady=5)
 
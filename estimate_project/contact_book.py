@@ -1,6 +1,8 @@
 from tkinter import Tk, Label, Entry, Button, ttk
 import tkinter as tk
 import logging
+import re
+from psycopg2.extras import execute_values
 
 from postgresql import get_db_connection
 
@@ -20,6 +22,214 @@ logger = logging.getLogger(__name__)
 # See postgresql.py for required parameters.
 # ========================================================================== #
 
+CONTACT_SEARCH_LIMIT = 50
+
+
+def build_contact_search_query(search_text):
+    """
+    Build a prefix-matching tsquery string from free-form search text.
+
+    Phone-like tokens (e.g. 615-555-1234) are collapsed to digits so they
+    match the phone digits stored in client.search_vector. Every other token
+    is split into words. Returns None when nothing searchable is left.
+    """
+    terms = []
+    previous_was_phone = False
+    for token in search_text.split():
+        if re.fullmatch(r"[\d()+.\-]+", token):
+            digits = re.sub(r"\D", "", token)
+            # Join "(615) 555-1234" style numbers back into one digit string.
+            if previous_was_phone and terms:
+                terms[-1] += digits
+            else:
+                terms.append(digits)
+            previous_was_phone = True
+        else:
+            terms.extend(re.findall(r"\w+", token.lower()))
+            previous_was_phone = False
+
+    terms = [term for term in terms if term]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def parse_billing_address(address_value):
+    """Split Billing Address into street, city, state, zip by commas."""
+    parts = [part.strip() for part in address_value.split(",")]
+    if len(parts) != 4 or any(not part for part in parts):
+        return None
+    return parts[0], parts[1], parts[2], parts[3]
+
+
+def split_client_name(client_name):
+    """Split full client name into first_name and last_name."""
+    name_parts = client_name.strip().split(maxsplit=1)
+    first_name = name_parts[0] if name_parts else ""
+    last_name = name_parts[1] if len(name_parts) > 1 else ""
+    return first_name, last_name
+
+
+def format_billing_address(street, city, state, zip_code):
+    """Format PostgreSQL address columns into a single GUI string."""
+    values = [street or "", city or "", state or "", zip_code or ""]
+    return ", ".join(values)
+
+
+def apply_contact_batch(companies, new_clients, updated_clients, deleted_client_ids):
+    """
+    Flush queued contact book edits to PostgreSQL in a single transaction.
+
+    Parameters:
+    companies (dict): company_id -> (company_name, street, city, state, zip)
+    for every company touched by the batch.
+    new_clients (list): (company_id, first_name, last_name, phone, email) tuples.
+    updated_clients (dict): client_id -> (company_id, first_name, last_name,
+    phone, email) for existing clients.
+    deleted_client_ids (list): client_id values to delete.
+
+    Returns:
+    dict: The client rows returned by PostgreSQL under "inserted" and
+    "updated", and the removed client_id values under "deleted".
+    """
+    result = {"inserted": [], "updated": [], "deleted": []}
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            if companies:
+                company_rows = [(company_id, *values) for company_id, values in companies.items()]
+                execute_values(
+                    cur,
+                    """
+                    UPDATE company AS co
+                    SET company_name = v.company_name, street = v.street, city = v.city,
+                        state = v.state, zip = v.zip
+                    FROM (VALUES %s) AS v(company_id, company_name, street, city, state, zip)
+                    WHERE co.company_id = v.company_id;
+                    """,
+                    company_rows,
+                    template="(%s::integer, %s, %s, %s, %s, %s)",
+                )
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO company (company_id, company_name, street, city, state, zip)
+                    SELECT v.company_id, v.company_name, v.street, v.city, v.state, v.zip
+                    FROM (VALUES %s) AS v(company_id, company_name, street, city, state, zip)
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM company co WHERE co.company_id = v.company_id
+                    );
+                    """,
+                    company_rows,
+                    template="(%s::integer, %s, %s, %s, %s, %s)",
+                )
+
+            if new_clients:
+                result["inserted"] = execute_values(
+                    cur,
+                    """
+                    INSERT INTO client (company_id, first_name, last_name, phone, email)
+                    VALUES %s
+                    RETURNING client_id, company_id, first_name, last_name, phone, email;
+                    """,
+                    new_clients,
+                    fetch=True,
+                )
+
+            if updated_clients:
+                result["updated"] = execute_values(
+                    cur,
+                    """
+                    UPDATE client AS c
+                    SET company_id = v.company_id, first_name = v.first_name,
+                        last_name = v.last_name, phone = v.phone, email = v.email
+                    FROM (VALUES %s) AS v(client_id, company_id, first_name, last_name, phone, email)
+                    WHERE c.client_id = v.client_id
+                    RETURNING c.client_id, c.company_id, c.first_name, c.last_name, c.phone, c.email;
+                    """,
+                    [(client_id, *values) for client_id, values in updated_clients.items()],
+                    template="(%s::integer, %s::integer, %s, %s, %s, %s)",
+                    fetch=True,
+                )
+
+            if deleted_client_ids:
+                cur.execute(
+                    "DELETE FROM client WHERE client_id = ANY(%s) RETURNING client_id;",
+                    (list(deleted_client_ids),),
+                )
+                result["deleted"] = [row[0] for row in cur.fetchall()]
+        conn.commit()
+
+    return result
+
+
+class CompanyDirectory:
+    """
+    In-memory copy of the company table keyed by company_id and company_name.
+
+    The directory is loaded on first use and then kept current by the 
+    contact book's own writes, so the company combobox and the billing 
+    address autofill never query PostgreSQL. Call invalidate() to reload it 
+    after changes made outside the contact book.
+    """
+    def __init__(self):
+        self.by_id = None
+        self.by_name = {}
+        self.company_names = []
+
+    def load(self):
+        """Load every company row from PostgreSQL."""
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT company_id, company_name, street, city, state, zip
+                    FROM company
+                    ORDER BY company_id;
+                    """
+                )
+                rows = cur.fetchall()
+
+        self.by_id = {row[0]: row for row in rows}
+        self._index_names()
+
+    def _index_names(self):
+        """Rebuild the name index, keeping the lowest company_id per name."""
+        self.by_name = {}
+        for company_id in sorted(self.by_id):
+            company = self.by_id[company_id]
+            if company[1]:
+                self.by_name.setdefault(company[1], company)
+        self.company_names = sorted(self.by_name)
+
+    def ensure_loaded(self):
+        """Load the directory if it has not been loaded or was invalidated."""
+        if self.by_id is None:
+            self.load()
+
+    def names(self):
+        """Return the sorted company names for the company combobox."""
+        self.ensure_loaded()
+        return self.company_names
+
+    def get_by_name(self, company_name):
+        """Return (company_id, company_name, street, city, state, zip) or None."""
+        self.ensure_loaded()
+        return self.by_name.get(company_name)
+
+    def upsert(self, company_id, company_name, street, city, state, zip_code):
+        """Apply a company insert or update that was just written to PostgreSQL."""
+        if self.by_id is None:
+            return
+        self.by_id[company_id] = (company_id, company_name, street, city, state, zip_code)
+        self._index_names()
+
+    def invalidate(self):
+        """Drop the cached rows so the next lookup reloads from PostgreSQL."""
+        self.by_id = None
+        self.by_name = {}
+        self.company_names = []
+
 
 class ContactBook:
     """
@@ -31,6 +241,9 @@ class ContactBook:
 
     Attributes:
     - filtered_contacts (list): List of contacts filtered by search criteria.
+    - contacts (list): Full contact list currently loaded in the window.
+    - company_directory (CompanyDirectory): Cached company rows used by the
+      company combobox and billing address autofill.
     """
     def __init__(self):
         """
@@ -40,6 +253,8 @@ class ContactBook:
         empty list for filtered contacts.
         """
         self.filtered_contacts = []
+        self.contacts = []
+        self.company_directory = CompanyDirectory()
 
         self.FONT = "Times New Roman"
         self.FONT_SIZE = 13
@@ -62,6 +277,8 @@ class ContactBook:
         - Remove a contact from the contact book.
         - Search for contacts by company name or client name.
         - Select a contact to populate fields in the main GUI.
+        - Batch edit mode that queues adds, updates, and removals and commits
+          them in one transaction.
 
         Parameters:
         None
@@ -70,30 +287,29 @@ class ContactBook:
         None
         """
 
-        def parse_billing_address(address_value):
-            """Split Billing Address into street, city, state, zip by commas."""
-            parts = [part.strip() for part in address_value.split(",")]
-            if len(parts) != 4 or any(not part for part in parts):
-                return None
-            return parts[0], parts[1], parts[2], parts[3]
-
-
-        def split_client_name(client_name):
-            """Split full client name into first_name and last_name."""
-            name_parts = client_name.strip().split(maxsplit=1)
-            first_name = name_parts[0] if name_parts else ""
-            last_name = name_parts[1] if len(name_parts) > 1 else ""
-            return first_name, last_name
+        pending_batch = {
+            "companies": {},
+            "new_clients": [],
+            "updated_clients": {},
+            "deleted_client_ids": [],
+        }
 
+        def fetch_contacts_from_postgresql(company_id=None, company_name=None, client_name=None,
+                                           search_text=None, limit=CONTACT_SEARCH_LIMIT):
+            """
+            Fetch joined client + company data for the contact list.
 
-        def format_billing_address(street, city, state, zip_code):
-            """Format PostgreSQL address columns into a single GUI string."""
-            values = [street or "", city or "", state or "", zip_code or ""]
-            return ", ".join(values)
-
+            When search_text is given, contacts are matched against the
+            client.search_vector full-text index (see 
+            sql_database_layouts/contact_search.sql), ranked by relevance, 
+            and limited to the best `limit` matches.
+            """
+            if search_text is not None:
+                search_query = build_contact_search_query(search_text)
+                if search_query is None:
+                    return []
+                return fetch_ranked_contacts(search_query, limit)
 
-        def fetch_contacts_from_postgresql(company_id=None, company_name=None, client_name=None):
-            """Fetch joined client + company data for the contact list."""
             query = """
                 SELECT
                     c.client_id,
@@ -133,21 +349,59 @@ class ContactBook:
                     cur.execute(query, params)
                     rows = cur.fetchall()
 
-            contacts = []
-            for row in rows:
-                client_full_name = " ".join(part for part in [row[7], row[8]] if part).strip()
-                contacts.append(
-                    {
-                        "client_id": row[0],
-                        "company_id": row[1],
-                        "company": row[2] or "N/A",
-                        "billing address": format_billing_address(row[3], row[4], row[5], row[6]),
-                        "client": client_full_name if client_full_name else "N/A",
-                        "phone": row[9] or "N/A",
-                        "email": row[10] or "N/A",
-                    }
-                )
-            return contacts
+            return [build_contact(row[0], row[1], row[2:7], row[7], row[8], row[9], row[10])
+                    for row in rows]
+
+
+        def build_contact(client_id, company_id, company_values, first_name, last_name, phone, email):
+            """Build the GUI contact dictionary from client and company values."""
+            company_name, street, city, state, zip_code = company_values
+            client_full_name = " ".join(part for part in [first_name, last_name] if part).strip()
+            return {
+                "client_id": client_id,
+                "company_id": company_id,
+                "company": company_name or "N/A",
+                "billing address": format_billing_address(street, city, state, zip_code),
+                "client": client_full_name if client_full_name else "N/A",
+                "first_name": first_name or "",
+                "last_name": last_name or "",
+                "phone": phone or "N/A",
+                "email": email or "N/A",
+            }
+
+
+        def fetch_ranked_contacts(search_query, limit):
+            """Fetch the best full-text matches for a tsquery string."""
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        SELECT
+                            c.client_id,
+                            c.company_id,
+                            co.company_name,
+                            co.street,
+                            co.city,
+                            co.state,
+                            co.zip,
+                            c.first_name,
+                            c.last_name,
+                            c.phone,
+                            c.email
+                        FROM client c
+                        JOIN company co ON c.company_id = co.company_id
+                        CROSS JOIN to_tsquery('simple', %s) AS query
+                        WHERE c.search_vector @@ query
+                        ORDER BY ts_rank(c.search_vector, query) DESC, co.company_name,
+                                 c.last_name, c.first_name
+                        LIMIT %s;
+                        """,
+                        (search_query, limit),
+                    )
+                    rows = cur.fetchall()
+
+            return [build_contact(row[0], row[1], row[2:7], row[7], row[8], row[9], row[10])
+                    for row in rows]
 
 
         def update_or_insert_company(company_id, company_name, street, city, state, zip_code):
@@ -176,13 +430,18 @@ class ContactBook:
                         )
                 conn.commit()
 
+            self.company_directory.upsert(company_id, company_name, street, city, state, zip_code)
+
 
         def get_next_company_id():
-            """Return the next available company_id for a new company."""
+            """Return the next available company_id, skipping IDs queued in the batch."""
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT COALESCE(MAX(company_id), 0) + 1 FROM company;")
-                    return cur.fetchone()[0]
+                    next_company_id = cur.fetchone()[0]
+
+            queued_company_ids = pending_batch["companies"].keys()
+            return max([next_company_id, *(company_id + 1 for company_id in queued_company_ids)])
 
 
         def get_selected_contact():
@@ -192,7 +451,7 @@ class ContactBook:
                 return None, None
 
             item_index = int(selected_item[0])
-            contacts = self.filtered_contacts if self.filtered_contacts else fetch_contacts_from_postgresql()
+            contacts = self.filtered_contacts if self.filtered_contacts else self.contacts
             if item_index >= len(contacts):
                 return None, None
 
@@ -280,6 +539,14 @@ class ContactBook:
             company_id = int(company_id_value) if company_id_value else get_next_company_id()
             street, city, state, zip_code = address_parts
 
+            if batch_mode_var.get():
+                pending_batch["companies"][company_id] = (company_name, street, city, state, zip_code)
+                pending_batch["new_clients"].append(
+                    (company_id, first_name, last_name, phone, email if email else None)
+                )
+                queue_batch_change(f"Contact queued for batch commit. Company ID: {company_id}")
+                return
+
             try:
                 update_or_insert_company(company_id, company_name, street, city, state, zip_code)
 
@@ -341,6 +608,14 @@ class ContactBook:
             company_id = int(company_id_value)
             street, city, state, zip_code = address_parts
 
+            if batch_mode_var.get():
+                pending_batch["companies"][company_id] = (company_name, street, city, state, zip_code)
+                pending_batch["updated_clients"][selected_contact["client_id"]] = (
+                    company_id, first_name, last_name, phone, email if email else None
+                )
+                queue_batch_change("Contact update queued for batch commit.")
+                return
+
             try:
                 update_or_insert_company(company_id, company_name, street, city, state, zip_code)
 
@@ -387,6 +662,14 @@ class ContactBook:
                 show_toast("No contact selected!", "warning")
                 return
 
+            if batch_mode_var.get():
+                client_id = selected_contact["client_id"]
+                pending_batch["updated_clients"].pop(client_id, None)
+                if client_id not in pending_batch["deleted_client_ids"]:
+                    pending_batch["deleted_client_ids"].append(client_id)
+                queue_batch_change("Contact removal queued for batch commit.")
+                return
+
             try:
                 with get_db_connection() as conn:
                     with conn.cursor() as cur:
@@ -432,12 +715,33 @@ class ContactBook:
             update_contact_list(self.filtered_contacts)
 
 
+        def keyword_search(event=None):
+            """
+            Run a ranked full-text search across company, client, email, and phone.
+            """
+            search_text = entry_keyword.get().strip()
+            if not search_text:
+                show_toast("Enter a keyword to search contacts.", "warning")
+                return
+
+            try:
+                self.filtered_contacts = fetch_contacts_from_postgresql(search_text=search_text)
+            except Exception:
+                logger.exception("Failed to run keyword contact search")
+                show_toast("Unable to search contacts right now. Please try again.", "error")
+                return
+
+            if not self.filtered_contacts:
+                show_toast("No contacts matched that search.", "warning")
+            update_contact_list(self.filtered_contacts)
+
+
         def clear_results():
             """
             Clear the search results and display the complete list of contacts.
 
-            This function clears the search results and displays the complete list 
-            of contacts in the contact list.
+            This function clears the search results, reloads the company directory,
+            and displays the complete list of contacts in the contact list.
 
             Parameters:
             None
@@ -446,8 +750,11 @@ class ContactBook:
             None
             """
             self.filtered_contacts = []
+            self.company_directory.invalidate()
             update_contact_list()
+            update_company_list()
             clear_fields()
+            entry_keyword.delete(0, tk.END)
 
 
         # Handle double-click event on contact list
@@ -490,7 +797,11 @@ class ContactBook:
             Returns:
             None
             """
-            contacts = fetch_contacts_from_postgresql() if filtered_contacts is None else filtered_contacts
+            if filtered_contacts is None:
+                self.contacts = fetch_contacts_from_postgresql()
+                contacts = self.contacts
+            else:
+                contacts = filtered_contacts
             contact_list.delete(*contact_list.get_children())
             for index, contact in enumerate(contacts):
                 contact_list.insert(
@@ -510,7 +821,7 @@ class ContactBook:
             Update the company list in the company combobox.
 
             This function updates the company list in the company combobox with 
-            the unique company names from the contacts list.
+            the unique company names from the cached company directory.
 
             Parameters:
             None
@@ -518,19 +829,7 @@ class ContactBook:
             Returns:
             None
             """
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        SELECT company_name
-                        FROM company
-                        WHERE company_name IS NOT NULL AND company_name <> ''
-                        ORDER BY company_name;
-                        """
-                    )
-                    rows = cur.fetchall()
-
-            combo_company["values"] = [row[0] for row in rows]
+            combo_company["values"] = self.company_directory.names()
 
 
         def select_contact():
@@ -564,6 +863,121 @@ class ContactBook:
                 # messagebox.showwarning("Selection Error", "No contact selected!")
                 show_toast("No contact selected!", "warning")
 
+        def pending_change_count():
+            """Return the number of queued client changes in the batch."""
+            return len(pending_batch["new_clients"]) + len(pending_batch["updated_clients"]) \
+                + len(pending_batch["deleted_client_ids"])
+
+
+        def reset_pending_batch():
+            """Empty the batch queue and refresh the pending changes label."""
+            pending_batch["companies"].clear()
+            pending_batch["new_clients"].clear()
+            pending_batch["updated_clients"].clear()
+            pending_batch["deleted_client_ids"].clear()
+            pending_label.config(text="Pending changes: 0")
+
+
+        def queue_batch_change(message):
+            """Confirm a queued batch change and refresh the pending changes label."""
+            show_toast(message, "info")
+            clear_fields()
+            pending_label.config(text=f"Pending changes: {pending_change_count()}")
+
+
+        def apply_batch_result(result):
+            """
+            Update the loaded contact list from the rows returned by the batch.
+
+            Contacts are rebuilt from the RETURNING rows and the queued company 
+            values, so the list does not need to be fetched again.
+            """
+            companies = pending_batch["companies"]
+            deleted_ids = set(result["deleted"])
+            updated_rows = {row[0]: row for row in result["updated"]}
+
+            contacts = []
+            for contact in self.contacts:
+                client_id = contact["client_id"]
+                if client_id in deleted_ids:
+                    continue
+                if client_id in updated_rows:
+                    row = updated_rows[client_id]
+                    contact = build_contact(row[0], row[1], companies[row[1]], *row[2:])
+                elif contact["company_id"] in companies:
+                    contact = build_contact(
+                        client_id,
+                        contact["company_id"],
+                        companies[contact["company_id"]],
+                        contact["first_name"],
+                        contact["last_name"],
+                        contact["phone"],
+                        contact["email"],
+                    )
+                contacts.append(contact)
+
+            for row in result["inserted"]:
+                contacts.append(build_contact(row[0], row[1], companies[row[1]], *row[2:]))
+
+            contacts.sort(key=lambda contact: (contact["company"], contact["last_name"],
+                                               contact["first_name"]))
+            self.contacts = contacts
+
+
+        def commit_batch():
+            """
+            Commit all queued contact changes in one transaction.
+            """
+            if not pending_change_count():
+                show_toast("No batched changes to commit.", "warning")
+                return
+
+            try:
+                result = apply_contact_batch(
+                    pending_batch["companies"],
+                    pending_batch["new_clients"],
+                    pending_batch["updated_clients"],
+                    pending_batch["deleted_client_ids"],
+                )
+            except Exception:
+                logger.exception("Failed to commit contact batch")
+                show_toast("Unable to commit batched changes. No changes were saved.", "error")
+                return
+
+            apply_batch_result(result)
+            for company_id, company_values in pending_batch["companies"].items():
+                self.company_directory.upsert(company_id, *company_values)
+            reset_pending_batch()
+            show_toast(
+                f"Batch committed: {len(result['inserted'])} added, "
+                f"{len(result['updated'])} updated, {len(result['deleted'])} removed.",
+                "info",
+            )
+            self.filtered_contacts = []
+            update_contact_list(self.contacts)
+            update_company_list()
+
+
+        def discard_batch():
+            """
+            Discard all queued contact changes without saving them.
+            """
+            if not pending_change_count():
+                show_toast("No batched changes to discard.", "warning")
+                return
+
+            reset_pending_batch()
+            show_toast("Batched changes discarded.", "warning")
+
+
+        def on_batch_mode_toggled():
+            """
+            Keep batch mode on while there are queued changes left to commit.
+            """
+            if not batch_mode_var.get() and pending_change_count():
+                batch_mode_var.set(True)
+                show_toast("Commit or discard the pending changes first.", "warning")
+
         # =========================================================================== #
         # ============================ Contact Book GUI ============================= #
         # =========================================================================== #
@@ -616,6 +1030,26 @@ class ContactBook:
         Button(contact_book_window, width=15, text="Clear Results", 
                 command=clear_results).grid(row=5, column=2, pady=5, sticky="w")
 
+        # Batch edit mode queues changes until Commit Batch is pressed
+        batch_mode_var = tk.BooleanVar(master=contact_book_window, value=False)
+        tk.Checkbutton(contact_book_window, text="Batch Edit Mode", variable=batch_mode_var,
+                       command=on_batch_mode_toggled).grid(row=6, column=0, padx=10, pady=5, sticky="e")
+        pending_label = Label(contact_book_window, text="Pending changes: 0")
+        pending_label.grid(row=6, column=1, padx=10, pady=5, sticky="w")
+        batch_buttons = tk.Frame(contact_book_window)
+        batch_buttons.grid(row=6, column=2, pady=5, sticky="w")
+        Button(batch_buttons, width=15, text="Commit Batch", 
+                command=commit_batch).pack(side="left")
+        Button(batch_buttons, width=15, text="Discard Batch", 
+                command=discard_batch).pack(side="left", padx=(5, 0))
+
+        # Ranked full-text search (press Enter to search)
+        Label(contact_book_window, text="Keyword Search:").grid(row=8, column=0,
+                                                                padx=10, pady=5, sticky="e")
+        entry_keyword = Entry(contact_book_window, width=40)
+        entry_keyword.grid(row=8, column=1, padx=10, pady=5)
+        entry_keyword.bind("<Return>", keyword_search)
+
 
         # Create contact list display
         contact_list = ttk.Treeview(contact_book_window, 
@@ -642,26 +1076,13 @@ class ContactBook:
             if not selected_company:
                 return
 
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        SELECT company_id, street, city, state, zip
-                        FROM company
-                        WHERE company_name = %s
-                        ORDER BY company_id
-                        LIMIT 1;
-                        """,
-                        (selected_company,),
-                    )
-                    row = cur.fetchone()
-
-            if row:
+            company = self.company_directory.get_by_name(selected_company)
+            if company:
                 entry_company_id.delete(0, tk.END)
-                entry_company_id.insert(0, str(row[0]))
+                entry_company_id.insert(0, str(company[0]))
 
                 entry_billing_address.delete(0, tk.END)
-                entry_billing_address.insert(0, format_billing_address(row[1], row[2], row[3], row[4]))
+                entry_billing_address.insert(0, format_billing_address(*company[2:]))
 
         # After creating combo_company:
         combo_company.bind("<<ComboboxSelected>>", on_company_selected)
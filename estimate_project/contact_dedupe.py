@@ -0,0 +1,319 @@
+import argparse
+import logging
+import re
+
+import numpy as np
+import pandas as pd
+from psycopg2.extras import execute_values
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from postgresql import get_db_connection
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Finds near-duplicate companies in the contact book (same GC entered under
+# slightly different names or emails) and optionally merges them.
+#
+# Companies are grouped into blocks that share a normalized email domain,
+# phone number, or company name prefix, and names are only compared inside
+# a block. Each block is scored in one sparse matrix product over character
+# n-gram TF-IDF vectors instead of pair-by-pair string comparisons.
+#
+# Usage (from the repository root):
+#   python estimate_project/contact_dedupe.py
+#   python estimate_project/contact_dedupe.py --output candidates.csv
+#   python estimate_project/contact_dedupe.py --merge
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+NAME_PREFIX_LENGTH = 4
+MIN_PHONE_DIGITS = 7
+MAX_BLOCK_SIZE = 500
+
+# Minimum name similarity for a merge candidate. Companies that also share
+# an email domain or phone number need less name evidence.
+NAME_THRESHOLD = 0.85
+SHARED_CONTACT_THRESHOLD = 0.5
+
+FREE_EMAIL_DOMAINS = {
+    "gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "aol.com",
+    "icloud.com", "live.com", "msn.com", "comcast.net", "att.net",
+}
+COMPANY_SUFFIXES = {
+    "inc", "llc", "ltd", "co", "corp", "corporation", "company", "the",
+    "incorporated", "group", "pllc", "lp", "llp",
+}
+
+# =========================================================================== #
+# ============================= Key Normalizing ============================= #
+# =========================================================================== #
+
+def normalize_company_name(company_name):
+    """Lowercase a company name and drop punctuation and legal suffixes."""
+    if not isinstance(company_name, str):
+        return ""
+    words = re.findall(r"[a-z0-9]+", company_name.lower())
+    words = [word for word in words if word not in COMPANY_SUFFIXES]
+    return " ".join(words)
+
+
+def email_domain(email):
+    """Return the business email domain, or None for free/blank addresses."""
+    if not isinstance(email, str) or "@" not in email:
+        return None
+    domain = email.strip().lower().rsplit("@", 1)[1]
+    if domain.startswith("www."):
+        domain = domain[4:]
+    if not domain or domain in FREE_EMAIL_DOMAINS:
+        return None
+    return domain
+
+
+def phone_digits(phone):
+    """Return the last ten digits of a phone number, or None if too short."""
+    if not isinstance(phone, str):
+        return None
+    digits = re.sub(r"\D", "", phone)
+    if len(digits) < MIN_PHONE_DIGITS:
+        return None
+    return digits[-10:]
+
+# =========================================================================== #
+# ======================== Get Data from PostgreSQL ========================= #
+# =========================================================================== #
+
+def fetch_company_contacts():
+    """Fetch every company with the email and phone of each of its clients."""
+    query = """
+        SELECT
+            co.company_id,
+            co.company_name,
+            c.email,
+            c.phone
+        FROM company co
+        LEFT JOIN client c ON c.company_id = co.company_id
+        ORDER BY co.company_id;
+    """
+
+    with get_db_connection() as conn:
+        return pd.read_sql_query(query, conn)
+
+# =========================================================================== #
+# ============================= Duplicate Search ============================ #
+# =========================================================================== #
+
+def build_blocking_keys(company_contacts):
+    """
+    Build blocking keys for every company.
+
+    Parameters:
+    company_contacts (DataFrame): company_id, company_name, email, phone rows.
+
+    Returns:
+    DataFrame: Unique (company_id, block_key) rows. Keys look like
+    'domain:example.com', 'phone:6155551234', or 'name:exam'.
+    """
+    companies = company_contacts.drop_duplicates("company_id")
+    name_prefixes = companies["company_name"].map(
+        lambda name: normalize_company_name(name).replace(" ", "")[:NAME_PREFIX_LENGTH] or None
+    )
+
+    key_frames = []
+    for prefix, company_ids, key_values in [
+        ("name:", companies["company_id"], name_prefixes),
+        ("domain:", company_contacts["company_id"], company_contacts["email"].map(email_domain)),
+        ("phone:", company_contacts["company_id"], company_contacts["phone"].map(phone_digits)),
+    ]:
+        has_key = key_values.notna()
+        key_frames.append(pd.DataFrame({
+            "company_id": company_ids[has_key],
+            "block_key": prefix + key_values[has_key].astype(str),
+        }))
+
+    return pd.concat(key_frames, ignore_index=True).drop_duplicates()
+
+
+def find_duplicate_companies(company_contacts, name_threshold=NAME_THRESHOLD,
+                             shared_contact_threshold=SHARED_CONTACT_THRESHOLD):
+    """
+    Find likely duplicate companies.
+
+    Company names are turned into character n-gram TF-IDF vectors once, and
+    each block is scored with one sparse matrix product, so only companies
+    that share a blocking key are ever compared.
+
+    Parameters:
+    company_contacts (DataFrame): Output of fetch_company_contacts().
+    name_threshold (float): Name similarity required for name-prefix blocks.
+    shared_contact_threshold (float): Name similarity required when the
+    companies also share an email domain or phone number.
+
+    Returns:
+    DataFrame: One row per candidate pair with keep_company_id (the lower
+    id), merge_company_id, both names, similarity, and the matching keys.
+    """
+    columns = ["keep_company_id", "keep_company_name", "merge_company_id",
+               "merge_company_name", "similarity", "matched_on"]
+
+    companies = company_contacts.drop_duplicates("company_id").reset_index(drop=True)
+    if len(companies) < 2:
+        return pd.DataFrame(columns=columns)
+
+    normalized_names = companies["company_name"].map(normalize_company_name)
+    vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 3))
+    name_vectors = vectorizer.fit_transform(normalized_names.replace("", "?"))
+
+    row_by_company = pd.Series(companies.index, index=companies["company_id"])
+    blocking_keys = build_blocking_keys(company_contacts)
+    blocking_keys["row"] = blocking_keys["company_id"].map(row_by_company)
+
+    pairs = {}
+    for block_key, block in blocking_keys.groupby("block_key"):
+        rows = np.sort(block["row"].to_numpy())
+        if len(rows) < 2:
+            continue
+        if len(rows) > MAX_BLOCK_SIZE:
+            logger.warning("Skipping oversized block %s (%d companies)", block_key, len(rows))
+            continue
+
+        block_vectors = name_vectors[rows]
+        similarity = (block_vectors @ block_vectors.T).toarray()
+        threshold = name_threshold if block_key.startswith("name:") else shared_contact_threshold
+
+        left, right = np.triu_indices(len(rows), k=1)
+        matches = similarity[left, right] >= threshold
+        for i, j, score in zip(rows[left[matches]], rows[right[matches]],
+                               similarity[left, right][matches]):
+            pair = pairs.setdefault((i, j), {"similarity": 0.0, "matched_on": set()})
+            pair["similarity"] = max(pair["similarity"], float(score))
+            pair["matched_on"].add(block_key.split(":", 1)[0])
+
+    records = []
+    for (i, j), pair in pairs.items():
+        first, second = companies.loc[i], companies.loc[j]
+        keep, merge = (first, second) if first["company_id"] < second["company_id"] else (second, first)
+        records.append({
+            "keep_company_id": int(keep["company_id"]),
+            "keep_company_name": keep["company_name"],
+            "merge_company_id": int(merge["company_id"]),
+            "merge_company_name": merge["company_name"],
+            "similarity": round(pair["similarity"], 3),
+            "matched_on": ", ".join(sorted(pair["matched_on"])),
+        })
+
+    candidates = pd.DataFrame(records, columns=columns)
+    return candidates.sort_values(["similarity", "keep_company_id"], ascending=[False, True]) \
+        .reset_index(drop=True)
+
+# =========================================================================== #
+# ================================= Merging ================================= #
+# =========================================================================== #
+
+def resolve_merge_targets(candidates):
+    """
+    Map every company being merged to the company it should end up in.
+
+    Chains such as A~B and B~C resolve to the lowest company_id in the
+    group, so no client is pointed at a company that is itself deleted.
+
+    Returns:
+    dict: merge_company_id -> keep_company_id
+    """
+    parent = {}
+
+    def find(company_id):
+        parent.setdefault(company_id, company_id)
+        while parent[company_id] != company_id:
+            parent[company_id] = parent[parent[company_id]]
+            company_id = parent[company_id]
+        return company_id
+
+    for keep_id, merge_id in zip(candidates["keep_company_id"], candidates["merge_company_id"]):
+        keep_root, merge_root = find(int(keep_id)), find(int(merge_id))
+        if keep_root != merge_root:
+            parent[max(keep_root, merge_root)] = min(keep_root, merge_root)
+
+    return {company_id: find(company_id) for company_id in list(parent)
+            if find(company_id) != company_id}
+
+
+def merge_duplicate_companies(candidates):
+    """
+    Merge candidate companies in one transaction.
+
+    Clients of each merged company are repointed to the kept company with
+    client.company_id, then the merged company rows are deleted.
+
+    Returns:
+    tuple: (clients repointed, companies deleted)
+    """
+    merge_targets = resolve_merge_targets(candidates)
+    if not merge_targets:
+        return 0, 0
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            # execute_values() sends the VALUES in pages, so cur.rowcount
+            # would only count the last page
+            clients_repointed = len(execute_values(
+                cur,
+                """
+                UPDATE client AS c
+                SET company_id = v.keep_company_id
+                FROM (VALUES %s) AS v(merge_company_id, keep_company_id)
+                WHERE c.company_id = v.merge_company_id
+                RETURNING c.client_id;
+                """,
+                list(merge_targets.items()),
+                template="(%s::integer, %s::integer)",
+                fetch=True,
+            ))
+            cur.execute(
+                "DELETE FROM company WHERE company_id = ANY(%s);",
+                (list(merge_targets),),
+            )
+            companies_deleted = cur.rowcount
+        conn.commit()
+
+    return clients_repointed, companies_deleted
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Find and merge duplicate contact book companies.")
+    parser.add_argument("--name-threshold", type=float, default=NAME_THRESHOLD,
+                        help="Name similarity required for companies matched by name prefix.")
+    parser.add_argument("--shared-contact-threshold", type=float, default=SHARED_CONTACT_THRESHOLD,
+                        help="Name similarity required when email domain or phone also match.")
+    parser.add_argument("--output", help="Write merge candidates to this CSV file.")
+    parser.add_argument("--merge", action="store_true",
+                        help="Merge every candidate pair into the lower company_id.")
+    args = parser.parse_args()
+
+    candidates = find_duplicate_companies(fetch_company_contacts(), args.name_threshold,
+                                          args.shared_contact_threshold)
+
+    print("\n")
+    print("Merge Candidates".center(30, "-"))
+    if candidates.empty:
+        print("No duplicate companies found.")
+    else:
+        print(candidates.to_string(index=False))
+
+    if args.output:
+        candidates.to_csv(args.output, index=False)
+        print(f"\nCandidates saved to {args.output}")
+
+    if args.merge and not candidates.empty:
+        clients_repointed, companies_deleted = merge_duplicate_companies(candidates)
+        print(f"\nRepointed {clients_repointed} clients and removed {companies_deleted} companies.")
@@ -0,0 +1,237 @@
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from building_demo import BuildingDemo
+from postgresql import get_db_connection
+from scenario_evaluator import evaluate_scenarios
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Proposes the cheapest (num_days, num_guys) plan that finishes a project by
+# a deadline with no more than a maximum crew.
+#
+# Productivity is square feet per man-day from the project table, the
+# median per description and structure type. The table has no days or crew
+# columns, so each project's man-days are estimated from its job cost: the
+# LABOR_SHARE_OF_JOB_COST share of it, divided by one man-day at the current
+# labor rate. Descriptions or structure types with fewer than
+# MIN_PRODUCTIVITY_PROJECTS projects fall back to the description, then to
+# every project.
+#
+# For each day count up to the deadline only the smallest crew that covers
+# the required man-days can be the cheapest, so the search prices one crew
+# per day (instead of every crew size) in a single vectorized call to
+# scenario_evaluator.evaluate_scenarios().
+#
+# Usage (from the estimate_project directory):
+#   python crew_optimizer.py "Building Demo" 25000 --structure-type Wood --deadline 30 --max-crew 12
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+LABOR_SHARE_OF_JOB_COST = 0.6
+MIN_PRODUCTIVITY_PROJECTS = 3
+
+# =========================================================================== #
+# ========================= Historical Productivity ========================= #
+# =========================================================================== #
+
+def fetch_project_productivity_data():
+    """Fetch the description, structure type, sqft, and job cost of every project."""
+    query = """
+        SELECT
+            project_description AS "Description",
+            structure_type AS "Structure Type",
+            sqft AS "SqFt",
+            job_cost AS "Job Cost"
+        FROM project
+        WHERE sqft > 0 AND job_cost > 0;
+    """
+
+    with get_db_connection() as conn:
+        return pd.read_sql_query(query, conn)
+
+
+def compute_productivity(projects, cost_per_man_hour=None,
+                         num_hours=BuildingDemo.DAILY_WORK_HOURS,
+                         labor_share=LABOR_SHARE_OF_JOB_COST):
+    """
+    Estimate square feet per man-day for each description and structure type.
+
+    Parameters:
+    projects (DataFrame): 'Description', 'Structure Type', 'SqFt', and
+    'Job Cost' columns, as returned by fetch_project_productivity_data().
+    cost_per_man_hour (float, optional): Defaults to the shared labor rate.
+    num_hours (float): Work hours per day.
+    labor_share (float): Share of the job cost paid as labor.
+
+    Returns:
+    DataFrame: 'Description', 'Structure Type', 'Project Count', and
+    'SqFt Per Man-Day' (median) for every combination.
+    """
+    if cost_per_man_hour is None:
+        cost_per_man_hour = BuildingDemo.labor_rate_provider.get_rate()
+
+    sqft = pd.to_numeric(projects['SqFt'], errors='coerce')
+    job_cost = pd.to_numeric(projects['Job Cost'], errors='coerce')
+    man_days = job_cost * labor_share / (cost_per_man_hour * num_hours)
+
+    productivity = pd.DataFrame({
+        'Description': projects['Description'],
+        'Structure Type': projects['Structure Type'],
+        'SqFt Per Man-Day': sqft / man_days,
+    })
+    productivity = productivity[(sqft > 0) & (job_cost > 0)].dropna()
+
+    return (productivity.groupby(['Description', 'Structure Type'])['SqFt Per Man-Day']
+            .agg(['count', 'median'])
+            .rename(columns={'count': 'Project Count', 'median': 'SqFt Per Man-Day'})
+            .reset_index())
+
+
+def lookup_productivity(productivity, description, structure_type=None,
+                        min_projects=MIN_PRODUCTIVITY_PROJECTS):
+    """
+    Return square feet per man-day for a project, falling back to broader groups.
+
+    The description and structure type are used when they have at least
+    min_projects projects, then the description alone, then every project.
+    Fallbacks weight each group's median by its project count.
+
+    Returns:
+    tuple: (square feet per man-day, the group it came from).
+    """
+    if productivity.empty:
+        raise ValueError("No historical projects with square footage and job cost.")
+
+    exact = productivity[(productivity['Description'] == description)
+                         & (productivity['Structure Type'] == structure_type)]
+    if exact['Project Count'].sum() >= min_projects:
+        return float(exact['SqFt Per Man-Day'].iloc[0]), f"{description} / {structure_type}"
+
+    groups = productivity[productivity['Description'] == description]
+    source = description
+    if groups['Project Count'].sum() < min_projects:
+        groups = productivity
+        source = "All Projects"
+
+    weighted = np.average(groups['SqFt Per Man-Day'], weights=groups['Project Count'])
+    return float(weighted), source
+
+# =========================================================================== #
+# ================================ Optimizer ================================ #
+# =========================================================================== #
+
+def optimize_crew_plan(total_sqft, deadline_days, max_crew, sqft_per_man_day,
+                       equipment_cost=0, disposal_cost=0, equipment_day_rate=0,
+                       cost_per_man_hour=None, min_crew=1):
+    """
+    Find the cheapest crew and duration that finishes by the deadline.
+
+    Parameters:
+    total_sqft (float): Square footage of the project.
+    deadline_days (int): Most days the project may take.
+    max_crew (int): Most workers available.
+    sqft_per_man_day (float): Square feet one worker demolishes per day.
+    equipment_cost (float): Fixed equipment budget in dollars.
+    disposal_cost (float): Disposal budget in dollars.
+    equipment_day_rate (float): Equipment cost per day on site, added to
+    equipment_cost for each day of the plan.
+    cost_per_man_hour (float, optional): Defaults to the shared labor rate.
+    min_crew (int): Fewest workers to send.
+
+    Returns:
+    dict: num_days, num_guys, man_days, required_man_days,
+    equipment_cost, and the evaluate_scenarios() costs of the plan
+    (job_cost, overhead_cost, total_cost, bid_price, cost_per_sqft,
+    profit_margin, man_hours_cost) as floats.
+
+    Raises:
+    ValueError: If no crew of at most max_crew finishes by the deadline.
+    """
+    if total_sqft <= 0 or sqft_per_man_day <= 0:
+        raise ValueError("Square footage and productivity must be greater than zero.")
+    if deadline_days < 1 or max_crew < min_crew:
+        raise ValueError("The deadline must be at least one day and max crew at least min crew.")
+
+    required_man_days = int(np.ceil(total_sqft / sqft_per_man_day))
+
+    # The smallest crew that covers the required man-days on each day count;
+    # larger crews on the same day count only add labor cost
+    days = np.arange(1, deadline_days + 1)
+    crews = np.maximum(-(-required_man_days // days), min_crew)
+    fits = crews <= max_crew
+    if not fits.any():
+        raise ValueError(
+            f"{required_man_days:,} man-days cannot be done in {deadline_days} days "
+            f"with at most {max_crew} workers."
+        )
+    days, crews = days[fits], crews[fits]
+
+    plan_equipment_cost = equipment_cost + equipment_day_rate * days
+    results = evaluate_scenarios(total_sqft, days, crews, plan_equipment_cost, disposal_cost,
+                                 cost_per_man_hour)
+
+    # Ties go to the shortest plan
+    best = int(np.argmin(results["job_cost"]))
+    plan = {
+        "num_days": int(days[best]),
+        "num_guys": int(crews[best]),
+        "man_days": int(days[best] * crews[best]),
+        "required_man_days": required_man_days,
+        "equipment_cost": float(plan_equipment_cost[best]),
+    }
+    plan.update({name: float(values[best]) for name, values in results.items()})
+    return plan
+
+
+def format_crew_plan(plan, sqft_per_man_day, productivity_source):
+    """Return a crew plan as report text."""
+    return (
+        f"Productivity: {sqft_per_man_day:,.1f} sqft per man-day ({productivity_source})\n"
+        f"Required Man-Days: {plan['required_man_days']:,}\n"
+        f"Number of Days: {plan['num_days']}\n"
+        f"Number of Workers: {plan['num_guys']}\n"
+        f"Equipment Cost: ${plan['equipment_cost']:,.2f}\n"
+        f"Total Job Cost: ${plan['job_cost']:,.2f}\n"
+        f"Bid Price: ${plan['bid_price']:,.2f}\n"
+        f"Price Per SqFt: ${plan['cost_per_sqft']:.2f}\n"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(
+        description="Propose the cheapest crew and duration that meets a deadline.")
+    parser.add_argument("description", help="Project description, e.g. 'Building Demo'.")
+    parser.add_argument("sqft", type=float, help="Total square footage.")
+    parser.add_argument("--structure-type", default="Other", help="Structure type.")
+    parser.add_argument("--deadline", type=int, required=True, help="Most days allowed.")
+    parser.add_argument("--max-crew", type=int, required=True, help="Most workers available.")
+    parser.add_argument("--equipment-cost", type=float, default=0, help="Fixed equipment budget.")
+    parser.add_argument("--equipment-day-rate", type=float, default=0,
+                        help="Equipment cost per day on site.")
+    parser.add_argument("--disposal-cost", type=float, default=0, help="Disposal budget.")
+    args = parser.parse_args()
+
+    productivity = compute_productivity(fetch_project_productivity_data())
+    sqft_per_man_day, source = lookup_productivity(productivity, args.description,
+                                                   args.structure_type)
+    plan = optimize_crew_plan(args.sqft, args.deadline, args.max_crew, sqft_per_man_day,
+                              args.equipment_cost, args.disposal_cost, args.equipment_day_rate)
+
+    print("\n")
+    print("Crew Plan".center(40, "-"))
+    print(format_crew_plan(plan, sqft_per_man_day, source))
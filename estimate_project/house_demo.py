@@ -11,18 +11,21 @@ class HouseDemo(BuildingDemo):
 
     Attributes:
         description (str): A brief description of the project.
+        structure_type (str): The type of structure being demolished.
         total_sqft (int): The total square footage of the building.
         total_equipment_cost (int): The estimated cost of equipment in dollars.
         total_disposal_cost (int): The estimated cost of disposal in dollars.
         num_days (int): The estimated number of days for the project.
         num_guys (int): The estimated number of workers.
         num_hours (int): The number of work hours per day (default is 10).
+        cost_per_man_hour (float): Loaded labor cost per man-hour from the 
+        shared labor rate provider.
         bid_price (float): The calculated bid price for the project (initialized to 0.0).
     """
 
-    def __init__(self, description, total_sqft: int = 0, 
+    def __init__(self, description, structure_type="Other", total_sqft: int = 0, 
                  total_equipment_cost: int = 0, total_disposal_cost: int = 0, 
                  num_days: int = 0, num_guys: int = 0):
-        super().__init__(description, total_sqft, total_equipment_cost, 
+        super().__init__(description, structure_type, total_sqft, total_equipment_cost, 
                          total_disposal_cost, num_days, num_guys)
 
@@ -0,0 +1,490 @@
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import time
+
+from contact_book import parse_billing_address, split_client_name
+from postgresql import get_db_connection
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Imports legacy contacts.json and equipment.json exports into the PostgreSQL
+# company, client, and equipment tables. Files are parsed incrementally and
+# bulk-loaded with COPY into temporary staging tables, then upserted.
+#
+# Usage (from the repository root):
+#   python estimate_project/json_import.py
+#   python estimate_project/json_import.py --contacts path/to/contacts.json
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+JSON_FILES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "json_files")
+READ_CHUNK_SIZE = 1 << 16
+COPY_BATCH_SIZE = 10_000
+JSON_WHITESPACE = " \t\r\n"
+ITEM_TERMINATORS = JSON_WHITESPACE + ",]"
+TRUNCATION_WINDOW = 16
+
+CONTACT_STAGING_COLUMNS = (
+    "company_name", "street", "city", "state", "zip",
+    "first_name", "last_name", "phone", "email",
+)
+EQUIPMENT_STAGING_COLUMNS = (
+    "project_type", "equipment_name", "day_rate", "week_rate", "month_rate",
+)
+
+# =========================================================================== #
+# ========================== Incremental JSON Parsing ======================= #
+# =========================================================================== #
+
+def is_truncated_json(error, buffer):
+    """
+    Return True if a JSONDecodeError may only mean the buffer ends too early.
+
+    Unterminated strings, and errors within the last TRUNCATION_WINDOW
+    characters (a number, literal, or escape such as '1500.', 'tru', or
+    '\\u00' cut by the chunk), can be completed by the next chunk. Any
+    other error means the item itself is invalid.
+    """
+    return error.msg.startswith("Unterminated string") \
+        or len(buffer) - error.pos <= TRUNCATION_WINDOW
+
+
+def iter_json_array(file_path, chunk_size=READ_CHUNK_SIZE):
+    """
+    Yield the items of a top-level JSON array one at a time.
+
+    Only a chunk of the file plus the item currently being decoded is held
+    in memory, so very large exports can be imported without loading the
+    whole document.
+
+    Parameters:
+    file_path (str): Path to a JSON file containing a single array.
+    chunk_size (int): Number of characters read from the file at a time.
+
+    Yields:
+    object: Each decoded array item (normally a dict).
+
+    Raises:
+    ValueError: If the file is not a JSON array, holds an invalid item or
+    separator, or is truncated.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+    started = False
+    # What may come next inside the array: "first" (an item or ']'),
+    # "item" (after a ','), or "separator" (',' or ']' after an item)
+    expected = "first"
+
+    with open(file_path, "r", encoding="utf-8") as json_file:
+        while True:
+            while position < len(buffer) and buffer[position] in JSON_WHITESPACE:
+                position += 1
+
+            if position < len(buffer):
+                char = buffer[position]
+
+                if not started:
+                    if char != "[":
+                        raise ValueError(f"{file_path} does not contain a JSON array.")
+                    started = True
+                    position += 1
+                    continue
+
+                if expected == "separator":
+                    if char == "]":
+                        return
+                    if char != ",":
+                        raise ValueError(f"{file_path} is missing a ',' between array items.")
+                    expected = "item"
+                    position += 1
+                    continue
+
+                if char == "]" and expected == "first":
+                    return
+                if char in ",]":
+                    raise ValueError(f"{file_path} has an empty or trailing array item.")
+
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    if eof or not is_truncated_json(e, buffer):
+                        raise ValueError(f"{file_path} has an invalid JSON item: {e}") from e
+                    item, end = None, None
+
+                # A number or literal ending at the buffer edge may be cut short
+                # ('1500.' of '1500.0'), so only yield once the next character
+                # shows where the item ends.
+                if end is not None and (eof or (end < len(buffer)
+                                                and buffer[end] in ITEM_TERMINATORS)):
+                    yield item
+                    position = end
+                    expected = "separator"
+                    continue
+
+                if eof:
+                    raise ValueError(f"{file_path} ends in the middle of a JSON item.")
+
+            if eof:
+                raise ValueError(f"{file_path} ends before the JSON array is closed.")
+
+            chunk = json_file.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+
+# =========================================================================== #
+# ============================= Record Normalizing ========================== #
+# =========================================================================== #
+
+def normalize_rate(value):
+    """Convert legacy rate strings such as '1450' or '$1,450.00' to floats."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    cleaned = str(value).strip().replace("$", "").replace(",", "")
+    if not cleaned or cleaned.upper() in {"N/A", "NULL"}:
+        return None
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def normalize_contact(record):
+    """Map a legacy contacts.json record to contact staging columns."""
+    company_name = (record.get("company") or "").strip()
+    billing_address = (record.get("billing address") or "").strip()
+    first_name, last_name = split_client_name(record.get("client") or "")
+
+    if not company_name or not first_name:
+        return None
+
+    address_parts = parse_billing_address(billing_address)
+    if address_parts:
+        street, city, state, zip_code = address_parts
+    else:
+        # Legacy files often hold the street only; keep it rather than drop it.
+        street, city, state, zip_code = billing_address or None, None, None, None
+
+    return (
+        company_name, street, city, state, zip_code, first_name, last_name,
+        (record.get("phone") or "").strip() or None,
+        (record.get("email") or "").strip() or None,
+    )
+
+
+def normalize_equipment(record):
+    """Map a legacy equipment.json record to equipment staging columns."""
+    equipment_name = (record.get("Equipment") or "").strip()
+    if not equipment_name:
+        return None
+
+    return (
+        (record.get("Project Type") or "").strip() or "N/A",
+        equipment_name,
+        normalize_rate(record.get("Day")),
+        normalize_rate(record.get("Week")),
+        normalize_rate(record.get("Month")),
+    )
+
+# =========================================================================== #
+# ================================ COPY Loading ============================= #
+# =========================================================================== #
+
+def copy_rows(cur, table_name, columns, rows):
+    """COPY a list of row tuples into a table using CSV format."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["\\N" if value is None else value for value in row])
+    buffer.seek(0)
+
+    cur.copy_expert(
+        f"COPY {table_name} ({', '.join(columns)}) FROM STDIN "
+        "WITH (FORMAT csv, NULL '\\N')",
+        buffer,
+    )
+
+
+def stage_records(cur, file_path, normalize, table_name, columns, batch_size=COPY_BATCH_SIZE):
+    """
+    Stream a JSON array into a staging table in COPY batches.
+
+    Returns:
+    tuple: (rows staged, records skipped)
+    """
+    staged = 0
+    skipped = 0
+    batch = []
+
+    for record in iter_json_array(file_path):
+        row = normalize(record) if isinstance(record, dict) else None
+        if row is None:
+            skipped += 1
+            continue
+
+        batch.append(row)
+        if len(batch) >= batch_size:
+            copy_rows(cur, table_name, columns, batch)
+            staged += len(batch)
+            batch = []
+
+    if batch:
+        copy_rows(cur, table_name, columns, batch)
+        staged += len(batch)
+
+    return staged, skipped
+
+
+def import_contacts(file_path):
+    """
+    Import a legacy contacts.json file into the company and client tables.
+
+    Companies are matched by company_name and clients by company plus
+    first/last name. Matches are updated and everything else is inserted,
+    so the import can be re-run safely.
+
+    Returns:
+    dict: Import counts and timing.
+    """
+    start_time = time.perf_counter()
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                CREATE TEMP TABLE contact_import (
+                    import_order BIGSERIAL,
+                    company_name TEXT,
+                    street TEXT,
+                    city TEXT,
+                    state TEXT,
+                    zip TEXT,
+                    first_name TEXT,
+                    last_name TEXT,
+                    phone TEXT,
+                    email TEXT
+                ) ON COMMIT DROP;
+                """
+            )
+            staged, skipped = stage_records(
+                cur, file_path, normalize_contact, "contact_import", CONTACT_STAGING_COLUMNS
+            )
+
+            # Last record per company wins for the address.
+            cur.execute(
+                """
+                CREATE TEMP TABLE company_import ON COMMIT DROP AS
+                SELECT DISTINCT ON (company_name)
+                    company_name, street, city, state, zip
+                FROM contact_import
+                ORDER BY company_name, import_order DESC;
+                """
+            )
+            cur.execute(
+                """
+                UPDATE company AS co
+                SET street = COALESCE(ci.street, co.street),
+                    city = COALESCE(ci.city, co.city),
+                    state = COALESCE(ci.state, co.state),
+                    zip = COALESCE(ci.zip, co.zip)
+                FROM company_import ci
+                WHERE co.company_name = ci.company_name;
+                """
+            )
+            companies_updated = cur.rowcount
+            cur.execute(
+                """
+                INSERT INTO company (company_id, company_name, street, city, state, zip)
+                SELECT
+                    (SELECT COALESCE(MAX(company_id), 0) FROM company)
+                        + ROW_NUMBER() OVER (ORDER BY ci.company_name),
+                    ci.company_name, ci.street, ci.city, ci.state, ci.zip
+                FROM company_import ci
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM company co WHERE co.company_name = ci.company_name
+                );
+                """
+            )
+            companies_inserted = cur.rowcount
+
+            cur.execute(
+                """
+                CREATE TEMP TABLE client_import ON COMMIT DROP AS
+                SELECT DISTINCT ON (co.company_id, ci.first_name, ci.last_name)
+                    co.company_id, ci.first_name, ci.last_name, ci.phone, ci.email
+                FROM contact_import ci
+                JOIN LATERAL (
+                    SELECT company_id FROM company
+                    WHERE company_name = ci.company_name
+                    ORDER BY company_id
+                    LIMIT 1
+                ) co ON TRUE
+                ORDER BY co.company_id, ci.first_name, ci.last_name, ci.import_order DESC;
+                """
+            )
+            cur.execute(
+                """
+                UPDATE client AS c
+                SET phone = COALESCE(ci.phone, c.phone),
+                    email = COALESCE(ci.email, c.email)
+                FROM client_import ci
+                WHERE c.company_id = ci.company_id
+                  AND c.first_name = ci.first_name
+                  AND c.last_name IS NOT DISTINCT FROM ci.last_name;
+                """
+            )
+            clients_updated = cur.rowcount
+            cur.execute(
+                """
+                INSERT INTO client (company_id, first_name, last_name, phone, email)
+                SELECT ci.company_id, ci.first_name, ci.last_name, ci.phone, ci.email
+                FROM client_import ci
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM client c
+                    WHERE c.company_id = ci.company_id
+                      AND c.first_name = ci.first_name
+                      AND c.last_name IS NOT DISTINCT FROM ci.last_name
+                );
+                """
+            )
+            clients_inserted = cur.rowcount
+        conn.commit()
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        "rows": staged,
+        "skipped": skipped,
+        "companies_inserted": companies_inserted,
+        "companies_updated": companies_updated,
+        "clients_inserted": clients_inserted,
+        "clients_updated": clients_updated,
+        "seconds": elapsed,
+    }
+
+
+def import_equipment(file_path):
+    """
+    Import a legacy equipment.json rate sheet into the equipment table.
+
+    Equipment is matched by project_type and equipment_name. Matching rows
+    get their rates updated and everything else is inserted.
+
+    Returns:
+    dict: Import counts and timing.
+    """
+    start_time = time.perf_counter()
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                CREATE TEMP TABLE equipment_import (
+                    import_order BIGSERIAL,
+                    project_type TEXT,
+                    equipment_name TEXT,
+                    day_rate NUMERIC,
+                    week_rate NUMERIC,
+                    month_rate NUMERIC
+                ) ON COMMIT DROP;
+                """
+            )
+            staged, skipped = stage_records(
+                cur, file_path, normalize_equipment, "equipment_import", EQUIPMENT_STAGING_COLUMNS
+            )
+
+            cur.execute(
+                """
+                CREATE TEMP TABLE equipment_dedup ON COMMIT DROP AS
+                SELECT DISTINCT ON (project_type, equipment_name)
+                    project_type, equipment_name, day_rate, week_rate, month_rate
+                FROM equipment_import
+                ORDER BY project_type, equipment_name, import_order DESC;
+                """
+            )
+            cur.execute(
+                """
+                UPDATE equipment AS e
+                SET day_rate = ei.day_rate,
+                    week_rate = ei.week_rate,
+                    month_rate = ei.month_rate
+                FROM equipment_dedup ei
+                WHERE e.project_type IS NOT DISTINCT FROM ei.project_type
+                  AND e.equipment_name = ei.equipment_name;
+                """
+            )
+            equipment_updated = cur.rowcount
+            cur.execute(
+                """
+                INSERT INTO equipment (project_type, equipment_name, day_rate, week_rate, month_rate)
+                SELECT ei.project_type, ei.equipment_name, ei.day_rate, ei.week_rate, ei.month_rate
+                FROM equipment_dedup ei
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM equipment e
+                    WHERE e.project_type IS NOT DISTINCT FROM ei.project_type
+                      AND e.equipment_name = ei.equipment_name
+                );
+                """
+            )
+            equipment_inserted = cur.rowcount
+        conn.commit()
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        "rows": staged,
+        "skipped": skipped,
+        "equipment_inserted": equipment_inserted,
+        "equipment_updated": equipment_updated,
+        "seconds": elapsed,
+    }
+
+
+def print_import_summary(title, summary):
+    """Print import counts and throughput in rows per second."""
+    rows_per_second = summary["rows"] / summary["seconds"] if summary["seconds"] > 0 else 0.0
+    print("\n")
+    print(title.center(30, "-"))
+    for key, value in summary.items():
+        if key == "seconds":
+            print(f"{key} = {value:,.2f}")
+        else:
+            print(f"{key} = {value:,}")
+    print(f"rows per second = {rows_per_second:,.0f}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(
+        description="Import legacy contacts.json and equipment.json files into PostgreSQL."
+    )
+    parser.add_argument("--contacts", default=os.path.join(JSON_FILES_DIR, "contacts.json"),
+                        help="Path to a contacts.json export.")
+    parser.add_argument("--equipment", default=os.path.join(JSON_FILES_DIR, "equipment.json"),
+                        help="Path to an equipment.json export.")
+    parser.add_argument("--skip-contacts", action="store_true", help="Do not import contacts.")
+    parser.add_argument("--skip-equipment", action="store_true", help="Do not import equipment.")
+    args = parser.parse_args()
+
+    if not args.skip_contacts:
+        print_import_summary("Contacts", import_contacts(args.contacts))
+    if not args.skip_equipment:
+        print_import_summary("Equipment", import_equipment(args.equipment))
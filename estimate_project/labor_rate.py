@@ -0,0 +1,131 @@
+import logging
+import time
+
+from postgresql import get_db_connection
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================ INFO ==================================== #
+# ========================================================================== #
+# Loaded labor cost per man-hour for the demolition estimates, derived from
+# monthly_numbers the same way the financials Daily option derives its
+# hourly rate: average monthly payroll plus expenses, spread over
+# WORK_DAYS_IN_MONTH days, NUM_EMPLOYEES workers, and DAILY_WORK_HOURS hours.
+# The profit margin is not included here because BuildingDemo applies its
+# own PROFIT markup to the bid.
+#
+# The rate is read once and kept for a day, so estimates never wait on
+# PostgreSQL. When the table is empty or unreachable, the last known rate
+# (or FALLBACK_COST_PER_MAN_HOUR) is used and the read is retried after
+# RETRY_SECONDS.
+# ========================================================================== #
+# ================================ TODO ==================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# Keep the constants below in step with financials/financial_metrics.py.
+# ========================================================================== #
+
+WORK_DAYS_IN_MONTH = 20
+DAILY_WORK_HOURS = 10
+NUM_EMPLOYEES = 112
+LABOR_RATE_MONTHS = 12
+FALLBACK_COST_PER_MAN_HOUR = 30
+REFRESH_SECONDS = 24 * 60 * 60
+RETRY_SECONDS = 5 * 60
+
+
+def fetch_monthly_cost_averages(months=LABOR_RATE_MONTHS):
+    """
+    Average payroll and expenses over the latest months of monthly_numbers.
+
+    Returns:
+    tuple: (number of months averaged, average payroll, average expenses).
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT COUNT(*), AVG(payroll), AVG(expense)
+                FROM (
+                    SELECT payroll, expense
+                    FROM monthly_numbers
+                    ORDER BY year_month DESC
+                    LIMIT %(months)s
+                ) AS recent;
+                """,
+                {"months": months},
+            )
+            month_count, payroll_avg, expenses_avg = cur.fetchone()
+
+    return month_count, float(payroll_avg or 0.0), float(expenses_avg or 0.0)
+
+
+def compute_cost_per_man_hour(payroll_avg, expenses_avg, num_employees=NUM_EMPLOYEES):
+    """Return the loaded labor cost of one man-hour from average monthly costs."""
+    if num_employees <= 0:
+        raise ValueError("num_employees must be greater than zero.")
+
+    daily_operating_cost = (payroll_avg + expenses_avg) / WORK_DAYS_IN_MONTH
+    return round(daily_operating_cost / num_employees / DAILY_WORK_HOURS, 2)
+
+
+class LaborRateProvider:
+    """
+    Day-long cache of the loaded labor cost per man-hour.
+
+    Attributes:
+    - months (int): Number of latest monthly_numbers rows averaged.
+    - refresh_seconds (float): How long a rate read from PostgreSQL is kept.
+    - retry_seconds (float): How long to wait before retrying a failed read.
+    - fallback_rate (float): Rate used until a read succeeds.
+    - rate (float): The current rate.
+    - source (str): 'monthly_numbers' once a rate has been read, else 'default'.
+    """
+    def __init__(self, months=LABOR_RATE_MONTHS, refresh_seconds=REFRESH_SECONDS,
+                 retry_seconds=RETRY_SECONDS, fallback_rate=FALLBACK_COST_PER_MAN_HOUR):
+        self.months = months
+        self.refresh_seconds = refresh_seconds
+        self.retry_seconds = retry_seconds
+        self.fallback_rate = fallback_rate
+        self.rate = fallback_rate
+        self.source = "default"
+        self.next_refresh_at = 0.0
+
+    def refresh(self):
+        """Read the rate from PostgreSQL now, keeping the previous rate on failure."""
+        try:
+            month_count, payroll_avg, expenses_avg = fetch_monthly_cost_averages(self.months)
+        except Exception:
+            logger.exception("Unable to read labor costs; using $%.2f per man-hour", self.rate)
+            self.next_refresh_at = time.monotonic() + self.retry_seconds
+            return self.rate
+
+        if month_count == 0:
+            logger.warning("monthly_numbers is empty; using $%.2f per man-hour", self.rate)
+            self.next_refresh_at = time.monotonic() + self.retry_seconds
+            return self.rate
+
+        self.rate = compute_cost_per_man_hour(payroll_avg, expenses_avg)
+        self.source = "monthly_numbers"
+        self.next_refresh_at = time.monotonic() + self.refresh_seconds
+        logger.info("Labor rate is $%.2f per man-hour from the last %d months",
+                    self.rate, month_count)
+        return self.rate
+
+    def get_rate(self):
+        """Return the cached rate, refreshing it once it is a day old."""
+        if time.monotonic() >= self.next_refresh_at:
+            self.refresh()
+        return self.rate
+
+    def invalidate(self):
+        """Re-read the rate on the next get_rate(), e.g. after monthly_numbers changes."""
+        self.next_refresh_at = 0.0
+
+
+# Shared by every BuildingDemo, HouseDemo, and InteriorDemo
+labor_rate_provider = LaborRateProvider()
@@ -0,0 +1,141 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from building_demo import BuildingDemo
+
+
+# ========================================================================== #
+# ================================ INFO ==================================== #
+# ========================================================================== #
+# Prices many (num_days, num_guys, equipment, disposal) combinations at once
+# with numpy, using the same formulas and class constants as BuildingDemo's
+# CostBreakdown. Inputs may be scalars or arrays of any broadcastable shape,
+# so a full grid of days x workers x equipment tiers is priced in one pass
+# without building a BuildingDemo per combination.
+#
+# The feasible frontier is, for each equipment tier and number of days, the
+# largest crew whose bid stays within a target bid (the average bid of the
+# matching historical projects on the Estimating Details page).
+# ========================================================================== #
+
+DAYS_RANGE = np.arange(1, 121)
+CREW_RANGE = np.arange(1, 41)
+EQUIPMENT_TIER_FACTORS = (0.5, 1.0, 1.5)
+
+
+def evaluate_scenarios(total_sqft, num_days, num_guys, equipment_cost, disposal_cost,
+                       cost_per_man_hour=None, num_hours=BuildingDemo.DAILY_WORK_HOURS,
+                       overhead_percentage=BuildingDemo.OVERHEAD_PERCENTAGE,
+                       profit=BuildingDemo.PROFIT):
+    """
+    Price every combination of the inputs.
+
+    Parameters:
+    total_sqft (float or array): Square footage of the project.
+    num_days (int or array): Number of days.
+    num_guys (int or array): Number of workers.
+    equipment_cost (float or array): Equipment budget in dollars.
+    disposal_cost (float or array): Disposal budget in dollars.
+    cost_per_man_hour (float or array, optional): Defaults to the shared
+    labor rate.
+    num_hours (float or array): Work hours per day.
+    overhead_percentage (float or array): Overhead as a share of the job cost.
+    profit (float or array): Markup applied to the total cost.
+
+    Returns:
+    dict: Arrays of man_hours_cost, job_cost, overhead_cost, total_cost,
+    bid_price, cost_per_sqft, and profit_margin, broadcast to one shape.
+    """
+    if cost_per_man_hour is None:
+        cost_per_man_hour = BuildingDemo.labor_rate_provider.get_rate()
+
+    total_sqft = np.asarray(total_sqft, dtype=float)
+    man_hours_cost = np.asarray(num_days) * np.asarray(num_guys) * num_hours * cost_per_man_hour
+    job_cost = man_hours_cost + np.asarray(equipment_cost) + np.asarray(disposal_cost)
+    overhead_cost = job_cost * overhead_percentage
+    total_cost = job_cost + overhead_cost
+    bid_price = total_cost * profit
+
+    shape = bid_price.shape
+    total_sqft = np.broadcast_to(total_sqft, shape)
+    cost_per_sqft = np.divide(bid_price, total_sqft, out=np.zeros(shape), where=total_sqft != 0)
+    profit_margin = np.round(np.divide((bid_price - job_cost) * 100, bid_price,
+                                       out=np.zeros(shape), where=bid_price != 0), 2)
+
+    return {
+        "man_hours_cost": np.broadcast_to(man_hours_cost, shape),
+        "job_cost": np.broadcast_to(job_cost, shape),
+        "overhead_cost": np.broadcast_to(overhead_cost, shape),
+        "total_cost": total_cost,
+        "bid_price": bid_price,
+        "cost_per_sqft": cost_per_sqft,
+        "profit_margin": profit_margin,
+    }
+
+
+def equipment_tiers(equipment_cost, factors=EQUIPMENT_TIER_FACTORS):
+    """Return equipment budgets scaled by each factor, in increasing order."""
+    return np.sort(np.asarray(factors, dtype=float) * equipment_cost)
+
+
+def feasible_frontier(total_sqft, max_bid, equipment_costs, disposal_cost, days=DAYS_RANGE,
+                      crews=CREW_RANGE, cost_per_man_hour=None):
+    """
+    Price the days x crews x equipment grid and find the largest crew per day.
+
+    Parameters:
+    total_sqft (float): Square footage of the project.
+    max_bid (float): Highest acceptable bid price.
+    equipment_costs (array): Equipment budgets to compare.
+    disposal_cost (float): Disposal budget in dollars.
+    days (array): Numbers of days to price.
+    crews (array): Crew sizes to price.
+    cost_per_man_hour (float, optional): Defaults to the shared labor rate.
+
+    Returns:
+    dict: days, crews, equipment_costs, results (evaluate_scenarios() arrays
+    shaped (equipment, days, crews)), feasible (bool array of the same
+    shape), and max_crew (largest feasible crew per (equipment, day), 0
+    where no crew fits).
+    """
+    days = np.asarray(days)
+    crews = np.asarray(crews)
+    equipment_costs = np.asarray(equipment_costs, dtype=float)
+
+    results = evaluate_scenarios(total_sqft, days[None, :, None], crews[None, None, :],
+                                 equipment_costs[:, None, None], disposal_cost,
+                                 cost_per_man_hour)
+    feasible = results["bid_price"] <= max_bid
+    max_crew = np.where(feasible, crews[None, None, :], 0).max(axis=2)
+
+    return {
+        "days": days,
+        "crews": crews,
+        "equipment_costs": equipment_costs,
+        "results": results,
+        "feasible": feasible,
+        "max_crew": max_crew,
+    }
+
+
+def plot_feasible_frontier(frontier, max_bid, title):
+    """
+    Plot the largest crew within max_bid against the number of days.
+
+    Returns:
+    Figure: One step line per equipment budget.
+    """
+    fig, ax = plt.subplots()
+    for equipment_cost, max_crew in zip(frontier["equipment_costs"], frontier["max_crew"]):
+        ax.step(frontier["days"], max_crew, where="mid",
+                label=f"Equipment ${equipment_cost:,.0f}")
+
+    ax.set_title(title)
+    ax.set_xlabel("Number of Days")
+    ax.set_ylabel("Largest Crew Within Bid")
+    ax.set_ylim(0, frontier["crews"].max() + 1)
+    ax.text(.01, .97, f"Target bid: ${max_bid:,.2f}", ha='left', va='top', transform=ax.transAxes)
+    ax.legend(loc='upper right')
+    ax.grid(True)
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,130 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from building_demo import BuildingDemo
+from scenario_evaluator import evaluate_scenarios
+
+
+# ========================================================================== #
+# ================================ INFO ==================================== #
+# ========================================================================== #
+# Shows which estimate input moves the bid most. Each of SENSITIVITY_INPUTS
+# is moved SENSITIVITY_RANGE below and above its entered value in
+# SENSITIVITY_STEPS steps while the others stay put, and every perturbation
+# is priced in one scenario_evaluator.evaluate_scenarios() call.
+#
+# Markup is the part of PROFIT above 1 (35% for 1.35), so a 20% change
+# moves it between 28% and 42% instead of moving the whole multiplier.
+#
+# The tornado chart and text report are attached to the proposal from the
+# Estimating Details page.
+# ========================================================================== #
+
+SENSITIVITY_RANGE = 0.2
+SENSITIVITY_STEPS = 21
+SENSITIVITY_INPUTS = ("Labor Rate", "Days", "Crew", "Equipment", "Disposal", "Overhead %",
+                      "Markup")
+VALUE_FORMATS = {
+    "Labor Rate": "${:,.2f}",
+    "Days": "{:,.1f}",
+    "Crew": "{:,.1f}",
+    "Equipment": "${:,.2f}",
+    "Disposal": "${:,.2f}",
+    "Overhead %": "{:.1%}",
+    "Markup": "{:.1%}",
+}
+
+
+def run_sensitivity(total_sqft, num_days, num_guys, equipment_cost, disposal_cost,
+                    cost_per_man_hour=None, overhead_percentage=BuildingDemo.OVERHEAD_PERCENTAGE,
+                    profit=BuildingDemo.PROFIT, sensitivity_range=SENSITIVITY_RANGE,
+                    steps=SENSITIVITY_STEPS):
+    """
+    Price every input moved across +/- sensitivity_range in one batch.
+
+    Parameters:
+    total_sqft, num_days, num_guys, equipment_cost, disposal_cost: The
+    entered estimate inputs.
+    cost_per_man_hour (float, optional): Defaults to the shared labor rate.
+    overhead_percentage (float): Overhead as a share of the job cost.
+    profit (float): Bid multiplier; its markup is profit - 1.
+    sensitivity_range (float): Largest change as a share of each input.
+    steps (int): Values priced per input, from -range to +range.
+
+    Returns:
+    dict: base_bid, factors (steps,), bids (one row of steps per input in
+    SENSITIVITY_INPUTS order), and summary (DataFrame with one row per
+    input, largest Swing first).
+    """
+    if cost_per_man_hour is None:
+        cost_per_man_hour = BuildingDemo.labor_rate_provider.get_rate()
+
+    base_values = np.array([cost_per_man_hour, num_days, num_guys, equipment_cost,
+                            disposal_cost, overhead_percentage, profit - 1], dtype=float)
+    factors = np.linspace(1 - sensitivity_range, 1 + sensitivity_range, steps)
+
+    # values[k, i, s] is input k when input i is at factors[s]
+    moved = np.eye(len(base_values), dtype=bool)[:, :, None]
+    values = base_values[:, None, None] * np.where(moved, factors, 1.0)
+    labor_rate, days, crew, equipment, disposal, overhead, markup = values
+
+    bids = evaluate_scenarios(total_sqft, days, crew, equipment, disposal,
+                              cost_per_man_hour=labor_rate, overhead_percentage=overhead,
+                              profit=1 + markup)["bid_price"]
+    base_bid = evaluate_scenarios(total_sqft, num_days, num_guys, equipment_cost, disposal_cost,
+                                  cost_per_man_hour, overhead_percentage=overhead_percentage,
+                                  profit=profit)["bid_price"].item()
+
+    summary = pd.DataFrame({
+        "Input": SENSITIVITY_INPUTS,
+        "Base Value": base_values,
+        "Low Value": base_values * factors[0],
+        "High Value": base_values * factors[-1],
+        "Low Bid": bids[:, 0],
+        "High Bid": bids[:, -1],
+    })
+    summary["Swing"] = (summary["High Bid"] - summary["Low Bid"]).abs()
+    summary = summary.sort_values("Swing", ascending=False, kind="stable").reset_index(drop=True)
+
+    return {"base_bid": base_bid, "factors": factors, "bids": bids, "summary": summary}
+
+
+def plot_tornado(sensitivity, title="Bid Sensitivity"):
+    """
+    Plot each input's bid range around the base bid, largest swing on top.
+
+    Returns:
+    Figure: The tornado chart.
+    """
+    summary = sensitivity["summary"].iloc[::-1]
+    base_bid = sensitivity["base_bid"]
+    percent = f"{sensitivity['factors'][-1] - 1:.0%}"
+
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    ax.barh(summary["Input"], summary["Low Bid"] - base_bid, left=base_bid,
+            color="tab:blue", label=f"Input -{percent}")
+    ax.barh(summary["Input"], summary["High Bid"] - base_bid, left=base_bid,
+            color="tab:orange", label=f"Input +{percent}")
+    ax.axvline(base_bid, color="black", linewidth=1)
+
+    ax.set_title(title)
+    ax.set_xlabel(f"Bid Price (base ${base_bid:,.2f})")
+    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, pos: f"${x:,.0f}"))
+    ax.legend(loc="lower right")
+    ax.grid(True, axis="x")
+    fig.tight_layout()
+    return fig
+
+
+def format_sensitivity_report(sensitivity):
+    """Return the sensitivity summary as proposal text, largest swing first."""
+    lines = [f"Base Bid Price: ${sensitivity['base_bid']:,.2f}"]
+    for _, row in sensitivity["summary"].iterrows():
+        value_format = VALUE_FORMATS[row["Input"]]
+        lines.append(
+            f"{row['Input']} {value_format.format(row['Low Value'])} to "
+            f"{value_format.format(row['High Value'])}: Bid ${row['Low Bid']:,.2f} to "
+            f"${row['High Bid']:,.2f} (swing ${row['Swing']:,.2f})"
+        )
+    return "\n".join(lines)
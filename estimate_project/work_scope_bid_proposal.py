@@ -2,9 +2,12 @@ from datetime import datetime
 from tkinter import messagebox, Text, Checkbutton, BooleanVar
 from tkcalendar import DateEntry
 import tkinter as tk
+import io
 import os
 import logging
 from docx import Document
+from docx.shared import Inches
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import mplcursors
@@ -23,8 +26,13 @@ from building_demo import BuildingDemo
 from interior_demo import InteriorDemo
 from house_demo import HouseDemo
 from contact_book import ContactBook
+from crew_optimizer import compute_productivity, lookup_productivity, optimize_crew_plan
 from equipment_book import EquipmentBook
 from postgresql import get_db_connection
+from sensitivity import SENSITIVITY_RANGE, format_sensitivity_report, plot_tornado, \
+    run_sensitivity
+from scenario_evaluator import CREW_RANGE, DAYS_RANGE, equipment_tiers, feasible_frontier, \
+    plot_feasible_frontier
 
 
 logger = logging.getLogger(__name__)
@@ -300,6 +308,10 @@ def save_to_word(data, file_path):
         if "total_cost" in content:
             document.add_paragraph(content["total_cost"])
 
+        # Add the chart if it exists (PNG bytes)
+        if "image" in content:
+            document.add_picture(io.BytesIO(content["image"]), width=Inches(6))
+
     # Save the document to the specified file path
     document.save(file_path)
     messagebox.showinfo("Success", f"Proposal saved to {file_path}")
@@ -610,6 +622,8 @@ def create_project_estimating_page():
     disposal_cost_var = tk.StringVar()
     num_days_var = tk.StringVar()
     num_workers_var = tk.StringVar()
+    deadline_var = tk.StringVar()
+    max_crew_var = tk.StringVar()
 
     def ensure_model_data_loaded():
         if model_cache["df"] is not None and model_cache["models"] is not None:
@@ -680,6 +694,121 @@ def create_project_estimating_page():
 
         return project.generate_detailed_report()
 
+    def suggest_crew_plan():
+        """Fill in the cheapest days and workers that meet the deadline and max crew."""
+        description_value = description_var.get().strip()
+        structure_value = structure_var.get().strip()
+
+        if not description_value:
+            messagebox.showerror("Missing Description", "Please select a project description.")
+            return
+
+        try:
+            sqft_value = int(sqft_var.get().strip())
+            deadline_value = int(deadline_var.get().strip())
+            max_crew_value = int(max_crew_var.get().strip())
+            equipment_cost_value = float(equipment_cost_var.get().strip() or 0)
+            disposal_cost_value = float(disposal_cost_var.get().strip() or 0)
+        except ValueError:
+            messagebox.showerror(
+                "Invalid Input",
+                "Please enter valid numbers for total SqFt, deadline, max crew, "
+                "and equipment/disposal cost.",
+            )
+            return
+
+        if sqft_value <= 0 or deadline_value <= 0 or max_crew_value <= 0:
+            messagebox.showerror(
+                "Invalid Input",
+                "SqFt, deadline, and max crew must be greater than zero.",
+            )
+            return
+
+        if not ensure_model_data_loaded():
+            return
+
+        try:
+            productivity = compute_productivity(model_cache["df"])
+            sqft_per_man_day, productivity_source = lookup_productivity(
+                productivity, description_value, structure_value
+            )
+            plan = optimize_crew_plan(
+                sqft_value,
+                deadline_value,
+                max_crew_value,
+                sqft_per_man_day,
+                equipment_cost=equipment_cost_value,
+                disposal_cost=disposal_cost_value,
+            )
+        except ValueError as e:
+            messagebox.showwarning("No Crew Plan", str(e))
+            return
+
+        num_days_var.set(str(plan["num_days"]))
+        num_workers_var.set(str(plan["num_guys"]))
+        estimate_status_var.set(
+            f"Suggested {plan['num_days']} days with {plan['num_guys']} workers "
+            f"({plan['required_man_days']:,} man-days at {sqft_per_man_day:,.1f} sqft per "
+            f"man-day, {productivity_source}). Bid ${plan['bid_price']:,.2f}, "
+            f"job cost ${plan['job_cost']:,.2f}. Click 'Run Estimate' to save it."
+        )
+
+    def attach_bid_sensitivity():
+        """Show the bid tornado chart for the entered inputs and add it to the proposal."""
+        description_value = description_var.get().strip() or "Project"
+
+        try:
+            sqft_value = int(sqft_var.get().strip())
+            equipment_cost_value = float(equipment_cost_var.get().strip())
+            disposal_cost_value = float(disposal_cost_var.get().strip())
+            num_days_value = int(num_days_var.get().strip())
+            num_workers_value = int(num_workers_var.get().strip())
+        except ValueError:
+            messagebox.showerror(
+                "Invalid Input",
+                "Please enter valid numbers for total SqFt, equipment/disposal cost, "
+                "days, and workers.",
+            )
+            return
+
+        if sqft_value <= 0 or num_days_value <= 0 or num_workers_value <= 0 \
+                or equipment_cost_value < 0 or disposal_cost_value < 0:
+            messagebox.showerror(
+                "Invalid Input",
+                "SqFt, days, and workers must be greater than zero and costs zero or greater.",
+            )
+            return
+
+        sensitivity = run_sensitivity(
+            sqft_value,
+            num_days_value,
+            num_workers_value,
+            equipment_cost_value,
+            disposal_cost_value,
+        )
+        tornado_fig = plot_tornado(sensitivity, f"{description_value} Bid Sensitivity")
+
+        chart_png = io.BytesIO()
+        tornado_fig.savefig(chart_png, format="png", dpi=150, bbox_inches="tight")
+
+        collected_data["Bid Sensitivity"] = {
+            "starting_text": (
+                f"Change in bid price when each input is moved {SENSITIVITY_RANGE:.0%} below "
+                "and above the entered value:"
+            ),
+            "user_input": format_sensitivity_report(sensitivity),
+            "image": chart_png.getvalue(),
+        }
+        estimate_status_var.set(
+            f"Bid sensitivity added to the proposal. "
+            f"{sensitivity['summary']['Input'].iloc[0]} moves the bid most."
+        )
+
+        tornado_fig.canvas.manager.set_window_title(
+            f"Bid Sensitivity {sqft_value}_{description_value}_{todays_date}"
+        )
+        plt.show()
+
     def run_estimate_and_store():
         description_value = description_var.get().strip()
         structure_value = structure_var.get().strip()
@@ -783,6 +912,27 @@ def create_project_estimating_page():
         ridge_profit_percent = _safe_profit_percent(ridge_bid, ridge_cost)
         rf_profit_percent = _safe_profit_percent(rf_bid, rf_cost)
 
+        # Every days x workers x equipment tier plan, priced against the average bid
+        frontier = feasible_frontier(
+            sqft_value,
+            average_bid_price,
+            equipment_tiers(equipment_cost_value),
+            disposal_cost_value,
+            days=np.union1d(DAYS_RANGE, num_days_value),
+        )
+        feasible_plans = int(frontier["feasible"].sum())
+        priced_days = f"{DAYS_RANGE.min()}-{DAYS_RANGE.max()} days"
+        if num_days_value not in DAYS_RANGE:
+            priced_days += f" and {num_days_value} days"
+        frontier_lines = [
+            f"Equipment ${equipment_cost:,.2f}: up to {int(max_crew)} workers for "
+            f"{num_days_value} days"
+            for equipment_cost, max_crew in zip(
+                frontier["equipment_costs"],
+                frontier["max_crew"][:, np.searchsorted(frontier["days"], num_days_value)],
+            )
+        ]
+
         recent_history = projects.sort_values("Awarded Date").tail(5)
         history_lines = []
         for job_number, row in recent_history.iterrows():
@@ -809,6 +959,11 @@ def create_project_estimating_page():
             f"Random Forest Bid Price: ${rf_bid:,.2f}\n"
             f"Random Forest Job Cost: ${rf_cost:,.2f}\n"
             f"Random Forest % Profit: {rf_profit_percent:.2f}%\n\n"
+            "Crew Plans Within the Average Bid:\n"
+            f"Feasible Plans: {feasible_plans:,} of {frontier['feasible'].size:,} "
+            f"({priced_days}, {CREW_RANGE.min()}-{CREW_RANGE.max()} workers)\n"
+            + "\n".join(frontier_lines)
+            + "\n\n"
             "Most Recent Matching Historical Projects:\n"
             + "\n".join(history_lines)
         )
@@ -901,6 +1056,17 @@ def create_project_estimating_page():
         plt.gcf().canvas.manager.set_window_title(f"Trend of {sqft_value}_{description_value}_{todays_date}")
         plt.show()
 
+        # Feasible frontier of crew size and duration within the average bid
+        frontier_fig = plot_feasible_frontier(
+            frontier,
+            average_bid_price,
+            f"{description_value} Crew Plans Within the Average Bid",
+        )
+        frontier_fig.canvas.manager.set_window_title(
+            f"Crew Plans {sqft_value}_{description_value}_{todays_date}"
+        )
+        plt.show()
+
 
     def save_estimating_page():
         if "Estimating Details" not in collected_data:
@@ -978,8 +1144,26 @@ def create_project_estimating_page():
     tk.Entry(page, textvariable=num_workers_var, 
              width=40).grid(row=10, column=1, sticky="w", padx=10, pady=5)
 
+    deadline_label = tk.Label(page, text="Deadline (Days):", font=(FONT, FONT_SIZE))
+    deadline_label.grid(row=11, column=0, sticky="e", padx=10, pady=5)
+    create_tooltip(deadline_label, "Most days the project may take.\n"
+                                   "Used by 'Suggest Crew Plan'.")
+    tk.Entry(page, textvariable=deadline_var, 
+             width=40).grid(row=11, column=1, sticky="w", padx=10, pady=5)
+
+    max_crew_label = tk.Label(page, text="Max Crew:", font=(FONT, FONT_SIZE))
+    max_crew_label.grid(row=12, column=0, sticky="e", padx=10, pady=5)
+    create_tooltip(max_crew_label, "Most workers available for the project.\n"
+                                   "Used by 'Suggest Crew Plan'.")
+    tk.Entry(page, textvariable=max_crew_var, 
+             width=40).grid(row=12, column=1, sticky="w", padx=10, pady=5)
+
+    tk.Button(page, text="Suggest Crew Plan", 
+              command=suggest_crew_plan).grid(row=13, column=0, padx=10, pady=10, sticky="e")
     tk.Button(page, text="Run Estimate", 
-              command=run_estimate_and_store).grid(row=11, column=1, padx=10, pady=10, sticky="w")
+              command=run_estimate_and_store).grid(row=13, column=1, padx=10, pady=10, sticky="w")
+    tk.Button(page, text="Bid Sensitivity", 
+              command=attach_bid_sensitivity).grid(row=14, column=1, padx=10, pady=5, sticky="w")
 
     tk.Label(
         page,
@@ -988,12 +1172,12 @@ def create_project_estimating_page():
         fg="darkgreen",
         wraplength=700,
         justify="left",
-    ).grid(row=12, column=0, columnspan=2, padx=10, pady=10, sticky="w")
+    ).grid(row=15, column=0, columnspan=2, padx=10, pady=10, sticky="w")
 
     tk.Button(page, text="Back", 
-              command=lambda: show_page("Project Overview")).grid(row=13, column=0, pady=20, sticky="w")
+              command=lambda: show_page("Project Overview")).grid(row=16, column=0, pady=20, sticky="w")
     tk.Button(page, text="Next", 
-              command=save_estimating_page).grid(row=13, column=1, pady=20, sticky="e")
+              command=save_estimating_page).grid(row=16, column=1, pady=20, sticky="e")
 
 
 # Page 2: Project-Specific Details
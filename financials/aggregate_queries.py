@@ -0,0 +1,115 @@
+import logging
+from datetime import datetime
+
+import pandas as pd
+
+from postgresql import get_db_connection
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Summary queries that aggregate inside PostgreSQL.
+#
+# Each function returns only the summary rows (one per year, quarter, or
+# equipment project type, plus an overall row) instead of every monthly or
+# equipment row, so the amount sent over the wire stays the same size no
+# matter how many years or machines are covered.
+# ========================================================================== #
+
+SUMMARY_PERIODS = {
+    'year': "to_char(to_date(year_month::text, 'YYYY-MM'), 'YYYY')",
+    'quarter': "to_char(to_date(year_month::text, 'YYYY-MM'), 'YYYY-\"Q\"Q')",
+}
+MONTHLY_SUMMARY_COLUMNS = {
+    'disposal_cost': 'disposalcost',
+    'quickbooks_expenses': 'expense',
+    'sales': 'sales',
+    'payroll': 'payroll',
+}
+SUMMARY_TOTAL_LABEL = 'All'
+
+
+def fetch_monthly_numbers_summary(start_date, end_date, group_by='year'):
+    """
+    Sum, average, and count monthly_numbers per year or quarter.
+
+    Parameters:
+    start_date (str): First month, 'YYYY-MM'.
+    end_date (str): Last month, 'YYYY-MM'.
+    group_by (str): 'year' or 'quarter'.
+
+    Returns:
+    DataFrame: period ('2025', '2025-Q1', or SUMMARY_TOTAL_LABEL for the
+    overall row), months, and <column>_total / <column>_avg for disposal_cost,
+    quickbooks_expenses, sales, and payroll.
+    """
+    if group_by not in SUMMARY_PERIODS:
+        raise ValueError(f"group_by must be one of {', '.join(SUMMARY_PERIODS)}.")
+
+    start_month = datetime.strptime(start_date, '%Y-%m').strftime('%Y-%m')
+    end_month = datetime.strptime(end_date, '%Y-%m').strftime('%Y-%m')
+
+    aggregates = ",\n".join(
+        f"SUM({column}) AS {name}_total, AVG({column}) AS {name}_avg"
+        for name, column in MONTHLY_SUMMARY_COLUMNS.items()
+    )
+    query = f"""
+        SELECT
+            COALESCE({SUMMARY_PERIODS[group_by]}, %(total_label)s) AS period,
+            COUNT(*) AS months,
+            {aggregates}
+        FROM monthly_numbers
+        WHERE year_month >= %(start_month)s
+          AND year_month <= %(end_month)s
+        GROUP BY ROLLUP ({SUMMARY_PERIODS[group_by]})
+        ORDER BY GROUPING({SUMMARY_PERIODS[group_by]}), period;
+    """
+
+    with get_db_connection() as conn:
+        summary = pd.read_sql_query(
+            query,
+            conn,
+            params={"start_month": start_month, "end_month": end_month,
+                    "total_label": SUMMARY_TOTAL_LABEL},
+        )
+
+    numeric_columns = summary.columns.drop('period')
+    summary[numeric_columns] = summary[numeric_columns].apply(pd.to_numeric, errors='coerce') \
+        .fillna(0.0)
+    return summary
+
+
+def fetch_equipment_summary():
+    """
+    Count, total, and average equipment purchase prices in PostgreSQL.
+
+    Equipment without a name or purchase price is left out, as in
+    fetch_equipment_values().
+
+    Returns:
+    DataFrame: project_type (SUMMARY_TOTAL_LABEL for the overall row),
+    equipment_count, total_purchase_price, and avg_purchase_price.
+    """
+    query = """
+        SELECT
+            CASE WHEN GROUPING(project_type) = 1 THEN %(total_label)s
+                 ELSE COALESCE(project_type, 'Unspecified') END AS project_type,
+            COUNT(*) AS equipment_count,
+            COALESCE(SUM(purchase_price), 0) AS total_purchase_price,
+            COALESCE(AVG(purchase_price), 0) AS avg_purchase_price
+        FROM equipment
+        WHERE equipment_name IS NOT NULL
+          AND purchase_price IS NOT NULL
+        GROUP BY ROLLUP (project_type)
+        ORDER BY GROUPING(project_type), project_type;
+    """
+
+    with get_db_connection() as conn:
+        summary = pd.read_sql_query(query, conn, params={"total_label": SUMMARY_TOTAL_LABEL})
+
+    for column in ['equipment_count', 'total_purchase_price', 'avg_purchase_price']:
+        summary[column] = pd.to_numeric(summary[column], errors='coerce').fillna(0.0)
+    return summary
@@ -0,0 +1,315 @@
+import argparse
+import html
+import logging
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+
+from financials_main import CALCULATE_OPTIONS, CHART_OPTIONS, NUM_MONTHS, UNDATED_OPTIONS, \
+    build_option_charts, get_option_financials, monthly_numbers_cache
+from forecasting import DEFAULT_BACKEND, FORECAST_BACKENDS
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Headless month-end report: every Calculate and Display Chart option of
+# financials_main.py for one or more date ranges, without the GUI.
+#
+# Each (option, date range) pair is one job run in a worker process.
+# matplotlib charts are saved as PNG with the Agg backend and Plotly charts
+# as HTML sharing one plotly.min.js. Equipment and Revenue cover all
+# history, so they run once no matter how many ranges are given.
+#
+# The bundle is a directory holding index.html, financials.csv (one row
+# per metric), and charts/, plus a zip of that directory.
+#
+# Usage (from the financials directory):
+#   python batch_report.py --range 2025-01:2025-12 --range 2026-01:2026-06
+#   python batch_report.py            # the last NUM_MONTHS complete months
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+REPORT_OPTIONS = tuple(dict.fromkeys(CALCULATE_OPTIONS + CHART_OPTIONS))
+ALL_HISTORY_LABEL = "All History"
+CHART_DIR = "charts"
+CHART_DPI = 100
+
+
+def slugify(text):
+    """Return text as a lowercase file name fragment."""
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+def parse_date_range(text):
+    """Parse 'YYYY-MM:YYYY-MM' into a (start, end) tuple of 'YYYY-MM' strings."""
+    try:
+        start_date, end_date = text.split(':')
+        start = datetime.strptime(start_date.strip(), '%Y-%m')
+        end = datetime.strptime(end_date.strip(), '%Y-%m')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a YYYY-MM:YYYY-MM range.")
+
+    if end < start:
+        raise argparse.ArgumentTypeError(f"{text!r} ends before it starts.")
+    return start.strftime('%Y-%m'), end.strftime('%Y-%m')
+
+
+def default_date_range(today=None):
+    """Return the last NUM_MONTHS complete months before today."""
+    end = pd.Period(today or date.today(), freq='M') - 1
+    start = end - (NUM_MONTHS - 1)
+    return start.strftime('%Y-%m'), end.strftime('%Y-%m')
+
+
+def build_report_jobs(date_ranges, report_options=REPORT_OPTIONS):
+    """
+    List the (option, start_date, end_date) jobs of a report.
+
+    UNDATED_OPTIONS get a single job with no dates.
+    """
+    jobs = []
+    for option in report_options:
+        if option in UNDATED_OPTIONS:
+            jobs.append((option, None, None))
+        else:
+            jobs.extend((option, start_date, end_date) for start_date, end_date in date_ranges)
+    return jobs
+
+
+def save_chart(fig, path_without_extension):
+    """Save a matplotlib figure as PNG or a Plotly figure as HTML; return the path."""
+    if isinstance(fig, go.Figure):
+        path = f"{path_without_extension}.html"
+        fig.write_html(path, include_plotlyjs='directory')
+    else:
+        path = f"{path_without_extension}.png"
+        fig.savefig(path, dpi=CHART_DPI, bbox_inches='tight')
+        plt.close(fig)
+    return path
+
+
+def run_report_job(option, start_date, end_date, output_dir, backend=DEFAULT_BACKEND):
+    """
+    Compute one option for one date range and save its charts.
+
+    Parameters:
+    option (str): One of REPORT_OPTIONS.
+    start_date (str): First month, 'YYYY-MM', or None for UNDATED_OPTIONS.
+    end_date (str): Last month, 'YYYY-MM', or None for UNDATED_OPTIONS.
+    output_dir (str): Bundle directory; charts go in its CHART_DIR.
+    backend (str): Forecasting backend of the prediction charts.
+
+    Returns:
+    dict: option, start_date, end_date, sections (list of (title, dict)),
+    charts (paths relative to output_dir), and error (None, or why the
+    option could not be computed).
+    """
+    result = {"option": option, "start_date": start_date, "end_date": end_date,
+              "sections": [], "charts": [], "error": None}
+    range_label = f"{start_date}_{end_date}" if start_date else "all_history"
+
+    try:
+        if option in CALCULATE_OPTIONS:
+            result["sections"] = [
+                (title, {key: float(value) for key, value in financials.items()})
+                for title, financials in get_option_financials(option, start_date, end_date)
+            ]
+
+        if option in CHART_OPTIONS:
+            charts = build_option_charts(option, start_date, end_date, backend)
+            for name, fig in charts:
+                file_name = f"{range_label}_{slugify(option)}"
+                if len(charts) > 1:
+                    file_name += f"_{slugify(name)}"
+                path = save_chart(fig, os.path.join(output_dir, CHART_DIR, file_name))
+                result["charts"].append(os.path.relpath(path, output_dir))
+
+    except Exception as e:
+        logger.exception("Failed to report %s for %s", option, range_label)
+        result["error"] = str(e) or type(e).__name__
+    finally:
+        plt.close('all')
+
+    return result
+
+
+def run_report_jobs(jobs, output_dir, max_workers=None, backend=DEFAULT_BACKEND):
+    """
+    Run every job, in worker processes when more than one is allowed.
+
+    Returns:
+    list of dict: run_report_job() results in job order.
+    """
+    if max_workers is None:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+
+    if max_workers <= 1 or len(jobs) == 1:
+        return [run_report_job(*job, output_dir, backend) for job in jobs]
+
+    columns = list(zip(*jobs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_report_job, *columns,
+                                 [output_dir] * len(jobs), [backend] * len(jobs)))
+
+
+def results_to_frame(results):
+    """Flatten job results to one row per metric."""
+    rows = [
+        {
+            "start_date": result["start_date"] or "",
+            "end_date": result["end_date"] or "",
+            "option": result["option"],
+            "section": title,
+            "metric": metric,
+            "value": value,
+        }
+        for result in results
+        for title, financials in result["sections"]
+        for metric, value in financials.items()
+    ]
+    return pd.DataFrame(rows, columns=["start_date", "end_date", "option", "section",
+                                       "metric", "value"])
+
+
+def render_index_html(results, date_ranges, generated_at):
+    """Return the bundle's index.html, one block per date range and option."""
+    parts = [
+        "<!DOCTYPE html>",
+        "<html><head><meta charset='utf-8'><title>Financial Report</title>",
+        "<style>body{font-family:sans-serif;margin:2em} table{border-collapse:collapse;"
+        "margin-bottom:1em} td,th{border:1px solid #ccc;padding:4px 8px} "
+        "td.value{text-align:right} .error{color:#b00} img{max-width:100%}</style>",
+        "</head><body>",
+        "<h1>Financial Report</h1>",
+        f"<p>Generated {html.escape(generated_at)} for "
+        f"{html.escape(', '.join(f'{start} to {end}' for start, end in date_ranges))}.</p>",
+    ]
+
+    groups = [(ALL_HISTORY_LABEL, (None, None))] + \
+        [(f"{start} to {end}", (start, end)) for start, end in date_ranges]
+    for heading, date_range in groups:
+        group_results = [result for result in results
+                         if (result["start_date"], result["end_date"]) == date_range]
+        if not group_results:
+            continue
+
+        parts.append(f"<h2>{html.escape(heading)}</h2>")
+        for result in group_results:
+            parts.append(f"<h3>{html.escape(result['option'])}</h3>")
+
+            if result["error"]:
+                parts.append(f"<p class='error'>{html.escape(result['error'])}</p>")
+            elif not result["sections"] and not result["charts"]:
+                parts.append("<p>No results.</p>")
+
+            for title, financials in result["sections"]:
+                parts.append(f"<table><tr><th colspan='2'>{html.escape(title)}</th></tr>")
+                parts.extend(
+                    f"<tr><td>{html.escape(metric)}</td><td class='value'>{value:,.2f}</td></tr>"
+                    for metric, value in financials.items()
+                )
+                parts.append("</table>")
+
+            for chart in result["charts"]:
+                src = html.escape(chart.replace(os.sep, '/'))
+                if chart.endswith('.html'):
+                    parts.append(f"<p><a href='{src}'>{src}</a> (interactive)</p>")
+                else:
+                    parts.append(f"<p><img src='{src}' alt='{src}'></p>")
+
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def generate_report(date_ranges, output_dir, max_workers=None, backend=DEFAULT_BACKEND,
+                    report_options=REPORT_OPTIONS, make_zip=True):
+    """
+    Compute every report option for each date range and write the bundle.
+
+    Parameters:
+    date_ranges (list of tuple): (start, end) 'YYYY-MM' pairs.
+    output_dir (str): Directory to write; replaced if it already exists.
+    max_workers (int, optional): Worker process limit. Defaults to one
+    per CPU.
+    backend (str): Forecasting backend of the prediction charts.
+    report_options (tuple): Options to include.
+    make_zip (bool): Also write output_dir.zip.
+
+    Returns:
+    tuple: (results, bundle path) where bundle path is the zip file, or
+    output_dir when make_zip is False.
+    """
+    if os.path.isdir(output_dir):
+        shutil.rmtree(output_dir)
+    chart_dir = os.path.join(output_dir, CHART_DIR)
+    os.makedirs(chart_dir)
+
+    # Written once here so the Plotly charts saved by the workers reuse it
+    with open(os.path.join(chart_dir, 'plotly.min.js'), 'w', encoding='utf-8') as file:
+        file.write(get_plotlyjs())
+
+    # Load monthly_numbers before the pool starts; forked workers inherit it
+    monthly_numbers_cache.refresh_if_stale()
+
+    jobs = build_report_jobs(date_ranges, report_options)
+    results = run_report_jobs(jobs, output_dir, max_workers, backend)
+
+    results_to_frame(results).to_csv(os.path.join(output_dir, 'financials.csv'), index=False)
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M')
+    with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as file:
+        file.write(render_index_html(results, date_ranges, generated_at))
+
+    bundle = output_dir
+    if make_zip:
+        bundle = shutil.make_archive(output_dir, 'zip', output_dir)
+    return results, bundle
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Write every financial option to a report bundle.")
+    parser.add_argument("--range", dest="date_ranges", action="append", type=parse_date_range,
+                        metavar="YYYY-MM:YYYY-MM",
+                        help="Date range to report; repeat for several. "
+                        f"Defaults to the last {NUM_MONTHS} complete months.")
+    parser.add_argument("--output", default=f"financial_report_{date.today():%Y-%m-%d}",
+                        help="Bundle directory; a .zip of the same name is also written.")
+    parser.add_argument("--workers", type=int, help="Worker processes. Defaults to one per CPU.")
+    parser.add_argument("--backend", choices=FORECAST_BACKENDS, default=DEFAULT_BACKEND,
+                        help="Forecasting backend of the prediction charts.")
+    parser.add_argument("--options", nargs="+", choices=REPORT_OPTIONS, default=REPORT_OPTIONS,
+                        metavar="OPTION", help="Only report these options.")
+    parser.add_argument("--no-zip", action="store_true", help="Do not zip the bundle directory.")
+    args = parser.parse_args()
+
+    date_ranges = args.date_ranges or [default_date_range()]
+    results, bundle = generate_report(date_ranges, args.output, args.workers, args.backend,
+                                      tuple(args.options), make_zip=not args.no_zip)
+
+    print("\n")
+    print("Financial Report".center(60, "-"))
+    for result in results:
+        date_range = f"{result['start_date']} to {result['end_date']}" if result['start_date'] \
+            else ALL_HISTORY_LABEL
+        status = f"error: {result['error']}" if result['error'] \
+            else f"{len(result['sections'])} sections, {len(result['charts'])} charts"
+        print(f"{result['option']:<28} {date_range:<20} {status}")
+    print(f"\nReport saved to {bundle}")
@@ -0,0 +1,322 @@
+import argparse
+import itertools
+import logging
+from datetime import date
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+from postgresql import get_db_connection
+from financial_metrics import compute_financial_metrics
+from forecasting import DEFAULT_BACKEND, DEFAULT_FUTURE_MONTHS, FORECAST_BACKENDS, \
+    prepare_series, run_forecasts
+from forecast_cache import ForecastCache
+from monthly_numbers_cache import MonthlyNumbersCache
+from project_forecasting import forecast_project_revenue
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Excel export of monthly_numbers, the operating-cost metrics, the monthly
+# and project forecasts, and project detail.
+#
+# The workbook is opened in openpyxl write-only mode, so every row is
+# written straight to the sheet's file instead of being kept as a cell
+# object. Project rows are streamed from a server-side cursor in batches of
+# FETCH_SIZE and split into one sheet per award year, so exporting ten years
+# of projects uses about as much memory as exporting one. openpyxl writes
+# noticeably faster when lxml (in requirements.txt) is installed.
+#
+# Usage (from the financials directory):
+#   python excel_export.py --output financials.xlsx
+#   python excel_export.py --start 2016-01 --end 2025-12 --backend holt_winters
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+FETCH_SIZE = 5_000
+CURRENCY_FORMAT = '#,##0.00'
+DATE_FORMAT = 'yyyy-mm-dd'
+COLUMN_WIDTH = 18
+NOT_AWARDED_SHEET = "Projects Not Awarded"
+
+MONTHLY_SHEET_COLUMNS = ['year_month', 'disposal_cost', 'quickbooks_expenses', 'sales',
+                         'payroll', 'operating_cost']
+PROJECT_SHEET_COLUMNS = ['job_number', 'awarded_date', 'project_description', 'structure_type',
+                         'sqft', 'bid_price', 'job_cost', 'gross_profit', 'estimator']
+FORECAST_SHEET_COLUMNS = ['series', 'ds', 'y', 'yhat', 'yhat_lower', 'yhat_upper', 'is_forecast']
+PROJECT_FORECAST_SHEET_COLUMNS = ['dimension', 'series_name', 'ds', 'y', 'yhat', 'yhat_lower',
+                                  'yhat_upper', 'is_forecast']
+CURRENCY_COLUMNS = {'disposal_cost', 'quickbooks_expenses', 'sales', 'payroll', 'operating_cost',
+                    'bid_price', 'job_cost', 'gross_profit', 'y', 'yhat', 'yhat_lower',
+                    'yhat_upper', 'value'}
+DATE_COLUMNS = {'awarded_date', 'ds'}
+
+FORECAST_SERIES = {
+    'quickbooks_monthly_expenses': 'Quickbooks Monthly Expenses',
+    'monthly_payroll': 'Monthly Payroll',
+    'monthly_disposal_cost': 'Monthly Disposal Cost',
+    'monthly_sales': 'Monthly Sales',
+}
+
+# =========================================================================== #
+# ======================== Get Data from PostgreSQL ========================= #
+# =========================================================================== #
+
+def iter_project_rows(start_month=None, end_month=None, fetch_size=FETCH_SIZE):
+    """
+    Stream project rows ordered by award date from a server-side cursor.
+
+    Parameters:
+    start_month (str, optional): First award month, 'YYYY-MM'. Projects
+    that were never awarded are only included when no range is given.
+    end_month (str, optional): Last award month, 'YYYY-MM'.
+    fetch_size (int): Rows fetched from PostgreSQL per round trip.
+
+    Yields:
+    tuple: One value per PROJECT_SHEET_COLUMNS.
+    """
+    query = """
+        SELECT job_number, awarded_date, project_description, structure_type,
+               sqft, bid_price, job_cost, bid_price - job_cost AS gross_profit, estimator
+        FROM project
+        WHERE (%(start_date)s::date IS NULL OR awarded_date >= %(start_date)s::date)
+          AND (%(end_date)s::date IS NULL
+               OR awarded_date < (%(end_date)s::date + INTERVAL '1 month'))
+        ORDER BY awarded_date NULLS LAST, job_number;
+    """
+    params = {
+        "start_date": f"{start_month}-01" if start_month else None,
+        "end_date": f"{end_month}-01" if end_month else None,
+    }
+
+    with get_db_connection() as conn:
+        # A named cursor keeps the result set on the server and sends it in batches
+        with conn.cursor(name="project_excel_export") as cur:
+            cur.itersize = fetch_size
+            cur.execute(query, params)
+            yield from cur
+
+# =========================================================================== #
+# ============================= Worksheet Writers =========================== #
+# =========================================================================== #
+
+def create_sheet(workbook, title, columns):
+    """Add a write-only sheet with a bold, frozen header row and return it."""
+    worksheet = workbook.create_sheet(title)
+    worksheet.freeze_panes = 'A2'
+    for index in range(1, len(columns) + 1):
+        worksheet.column_dimensions[get_column_letter(index)].width = COLUMN_WIDTH
+
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, value=column)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    worksheet.append(header)
+    return worksheet
+
+
+def write_rows(worksheet, columns, rows):
+    """
+    Append rows to a write-only sheet, formatting currency and date columns.
+
+    Only the formatted columns are wrapped in cell objects; every other
+    value is appended as is.
+
+    Returns:
+    int: Number of rows written.
+    """
+    formats = {
+        index: CURRENCY_FORMAT if column in CURRENCY_COLUMNS else DATE_FORMAT
+        for index, column in enumerate(columns)
+        if column in CURRENCY_COLUMNS or column in DATE_COLUMNS
+    }
+
+    count = 0
+    for row in rows:
+        row = list(row)
+        for index, number_format in formats.items():
+            if row[index] is not None:
+                cell = WriteOnlyCell(worksheet, value=row[index])
+                cell.number_format = number_format
+                row[index] = cell
+        worksheet.append(row)
+        count += 1
+    return count
+
+
+def write_monthly_numbers_sheet(workbook, monthly_numbers):
+    """Write one row per month, with operating cost (payroll plus expenses)."""
+    worksheet = create_sheet(workbook, "Monthly Numbers", MONTHLY_SHEET_COLUMNS)
+    rows = (
+        (row.year_month, row.monthly_disposal_cost, row.quickbooks_monthly_expenses,
+         row.monthly_sales, row.monthly_payroll,
+         row.monthly_payroll + row.quickbooks_monthly_expenses)
+        for row in monthly_numbers.itertuples(index=False)
+    )
+    return write_rows(worksheet, MONTHLY_SHEET_COLUMNS, rows)
+
+
+def write_metrics_sheet(workbook, metrics):
+    """Write every operating-cost, disposal, Quickbooks, and sales metric."""
+    columns = ['section', 'metric', 'value']
+    worksheet = create_sheet(workbook, "Operating Cost", columns)
+    rows = (
+        (section.replace('_', ' ').title(), metric.replace('_', ' ').capitalize(), value)
+        for section, section_metrics in metrics.items() if section != 'monthly_data'
+        for metric, value in section_metrics.items()
+    )
+    return write_rows(worksheet, columns, rows)
+
+
+def write_forecast_sheet(workbook, forecasts):
+    """Write the actual, fitted, and predicted months of each (name, data, forecast)."""
+    worksheet = create_sheet(workbook, "Forecasts", FORECAST_SHEET_COLUMNS)
+
+    def forecast_rows():
+        for name, data, forecast in forecasts:
+            actuals = dict(zip(data['ds'], data['y']))
+            for row in forecast.itertuples(index=False):
+                actual = actuals.get(row.ds)
+                yield (name, row.ds, actual, row.yhat, row.yhat_lower, row.yhat_upper,
+                       actual is None)
+
+    return write_rows(worksheet, FORECAST_SHEET_COLUMNS, forecast_rows())
+
+
+def write_project_forecast_sheet(workbook, forecast_table):
+    """Write forecast_project_revenue()'s tidy table."""
+    worksheet = create_sheet(workbook, "Project Forecasts", PROJECT_FORECAST_SHEET_COLUMNS)
+    rows = (
+        (row.dimension, row.series_name, row.ds, None if pd.isna(row.y) else row.y,
+         row.yhat, row.yhat_lower, row.yhat_upper, bool(row.is_forecast))
+        for row in forecast_table[PROJECT_FORECAST_SHEET_COLUMNS].itertuples(index=False)
+    )
+    return write_rows(worksheet, PROJECT_FORECAST_SHEET_COLUMNS, rows)
+
+
+def write_project_sheets(workbook, project_rows):
+    """
+    Write project rows to one sheet per award year.
+
+    Parameters:
+    workbook (Workbook): Write-only workbook.
+    project_rows (iterable): PROJECT_SHEET_COLUMNS tuples ordered by award
+    date with unawarded projects last, as from iter_project_rows().
+
+    Returns:
+    dict: Row count per sheet title.
+    """
+    award_year_index = PROJECT_SHEET_COLUMNS.index('awarded_date')
+    counts = {}
+
+    def award_year(row):
+        awarded_date = row[award_year_index]
+        return awarded_date.year if awarded_date is not None else None
+
+    for year, rows in itertools.groupby(project_rows, key=award_year):
+        title = f"Projects {year}" if year is not None else NOT_AWARDED_SHEET
+        worksheet = create_sheet(workbook, title, PROJECT_SHEET_COLUMNS)
+        counts[title] = write_rows(worksheet, PROJECT_SHEET_COLUMNS, rows)
+        logger.info("Wrote %d projects to '%s'", counts[title], title)
+
+    return counts
+
+# =========================================================================== #
+# ================================== Export ================================= #
+# =========================================================================== #
+
+def export_financials_to_excel(path, start_month=None, end_month=None,
+                               future_months=DEFAULT_FUTURE_MONTHS, backend=DEFAULT_BACKEND,
+                               include_projects=True, monthly_numbers_cache=None):
+    """
+    Write monthly numbers, metrics, forecasts, and project detail to .xlsx.
+
+    Parameters:
+    path (str): Workbook file to write.
+    start_month (str, optional): First month, 'YYYY-MM'. Defaults to the
+    first month in monthly_numbers.
+    end_month (str, optional): Last month, 'YYYY-MM'. Defaults to the last.
+    future_months (int): Number of months to forecast.
+    backend (str): Forecasting backend of the monthly series.
+    include_projects (bool): Also write the per-year project sheets.
+    monthly_numbers_cache (MonthlyNumbersCache, optional): Cache to read
+    monthly_numbers from; a new one is loaded when omitted.
+
+    Returns:
+    dict: Row count per sheet title.
+    """
+    if monthly_numbers_cache is None:
+        monthly_numbers_cache = MonthlyNumbersCache()
+    monthly_numbers_cache.refresh_if_stale()
+    year_months = monthly_numbers_cache.year_months
+    if len(year_months) == 0:
+        raise ValueError("No monthly_numbers records to export.")
+
+    first_month = str(start_month or year_months[0])
+    last_month = str(end_month or year_months[-1])
+    monthly_numbers = monthly_numbers_cache.get_range_frame(first_month, last_month)
+    if monthly_numbers.empty:
+        raise ValueError("No monthly_numbers records found for the selected date range.")
+
+    metrics = compute_financial_metrics(monthly_numbers)
+    series = [(name, prepare_series(metrics['monthly_data'][column]))
+              for column, name in FORECAST_SERIES.items()]
+    forecasts = run_forecasts(series, future_months, cache=ForecastCache(), backend=backend)
+
+    workbook = Workbook(write_only=True)
+    counts = {
+        "Monthly Numbers": write_monthly_numbers_sheet(workbook, monthly_numbers),
+        "Operating Cost": write_metrics_sheet(workbook, metrics),
+        "Forecasts": write_forecast_sheet(workbook, forecasts),
+    }
+
+    if include_projects:
+        try:
+            project_forecasts = forecast_project_revenue(first_month, last_month, future_months)
+        except ValueError as e:
+            # No awarded projects in the range; keep the rest of the export
+            logger.warning("Project Forecasts sheet left empty: %s", e)
+            project_forecasts = pd.DataFrame(columns=PROJECT_FORECAST_SHEET_COLUMNS)
+        counts["Project Forecasts"] = write_project_forecast_sheet(workbook, project_forecasts)
+        counts.update(write_project_sheets(workbook, iter_project_rows(start_month, end_month)))
+
+    workbook.save(path)
+    return counts
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Export financial history to an Excel workbook.")
+    parser.add_argument("--start", help="First month, YYYY-MM. Defaults to all history.")
+    parser.add_argument("--end", help="Last month, YYYY-MM. Defaults to all history.")
+    parser.add_argument("--output", default=f"financials_{date.today():%Y-%m-%d}.xlsx",
+                        help="Workbook file to write.")
+    parser.add_argument("--future-months", type=int, default=DEFAULT_FUTURE_MONTHS,
+                        help="Number of months to forecast.")
+    parser.add_argument("--backend", choices=FORECAST_BACKENDS, default=DEFAULT_BACKEND,
+                        help="Forecasting backend of the monthly series.")
+    parser.add_argument("--no-projects", action="store_true",
+                        help="Leave out the project forecast and detail sheets.")
+    args = parser.parse_args()
+
+    counts = export_financials_to_excel(args.output, args.start, args.end, args.future_months,
+                                        args.backend, include_projects=not args.no_projects)
+
+    print("\n")
+    print("Excel Export".center(60, "-"))
+    for title, count in counts.items():
+        print(f"{title:<30} {count:>10,} rows")
+    print(f"\nWorkbook saved to {args.output}")
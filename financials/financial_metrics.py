@@ -0,0 +1,145 @@
+import logging
+from collections import OrderedDict
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Financial metrics for every Calculate/Display Chart option in
+# financials_main.py.
+#
+# A date range is fetched once, its four monthly_numbers columns are turned
+# into one numpy matrix, and the totals and averages behind the Daily,
+# Monthly, Yearly, Disposal, Quickbooks, and Sales options are derived from
+# a single sum over that matrix. The result is cached per (start, end), so
+# switching options or buttons for the same range never re-queries.
+# ========================================================================== #
+
+WORK_DAYS_IN_MONTH = 20
+DAILY_WORK_HOURS = 10
+PROFIT_MARGIN = 1.35
+NUM_EMPLOYEES = 112
+
+MONTHLY_COLUMNS = (
+    'monthly_disposal_cost',
+    'quickbooks_monthly_expenses',
+    'monthly_sales',
+    'monthly_payroll',
+)
+MAX_CACHED_RANGES = 32
+
+
+def compute_financial_metrics(monthly_numbers):
+    """
+    Compute every option's metrics from one date range of monthly numbers.
+
+    Parameters:
+    monthly_numbers (DataFrame): year_month plus the MONTHLY_COLUMNS, as
+    returned by fetch_monthly_numbers_from_postgresql().
+
+    Returns:
+    dict: 'monthly_data' ({column: {year_month: value}} for the charts),
+    'operating_cost' (daily, monthly, and yearly payroll and expenses),
+    'disposal', 'quickbooks', and 'sales'.
+    """
+    year_months = monthly_numbers['year_month'].astype(str).to_numpy()
+    values = monthly_numbers[list(MONTHLY_COLUMNS)].to_numpy(dtype=float).T
+    if values.shape[1] == 0:
+        raise ValueError("No monthly_numbers records found for the selected date range.")
+
+    totals = dict(zip(MONTHLY_COLUMNS, values.sum(axis=1).tolist()))
+    averages = {column: total / values.shape[1] for column, total in totals.items()}
+
+    monthly_payroll_avg = averages['monthly_payroll']
+    monthly_expenses_avg = averages['quickbooks_monthly_expenses']
+    yearly_payroll_total = totals['monthly_payroll']
+    yearly_expenses_total = totals['quickbooks_monthly_expenses']
+
+    daily_payroll = monthly_payroll_avg / WORK_DAYS_IN_MONTH
+    daily_expenses = monthly_expenses_avg / WORK_DAYS_IN_MONTH
+    daily_operating_cost = daily_payroll + daily_expenses
+
+    if NUM_EMPLOYEES > 0:
+        daily_operating_cost_per_employee = daily_operating_cost / NUM_EMPLOYEES
+        hourly_rate = round(
+            daily_operating_cost_per_employee / DAILY_WORK_HOURS * PROFIT_MARGIN,
+            2,
+        )
+    else:
+        daily_operating_cost_per_employee = 0.0
+        hourly_rate = 0.0
+
+    avg_disposal_cost = round(averages['monthly_disposal_cost'])
+
+    return {
+        'monthly_data': {
+            column: dict(zip(year_months.tolist(), column_values.tolist()))
+            for column, column_values in zip(MONTHLY_COLUMNS, values)
+        },
+        'operating_cost': {
+            'daily_payroll': round(daily_payroll, 2),
+            'daily_operating_cost': round(daily_operating_cost, 2),
+            'daily_operating_cost_per_employee': round(daily_operating_cost_per_employee, 2),
+            'hourly_rate': hourly_rate,
+            'monthly_payroll_avg': round(monthly_payroll_avg, 2),
+            'monthly_expenses_avg': round(monthly_expenses_avg, 2),
+            'monthly_operating_cost_avg': round(monthly_payroll_avg + monthly_expenses_avg, 2),
+            'yearly_payroll_total': round(yearly_payroll_total, 2),
+            'yearly_expenses_total': round(yearly_expenses_total, 2),
+            'yearly_operating_cost_total': round(yearly_payroll_total + yearly_expenses_total, 2),
+        },
+        'disposal': {
+            'total_disposal_cost': totals['monthly_disposal_cost'],
+            'avg_disposal_cost': avg_disposal_cost,
+            'avg_daily_disposal_cost': round(avg_disposal_cost / WORK_DAYS_IN_MONTH),
+        },
+        'quickbooks': {
+            'total_qb_monthly_expenses': round(totals['quickbooks_monthly_expenses'], 2),
+            'avg_qb_monthly_expenses': round(averages['quickbooks_monthly_expenses'], 2),
+        },
+        'sales': {
+            'total_monthly_sales': round(totals['monthly_sales'], 2),
+            'avg_monthly_sales': round(averages['monthly_sales'], 2),
+        },
+    }
+
+
+class FinancialMetricsEngine:
+    """
+    Caches computed financial metrics per (start, end) date range.
+
+    Attributes:
+    - fetch_monthly_numbers (callable): Takes (start_date, end_date) and
+    returns the monthly numbers DataFrame for that range.
+    - max_entries (int): Number of date ranges kept before dropping the
+    least recently used one.
+    - data_version (callable, optional): Returns a value that changes
+    whenever the underlying monthly numbers change; metrics computed for an
+    older version are not reused.
+    """
+    def __init__(self, fetch_monthly_numbers, max_entries=MAX_CACHED_RANGES, data_version=None):
+        self.fetch_monthly_numbers = fetch_monthly_numbers
+        self.max_entries = max_entries
+        self.data_version = data_version
+        self.metrics_by_range = OrderedDict()
+
+    def get(self, start_date, end_date):
+        """Return the metrics for a date range, fetching it only on the first request."""
+        version = self.data_version() if self.data_version is not None else None
+        key = (start_date, end_date, version)
+        if key in self.metrics_by_range:
+            self.metrics_by_range.move_to_end(key)
+            return self.metrics_by_range[key]
+
+        logger.debug("Computing financial metrics for %s to %s", start_date, end_date)
+        metrics = compute_financial_metrics(self.fetch_monthly_numbers(start_date, end_date))
+        self.metrics_by_range[key] = metrics
+        while len(self.metrics_by_range) > self.max_entries:
+            self.metrics_by_range.popitem(last=False)
+        return metrics
+
+    def clear(self):
+        """Forget every cached date range, e.g. after monthly_numbers is updated."""
+        self.metrics_by_range.clear()
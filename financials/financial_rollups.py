@@ -0,0 +1,109 @@
+import logging
+
+import pandas as pd
+
+from postgresql import get_db_connection
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Reads the month/quarter/year financial_rollup table created by
+# sql_database_layouts/financial_rollups.sql.
+#
+# Triggers queue every month touched by a monthly_numbers or project change,
+# and refresh_financial_rollups() recomputes only those months and their
+# quarters and years. Reads here call it first, which is a no-op when
+# nothing changed, so the Revenue option always sees current totals without
+# rescanning the source tables.
+#
+# Net profit is sales less payroll and expense, the operating cost basis of
+# FinancialMetricsEngine, so the Revenue option agrees with the Financial
+# Metrics option. Disposal cost stays its own column outside that basis.
+# ========================================================================== #
+
+ROLLUP_PERIODS = ('month', 'quarter', 'year')
+ROLLUP_VALUE_COLUMNS = ['months', 'sales', 'expense', 'payroll', 'disposalcost',
+                        'project_count', 'bid_total', 'job_cost_total']
+
+
+def refresh_financial_rollups():
+    """Recompute rollups for months changed since the last refresh; return how many."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT refresh_financial_rollups();")
+            refreshed_months = cur.fetchone()[0]
+        conn.commit()
+
+    if refreshed_months:
+        logger.info("Refreshed financial rollups for %d months", refreshed_months)
+    return refreshed_months
+
+
+def fetch_financial_rollups(period_type='year', refresh=True):
+    """
+    Fetch rollup rows for one period type, oldest first.
+
+    Parameters:
+    period_type (str): 'month', 'quarter', or 'year'.
+    refresh (bool): Apply pending changes before reading.
+
+    Returns:
+    DataFrame: period_start plus ROLLUP_VALUE_COLUMNS, and net_profit
+    (sales less payroll and expense) and gross_profit (bid total less job
+    cost).
+    """
+    if period_type not in ROLLUP_PERIODS:
+        raise ValueError(f"period_type must be one of {', '.join(ROLLUP_PERIODS)}.")
+
+    if refresh:
+        refresh_financial_rollups()
+
+    query = f"""
+        SELECT period_start, {', '.join(ROLLUP_VALUE_COLUMNS)}
+        FROM financial_rollup
+        WHERE period_type = %(period_type)s
+        ORDER BY period_start;
+    """
+
+    with get_db_connection() as conn:
+        rollups = pd.read_sql_query(query, conn, params={"period_type": period_type})
+
+    rollups[ROLLUP_VALUE_COLUMNS] = rollups[ROLLUP_VALUE_COLUMNS].apply(pd.to_numeric,
+                                                                        errors='coerce').fillna(0.0)
+    rollups['net_profit'] = rollups['sales'] - rollups['payroll'] - rollups['expense']
+    rollups['gross_profit'] = rollups['bid_total'] - rollups['job_cost_total']
+    return rollups
+
+
+def get_yearly_revenue():
+    """
+    Return yearly revenue and net profit from the rollups.
+
+    Returns:
+    dict: {'YYYY': {'revenue': sales, 'net profit': net_profit,
+    'awarded bids': bid_total, 'gross profit': gross_profit}}, the shape of
+    the revenue dictionary in revenue.py plus the project totals.
+    """
+    rollups = fetch_financial_rollups('year')
+    return {
+        str(row.period_start.year): {
+            "revenue": float(row.sales),
+            "net profit": float(row.net_profit),
+            "awarded bids": float(row.bid_total),
+            "gross profit": float(row.gross_profit),
+        }
+        for row in rollups.itertuples(index=False)
+    }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    for period_type in ROLLUP_PERIODS[::-1]:
+        rollups = fetch_financial_rollups(period_type, refresh=period_type == 'year')
+        print("\n")
+        print(period_type.title().center(60, "-"))
+        print(rollups.to_string(index=False, float_format=lambda value: f"{value:,.2f}"))
@@ -1,4 +1,3 @@
-import statistics
 import logging
 import matplotlib.pyplot as plt
 import matplotlib as mpl
@@ -6,13 +5,21 @@ import mplcursors
 import pandas as pd
 import tkinter as tk
 from tkinter import messagebox, ttk
-from prophet import Prophet
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime
 
-from revenue import revenue
+from financial_rollups import get_yearly_revenue
 from postgresql import get_db_connection
+from forecasting import DEFAULT_BACKEND, prepare_series, run_forecasts
+from forecast_cache import ForecastCache
+from financial_metrics import FinancialMetricsEngine, NUM_EMPLOYEES
+from monthly_numbers_cache import MonthlyNumbersCache
+from rolling_analytics import ROLLING_METRICS, get_rolling_analytics
+from aggregate_queries import SUMMARY_TOTAL_LABEL, fetch_equipment_summary, \
+    fetch_monthly_numbers_summary
+from hourly_rate_simulation import NUM_SCENARIOS, simulate_hourly_rates, summarize_hourly_rates
+from project_forecasting import forecast_project_revenue
 
 
 logger = logging.getLogger(__name__)
@@ -30,105 +37,66 @@ logger = logging.getLogger(__name__)
 # ========================================================================== #
 
 NUM_MONTHS = 12
-WORK_DAYS_IN_MONTH = 20
-DAILY_WORK_HOURS = 10
-PROFIT_MARGIN = 1.35
-NUM_EMPLOYEES = 112
+
+# Options handled by Calculate and by Display Chart. Equipment and Revenue
+# cover all history and ignore the date range.
+CALCULATE_OPTIONS = (
+    "Daily", "Monthly", "Yearly", "Yearly Summary", "Quarterly Summary", "Equipment",
+    "Disposal", "Revenue", "Quickbooks", "Hourly Rate Simulation", "Sales",
+)
+CHART_OPTIONS = (
+    "Monthly", "Yearly", "Equipment", "Disposal", "Revenue", "Quickbooks", "Sales",
+    "Predictions(Matplot)", "Predictions(Plotly)", "Rolling 12 Months",
+    "Project Predictions(Plotly)",
+)
+UNDATED_OPTIONS = {"Equipment", "Revenue"}
+
+NO_MONTHLY_NUMBERS_MESSAGE = "No monthly_numbers records found for the selected date range."
+NO_RESULTS_MESSAGES = {
+    "Equipment": "No equipment data was returned from the equipment table.",
+    "Revenue": "No yearly totals were returned from the financial_rollup table.",
+}
+
+# Fitted forecasts are reused until the underlying monthly numbers change,
+# and refits after a new month are warm-started from the previous model.
+forecast_cache = ForecastCache()
+INCREMENTAL_FORECASTS = True
+
+# The whole monthly_numbers table is kept in memory and sliced per date range.
+monthly_numbers_cache = MonthlyNumbersCache()
 
 # =========================================================================== #
 # ======================== Get Data from PostgreSQL ========================= #
 # =========================================================================== #
 
 def fetch_monthly_numbers_from_postgresql(start_date, end_date):
-    """Fetch monthly financial values between start/end month, inclusive."""
-    start_month = datetime.strptime(start_date, '%Y-%m').strftime('%Y-%m')
-    end_month = datetime.strptime(end_date, '%Y-%m').strftime('%Y-%m')
+    """
+    Return monthly financial values between start/end month, inclusive.
 
-    query = """
-        SELECT
-            year_month,
-            disposalcost AS monthly_disposal_cost,
-            expense AS quickbooks_monthly_expenses,
-            sales AS monthly_sales,
-            payroll AS monthly_payroll
-        FROM monthly_numbers
-        WHERE year_month >= %(start_month)s
-          AND year_month <= %(end_month)s
-        ORDER BY year_month;
+    Served from the whole-table monthly_numbers cache, which only goes to
+    PostgreSQL when the table is first used, gets a new month, or expires.
     """
+    start_month = datetime.strptime(start_date, '%Y-%m').strftime('%Y-%m')
+    end_month = datetime.strptime(end_date, '%Y-%m').strftime('%Y-%m')
 
-    with get_db_connection() as conn:
-        df = pd.read_sql_query(
-            query,
-            conn,
-            params={"start_month": start_month, "end_month": end_month},
-        )
+    df = monthly_numbers_cache.get_range_frame(start_month, end_month)
 
     if df.empty:
         raise ValueError(
             "No monthly_numbers records found for the selected date range."
         )
 
-    df['year_month'] = df['year_month'].astype(str)
-    for col in [
-        'monthly_disposal_cost',
-        'quickbooks_monthly_expenses',
-        'monthly_sales',
-        'monthly_payroll',
-    ]:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
-
     return df
 
 
-def get_monthly_numbers_dicts_by_date_range():
-    """Return monthly financial series dictionaries from PostgreSQL for UI dates."""
-    start_date, end_date = get_required_date_range()
-    df = fetch_monthly_numbers_from_postgresql(start_date, end_date)
-    return {
-        'monthly_disposal_cost': dict(zip(df['year_month'], df['monthly_disposal_cost'])),
-        'quickbooks_monthly_expenses': dict(zip(df['year_month'], df['quickbooks_monthly_expenses'])),
-        'monthly_sales': dict(zip(df['year_month'], df['monthly_sales'])),
-        'monthly_payroll': dict(zip(df['year_month'], df['monthly_payroll'])),
-    }
-
-
-def get_operating_cost_metrics(monthly_data):
-    """Build daily/monthly/yearly operating-cost metrics from DB monthly data."""
-    payroll_values = list(monthly_data['monthly_payroll'].values())
-    expense_values = list(monthly_data['quickbooks_monthly_expenses'].values())
-
-    monthly_payroll_avg = statistics.mean(payroll_values)
-    monthly_expenses_avg = statistics.mean(expense_values)
-    yearly_payroll_total = sum(payroll_values)
-    yearly_expenses_total = sum(expense_values)
+# Metrics are computed once per date range and reused across options until
+# the cached monthly_numbers table is reloaded, so only the first Calculate
+# or Display Chart press for a range reads the table.
+financial_metrics_engine = FinancialMetricsEngine(
+    fetch_monthly_numbers_from_postgresql,
+    data_version=monthly_numbers_cache.refresh_if_stale,
+)
 
-    daily_payroll = monthly_payroll_avg / WORK_DAYS_IN_MONTH
-    daily_expenses = monthly_expenses_avg / WORK_DAYS_IN_MONTH
-    daily_operating_cost = daily_payroll + daily_expenses
-
-    if NUM_EMPLOYEES > 0:
-        daily_operating_cost_per_employee = daily_operating_cost / NUM_EMPLOYEES
-        hourly_rate = round(
-            daily_operating_cost_per_employee / DAILY_WORK_HOURS * PROFIT_MARGIN,
-            2,
-        )
-    else:
-        daily_operating_cost_per_employee = 0.0
-        hourly_rate = 0.0
-
-    return {
-        'daily_payroll': round(daily_payroll, 2),
-        'daily_operating_cost': round(daily_operating_cost, 2),
-        'daily_operating_cost_per_employee': round(daily_operating_cost_per_employee, 2),
-        'hourly_rate': hourly_rate,
-        'monthly_payroll_avg': round(monthly_payroll_avg, 2),
-        'monthly_expenses_avg': round(monthly_expenses_avg, 2),
-        'monthly_operating_cost_avg': round(monthly_payroll_avg + monthly_expenses_avg, 2),
-        'yearly_payroll_total': round(yearly_payroll_total, 2),
-        'yearly_expenses_total': round(yearly_expenses_total, 2),
-        'yearly_operating_cost_total': round(yearly_payroll_total + yearly_expenses_total, 2),
-    }
 
 def get_required_date_range():
     """Read and validate start/end dates from the UI and return both values."""
@@ -143,6 +111,13 @@ def get_required_date_range():
     return start_date, end_date
 
 
+def normalize_month(month):
+    """Return a 'YYYY-M' or 'YYYY-MM' month as zero-padded 'YYYY-MM'; None stays None."""
+    if month is None:
+        return None
+    return datetime.strptime(month, '%Y-%m').strftime('%Y-%m')
+
+
 def get_number_of_months_from_date_range():
     """Return inclusive month count for the validated UI start/end date range."""
     start_date, end_date = get_required_date_range()
@@ -175,107 +150,117 @@ def fetch_equipment_values():
 # ========================================================================== #
 # ======================= Machine Learning with Matplot ==================== #
 # ========================================================================== #
-def predict_and_plot_with_matplot(data_dict, column_name, future_months=3):
+def plot_forecast_with_matplot(data, forecast, column_name, future_months=3):
     """
-    Makes a prediction for the specified number of future months for 
-    Quickbooks expenses, Monthly Payroll, and Disposal cost using the 
-    Prophet model.
-    
+    Build a matplotlib figure of one series and its Prophet forecast.
+
     Parameters:
-    data_dict (dict): Dictionary containing historical data.
+    data (DataFrame): Historical ds/y data that was fitted.
+    forecast (DataFrame): Forecast with 'ds' and 'yhat' columns.
     column_name (str): Name of the column to be used in the plot.
-    future_months (int): Number of future months to predict. Default is 3.
-    
+    future_months (int): Number of predicted months, used in the title.
+
     Returns:
-    None
+    Figure: The matplotlib figure.
     """
-    # Prepare the data
-    data = pd.DataFrame(list(data_dict.items()), columns=['ds', 'y'])
-    data['ds'] = pd.to_datetime(data['ds'])
-
-    # Filter the data to only include the last twelve months
-    data = data.tail(12)
-
-    # Initialize the Prophet model
-    model = Prophet()
-    model.fit(data)
-
-    # Create a dataframe for future dates
-    future = model.make_future_dataframe(periods=future_months, freq='ME')
-    
-    # Predict the future values
-    forecast = model.predict(future)
-
-    # Plot the results
-    plt.figure(figsize=(10, 5))
+    fig, ax = plt.subplots(figsize=(10, 5))
 
     # Plot the previous data (last twelve months)
-    plt.plot(data['ds'], data['y'], 'bo-', label='Previous Data')
+    ax.plot(data['ds'], data['y'], 'bo-', label='Previous Data')
 
     # Plot predicted data (next three months)
-    plt.plot(forecast['ds'], forecast['yhat'], 'ro--', label="Predicted Data")
+    ax.plot(forecast['ds'], forecast['yhat'], 'ro--', label="Predicted Data")
 
     # Add labels and title
-    plt.xlabel('Month')
-    plt.ylabel(column_name)
-    plt.title(f"{column_name}, For Past 12 Months and Predicted Next 3 Months")
+    ax.set_xlabel('Month')
+    ax.set_ylabel(column_name)
+    ax.set_title(f"{column_name}, For Past {len(data)} Months and "
+                 f"Predicted Next {future_months} Months")
     
     # Format the x-axis labels
-    plt.gca().xaxis.set_major_formatter(mpl.dates.DateFormatter('%Y-%m'))
-    plt.gca().xaxis.set_major_locator(mpl.dates.MonthLocator(interval=1))
-    plt.gcf().autofmt_xdate()
+    ax.xaxis.set_major_formatter(mpl.dates.DateFormatter('%Y-%m'))
+    ax.xaxis.set_major_locator(mpl.dates.MonthLocator(interval=1))
+    fig.autofmt_xdate()
 
     # Add legend
-    plt.legend()
+    ax.legend()
 
     # Implement mplcurors for interactive tooltips
-    cursor = mplcursors.cursor(hover=True)
+    cursor = mplcursors.cursor(ax, hover=True)
     cursor.connect("add", lambda sel: sel.annotation.set_text(f"{sel.target[1]:,.0f}"))
 
     # Adjust layout to prevent x-axis labels from going off bottom of the screen
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
 
-    # Show plot
-    plt.show()
+
+def predict_and_plot_with_matplot(data_dicts, column_names, future_months=3,
+                                  backend=DEFAULT_BACKEND):
+    """
+    Makes a prediction for the specified number of future months for 
+    Quickbooks expenses, Monthly Payroll, and Disposal cost using the 
+    Prophet model.
+
+    All series are fitted in parallel worker processes first, then one 
+    figure per series is drawn.
+    
+    Parameters:
+    data_dicts (dict or list of dict): Dictionary (or list of dictionaries) 
+    containing historical data.
+    column_names (str or list of str): Name(s) of the column(s) to be used 
+    in the plot.
+    future_months (int): Number of future months to predict. Default is 3.
+    backend (str): 'prophet' (default) or 'holt_winters'.
+    
+    Returns:
+    list of (str, Figure): Column name and matplotlib figure of each series.
+    """
+    if isinstance(data_dicts, dict):
+        data_dicts, column_names = [data_dicts], [column_names]
+
+    # Filter the data to only include the last twelve months
+    series = [(column_name, prepare_series(data_dict, history_months=12))
+              for data_dict, column_name in zip(data_dicts, column_names)]
+
+    forecasts = run_forecasts(series, future_months, cache=forecast_cache,
+                              warm_start=INCREMENTAL_FORECASTS, backend=backend)
+
+    return [(column_name, plot_forecast_with_matplot(data, forecast, column_name, future_months))
+            for column_name, data, forecast in forecasts]
 
 # ========================================================================== #
 # ======================== Machine Learning using Plotly =================== #
 # ========================================================================== #
-def predict_and_plot_with_plotly(data_dicts, column_names, future_months=3):
+def predict_and_plot_with_plotly(data_dicts, column_names, future_months=3,
+                                 backend=DEFAULT_BACKEND):
     """
     Makes a prediction for the specified number of future months for 
     Quickbooks expenses, Monthly Payroll, and Disposal cost using the 
     Prophet model and plots the results using Plotly.
+
+    All series are fitted in parallel worker processes before the figure 
+    is built.
     
     Parameters:
     data_dicts (list of dict): List of dictionaries containing historical data.
     column_names (list of str): List of column names to be used in the plot.
     future_months (int): Number of future months to predict. Default is 3.
+    backend (str): 'prophet' (default) or 'holt_winters'.
     
     Returns:
-    None
+    Figure: The Plotly figure.
     """
     # fig = make_subplots(rows=3, cols=1, shared_xaxes=False, 
     #                     vertical_spacing=0.1, subplot_titles=column_names)
     fig = make_subplots(rows=len(data_dicts), cols=1, shared_xaxes=False, 
                         vertical_spacing=0.1, subplot_titles=column_names)
 
-    for i, (data_dict, column_name) in enumerate(zip(data_dicts, column_names), 
-                                                 start=1):
-        # Prepare the data
-        data = pd.DataFrame(list(data_dict.items()), columns=['ds', 'y'])
-        data['ds'] = pd.to_datetime(data['ds'])
-
-        # Initialize the Prophet model
-        model = Prophet()
-        model.fit(data)
-
-        # Create a dataframe for future dates
-        future = model.make_future_dataframe(periods=future_months, freq='ME')
-        
-        # Predict the future values
-        forecast = model.predict(future)
+    series = [(column_name, prepare_series(data_dict))
+              for data_dict, column_name in zip(data_dicts, column_names)]
+    forecasts = run_forecasts(series, future_months, cache=forecast_cache,
+                              warm_start=INCREMENTAL_FORECASTS, backend=backend)
 
+    for i, (column_name, data, forecast) in enumerate(forecasts, start=1):
         # Add previous data to the subplot
         fig.add_trace(go.Scatter(x=data['ds'], y=data['y'], mode='lines+markers', 
                                  name=f'Previous Data - {column_name}'), 
@@ -295,9 +280,48 @@ def predict_and_plot_with_plotly(data_dicts, column_names, future_months=3):
                       title_x=0.5,)
     fig.update_xaxes(title_text="Month", tickformat='%Y-%m')
     fig.update_yaxes(title_text="Values")
+    return fig
+
+
+def plot_project_forecasts_with_plotly(forecast_table):
+    """
+    Plots revenue history and forecasts per project type and per estimator.
+
+    Parameters:
+    forecast_table (DataFrame): Tidy table from forecast_project_revenue().
+
+    Returns:
+    Figure: The Plotly figure.
+    """
+    subplot_titles = ["Revenue by Project Type", "Revenue by Estimator"]
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=False, 
+                        vertical_spacing=0.1, subplot_titles=subplot_titles)
+
+    for row, dimension in enumerate(['project_description', 'estimator'], start=1):
+        dimension_rows = forecast_table[forecast_table['dimension'] == dimension]
+        for series_name, series_rows in dimension_rows.groupby('series_name'):
+            history = series_rows[~series_rows['is_forecast']]
+            # Start the dashed line at the last actual month so the two connect
+            predicted = pd.concat([history.tail(1).assign(yhat=history['y'].tail(1)), 
+                                   series_rows[series_rows['is_forecast']]])
+
+            fig.add_trace(go.Scatter(x=history['ds'], y=history['y'], 
+                                     mode='lines+markers', name=series_name,
+                                     legendgroup=series_name), 
+                                     row=row, col=1)
+            fig.add_trace(go.Scatter(x=predicted['ds'], y=predicted['yhat'], 
+                                     mode='lines+markers', 
+                                     name=f'Predicted - {series_name}',
+                                     legendgroup=series_name,
+                                     line=dict(dash='dashdot')), 
+                                     row=row, col=1)
 
-    # Show plot
-    fig.show()
+    fig.update_layout(height=1000, width=2000, 
+                      title_text="Awarded Revenue and Predictions by Project Type and Estimator",
+                      title_x=0.5,)
+    fig.update_xaxes(title_text="Month", tickformat='%Y-%m')
+    fig.update_yaxes(title_text="Revenue")
+    return fig
 
 # ========================================================================== #
 # =========================== Calculate Financials ========================= #
@@ -319,6 +343,170 @@ def display_financials(title, financials):
         print(f"{key} = {value:,.2f}")
 
 
+def get_option_financials(option, start_date=None, end_date=None):
+    """
+    Compute the financial sections of one Calculate option.
+
+    Parameters:
+    option (str): One of CALCULATE_OPTIONS.
+    start_date (str): First month, 'YYYY-MM'. Not used by UNDATED_OPTIONS.
+    end_date (str): Last month, 'YYYY-MM'. Not used by UNDATED_OPTIONS.
+
+    Returns:
+    list of (str, dict): Title and metrics of each section, in display 
+    order. Empty when the source tables have no rows for the option.
+    """
+    if option not in CALCULATE_OPTIONS:
+        raise ValueError(f"{option!r} is not a Calculate option.")
+
+    start_date, end_date = normalize_month(start_date), normalize_month(end_date)
+
+    operating_cost_metrics = None
+    if option in {"Daily", "Monthly", "Yearly", "Disposal", "Quickbooks", "Sales"}:
+        metrics = financial_metrics_engine.get(start_date, end_date)
+        operating_cost_metrics = metrics['operating_cost']
+
+    if option == "Daily":
+        return [("Daily", {
+            "Daily Operating Cost": operating_cost_metrics['daily_operating_cost'],
+            "Daily Operating Cost per Employee": operating_cost_metrics['daily_operating_cost_per_employee'],
+            "Total daily payroll": operating_cost_metrics['daily_payroll'],
+            "Rate per Hour": operating_cost_metrics['hourly_rate'],
+        })]
+
+    if option == "Monthly":
+        return [("Monthly", {
+            "Average monthly payroll": operating_cost_metrics['monthly_payroll_avg'],
+            "Average monthly expenses": operating_cost_metrics['monthly_expenses_avg'],
+            "Average monthly operating cost": operating_cost_metrics['monthly_operating_cost_avg'],
+        })]
+
+    if option == "Yearly":
+        return [("Yearly", {
+            "Total payroll for date range": operating_cost_metrics['yearly_payroll_total'],
+            "Total expenses for date range": operating_cost_metrics['yearly_expenses_total'],
+            "Total operating cost for date range": operating_cost_metrics['yearly_operating_cost_total'],
+        })]
+
+    if option == "Equipment":
+        # Totals are computed in PostgreSQL; only one row per project type comes back
+        equipment_summary = fetch_equipment_summary()
+        overall = equipment_summary[equipment_summary['project_type'] == SUMMARY_TOTAL_LABEL]
+
+        if overall.empty or overall['equipment_count'].iloc[0] == 0:
+            return []
+
+        sections = [
+            (f"Equipment - {row['project_type']}", {
+                "Number of equipment": row['equipment_count'],
+                "Total cost of equipment": row['total_purchase_price'],
+                "Average equipment cost": row['avg_purchase_price'],
+            })
+            for _, row in equipment_summary.iterrows()
+            if row['project_type'] != SUMMARY_TOTAL_LABEL
+        ]
+        sections.append(("Equipment", {
+            "Number of equipment": overall['equipment_count'].iloc[0],
+            "Total cost of all equipment": round(overall['total_purchase_price'].iloc[0]),
+            "Average equipment cost": overall['avg_purchase_price'].iloc[0],
+        }))
+        return sections
+
+    if option in ("Yearly Summary", "Quarterly Summary"):
+        group_by = 'year' if option == "Yearly Summary" else 'quarter'
+        summary = fetch_monthly_numbers_summary(start_date, end_date, group_by)
+
+        if summary.empty or summary['months'].sum() == 0:
+            return []
+
+        return [
+            ("Date Range" if row['period'] == SUMMARY_TOTAL_LABEL else row['period'], {
+                "Months": row['months'],
+                "Total payroll": row['payroll_total'],
+                "Average monthly payroll": row['payroll_avg'],
+                "Total expenses": row['quickbooks_expenses_total'],
+                "Average monthly expenses": row['quickbooks_expenses_avg'],
+                "Total disposal cost": row['disposal_cost_total'],
+                "Average monthly disposal cost": row['disposal_cost_avg'],
+                "Total sales": row['sales_total'],
+                "Average monthly sales": row['sales_avg'],
+            })
+            for _, row in summary.iterrows()
+        ]
+
+    if option == "Disposal":
+        disposal_metrics = metrics['disposal']
+        return [("Disposal", {
+            "Total disposal cost": disposal_metrics['total_disposal_cost'],
+            "The average monthly disposal cost": disposal_metrics['avg_disposal_cost'],
+            "The average daily disposal cost": disposal_metrics['avg_daily_disposal_cost'],
+        })]
+
+    if option == "Revenue":
+        revenue = get_yearly_revenue()
+
+        if not revenue:
+            return []
+
+        total_revenue = sum([year_data["revenue"] for year_data in revenue.values()])
+        total_net_profit = sum([year_data["net profit"] for year_data in revenue.values()])
+        num_employees = NUM_EMPLOYEES
+        num_years = len(revenue)
+        avg_revenue = round(total_revenue / num_years, 2)
+        avg_net_profit = round(total_net_profit / num_years, 2)
+        avg_net_profit_per_employee = round(avg_net_profit / num_employees, 2) if num_employees != 0 else 0
+        avg_profit_margin = round(avg_net_profit / avg_revenue, 2) if avg_revenue != 0 else 0
+        avg_revenue_per_employee = round(avg_revenue / num_employees, 2) if num_employees != 0 else 0
+        return [("Revenue", {
+            "Total revenue": total_revenue,
+            "Total net profit": total_net_profit,
+            "Average revenue": avg_revenue,                
+            "Average revenue per employee": avg_revenue_per_employee,
+            "Average net profit": avg_net_profit,
+            "Average net profit per employee": avg_net_profit_per_employee,
+            "Average profit margin": avg_profit_margin,
+            "Total awarded bids": sum(year_data["awarded bids"] for year_data in revenue.values()),
+            "Total gross profit on awarded bids": sum(year_data["gross profit"] for year_data in revenue.values()),
+        })]
+
+    if option == "Quickbooks":
+        quickbooks_metrics = metrics['quickbooks']
+        return [("Quickbooks", {
+            "Total quickbooks monthly expenses": quickbooks_metrics['total_qb_monthly_expenses'],
+            "Average quickbooks monthly expense": quickbooks_metrics['avg_qb_monthly_expenses'],
+        })]
+
+    if option == "Hourly Rate Simulation":
+        year_months, values = monthly_numbers_cache.get_range(start_date, end_date)
+
+        if len(year_months) == 0:
+            return []
+
+        # Columns: disposal cost, Quickbooks expenses, sales, payroll
+        rates = simulate_hourly_rates(year_months, values[:, 3], values[:, 1])
+        summary = summarize_hourly_rates(rates)
+        financials = {"Mean break-even rate": summary['mean'],
+                      "Standard deviation": summary['std']}
+        for percentile, (break_even_rate, priced_rate) in summary['bands'].items():
+            financials[f"P{percentile} break-even rate"] = break_even_rate
+            financials[f"P{percentile} rate with profit margin"] = priced_rate
+        return [(f"Hourly Rate ({NUM_SCENARIOS:,} Scenarios)", financials)]
+
+    # Sales
+    sales_metrics = metrics['sales']
+    return [("Sales", {
+        "Total monthly sales": sales_metrics['total_monthly_sales'],
+        "Average monthly sales": sales_metrics['avg_monthly_sales'],
+    })]
+
+
+def get_option_date_range(option):
+    """Return the UI date range, or (None, None) for UNDATED_OPTIONS."""
+    if option in UNDATED_OPTIONS:
+        return None, None
+    return get_required_date_range()
+
+
 def calculate_financials():
     """
     Calculate and display various financial metrics based on the selected option.
@@ -328,116 +516,20 @@ def calculate_financials():
     """
     try:
         option = options.get()
-        monthly_data_options = {"Daily", "Monthly", "Yearly", "Disposal", "Quickbooks", "Sales"}
-        monthly_data = None
-        operating_cost_metrics = None
-
-        if option in monthly_data_options:
-            monthly_data = get_monthly_numbers_dicts_by_date_range()
-            operating_cost_metrics = get_operating_cost_metrics(monthly_data)
-
-        if option == "Daily":
-            financials = {
-                "Daily Operating Cost": operating_cost_metrics['daily_operating_cost'],
-                "Daily Operating Cost per Employee": operating_cost_metrics['daily_operating_cost_per_employee'],
-                "Total daily payroll": operating_cost_metrics['daily_payroll'],
-                "Rate per Hour": operating_cost_metrics['hourly_rate'],
-            }
-            display_financials("Daily", financials)
-
-        elif option == "Monthly":
-            financials = {
-                "Average monthly payroll": operating_cost_metrics['monthly_payroll_avg'],
-                "Average monthly expenses": operating_cost_metrics['monthly_expenses_avg'],
-                "Average monthly operating cost": operating_cost_metrics['monthly_operating_cost_avg'],
-            }
-            display_financials("Monthly", financials)
-
-        elif option == "Yearly":
-            financials = {
-                "Total payroll for date range": operating_cost_metrics['yearly_payroll_total'],
-                "Total expenses for date range": operating_cost_metrics['yearly_expenses_total'],
-                "Total operating cost for date range": operating_cost_metrics['yearly_operating_cost_total'],
-            }
-            display_financials("Yearly", financials)
-
-        elif option == "Equipment":
-            equipment_values = fetch_equipment_values()
-
-            if not equipment_values:
-                messagebox.showwarning(
-                    "No Results",
-                    "No equipment data was returned from the equipment table.",
-                )
-                return
-            
-            print("\n")
-            print("Equipment".center(20, "-"))
-            for e, v in equipment_values.items():
-                print(f"{e}: ${v:,.2f}")
-            total_equipment = round(sum(equipment_values.values()))
-            avg_equipment_cost = statistics.mean(equipment_values.values())
-            financials = {
-                "Total cost of all equipment": total_equipment,
-                "Average equipment cost": avg_equipment_cost
-            }
-            display_financials("Equipment", financials)
-
-        elif option == "Disposal":
-            monthly_disposal_cost = monthly_data['monthly_disposal_cost']
-            total_disposal_cost = sum(monthly_disposal_cost.values())
-            avg_disposal_cost = round(statistics.mean(monthly_disposal_cost.values())) 
-            avg_daily_disposal_cost = round(avg_disposal_cost / WORK_DAYS_IN_MONTH)  
-            financials = {
-                "Total disposal cost": total_disposal_cost,
-                "The average monthly disposal cost": avg_disposal_cost,
-                "The average daily disposal cost": avg_daily_disposal_cost,
-            }
-            display_financials("Disposal", financials)
-
-        elif option == "Revenue":
-            total_revenue = sum([year_data["revenue"] for year_data in revenue.values()])
-            total_net_profit = sum([year_data["net profit"] for year_data in revenue.values()])
-            num_employees = NUM_EMPLOYEES
-            num_years = len(revenue)
-            avg_revenue = round(total_revenue / num_years, 2)
-            avg_net_profit = round(total_net_profit / num_years, 2)
-            avg_net_profit_per_employee = round(avg_net_profit / num_employees, 2) if num_employees != 0 else 0
-            avg_profit_margin = round(avg_net_profit / avg_revenue, 2) if avg_revenue != 0 else 0
-            avg_revenue_per_employee = round(avg_revenue / num_employees, 2) if num_employees != 0 else 0
-            financials = {
-                "Total revenue": total_revenue,
-                "Total net profit": total_net_profit,
-                "Average revenue": avg_revenue,                
-                "Average revenue per employee": avg_revenue_per_employee,
-                "Average net profit": avg_net_profit,
-                "Average net profit per employee": avg_net_profit_per_employee,
-                "Average profit margin": avg_profit_margin,
-            }
-            display_financials("Revenue", financials)
-
-        elif option == "Quickbooks":
-            quickbooks_monthly_expenses = monthly_data['quickbooks_monthly_expenses']
-            total_qb_monthly_expenses = round(sum(quickbooks_monthly_expenses.values()), 2)
-            avg_qb_monthly_expenses = round(statistics.mean(quickbooks_monthly_expenses.values()), 2)
-            financials = {
-            "Total quickbooks monthly expenses": total_qb_monthly_expenses,
-            "Average quickbooks monthly expense": avg_qb_monthly_expenses,
-            }
-            display_financials("Quickbooks", financials)
-
-        elif option == "Sales":
-            monthly_sales = monthly_data['monthly_sales']
-            total_monthly_sales = round(sum(monthly_sales.values()), 2)
-            avg_monthly_sales = round(statistics.mean(monthly_sales.values()), 2)
-            financials = {
-                "Total monthly sales": total_monthly_sales,
-                "Average monthly sales": avg_monthly_sales,
-            }
-            display_financials("Sales", financials)
-
-        else:
+
+        if option not in CALCULATE_OPTIONS:
             messagebox.showwarning("No Results", "Please choose a valid option.")
+            return
+
+        start_date, end_date = get_option_date_range(option)
+        sections = get_option_financials(option, start_date, end_date)
+
+        if not sections:
+            messagebox.showwarning("No Results", NO_RESULTS_MESSAGES.get(option, NO_MONTHLY_NUMBERS_MESSAGE))
+            return
+
+        for title, financials in sections:
+            display_financials(title, financials)
 
     except Exception:
         logger.exception("Failed to calculate financial metrics")
@@ -459,13 +551,13 @@ def plot_pie_chart(title, labels, sizes):
     sizes (list): The sizes for the pie chart.
     
     Returns:
-    None
+    Figure: The matplotlib figure.
     """
     fig, ax = plt.subplots(figsize=(6, 6))
     ax.pie(sizes, labels=labels, autopct='%.1f%%')
     ax.set_title(title, fontsize=18)
     ax.axis('equal')
-    plt.show()
+    return fig
 
 
 def plot_bar_chart(title, labels, values, number_of_months=13):
@@ -478,7 +570,7 @@ def plot_bar_chart(title, labels, values, number_of_months=13):
     values (list): The values for the bar chart.
     
     Returns:
-    None
+    Figure: The matplotlib figure.
     """
     # Show only the past number of months
     labels = labels[-number_of_months:]
@@ -499,7 +591,7 @@ def plot_bar_chart(title, labels, values, number_of_months=13):
     cursor = mplcursors.cursor(bars, hover=True)
     cursor.connect("add", lambda sel: sel.annotation.set_text(f'{labels[sel.index]}: {values[sel.index]:,.2f}'))
 
-    plt.show()
+    return fig
 
 
 def plot_line_chart(title, x, y1, y2, label1, label2):
@@ -515,7 +607,7 @@ def plot_line_chart(title, x, y1, y2, label1, label2):
     label2 (str): The label for the second line.
     
     Returns:
-    None
+    Figure: The matplotlib figure.
     """
     # Calculate percent profit
     percent_profit = [(net / rev) * 100 if rev != 0 else 0 for net, rev in zip(y2, y1)]
@@ -571,7 +663,152 @@ def plot_line_chart(title, x, y1, y2, label1, label2):
     plt.subplots_adjust(left=0.1, bottom=0.3)
     plt.tight_layout()
 
-    plt.show()
+    return fig
+
+
+def plot_rolling_chart(title, analytics):
+    """
+    Helper function to plot trailing-twelve-month totals and their 
+    year-over-year change.
+    
+    Parameters:
+    title (str): The title of the chart.
+    analytics (DataFrame): Output of get_rolling_analytics().
+    
+    Returns:
+    Figure: The matplotlib figure.
+    """
+    x = analytics['year_month'].tolist()
+    fig, (ax_ttm, ax_yoy) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+
+    for metric in ROLLING_METRICS:
+        label = metric.replace('_', ' ').title()
+        ttm_line, = ax_ttm.plot(x, analytics[f'ttm_{metric}'], 'o-', label=f'TTM {label}')
+        ax_yoy.plot(x, analytics[f'{metric}_yoy_pct'], 'o--', label=f'{label} YoY %')
+
+        ttm_values = analytics[f'ttm_{metric}'].tolist()
+        cursor = mplcursors.cursor(ttm_line, hover=True)
+        cursor.connect("add", lambda sel, values=ttm_values: sel.annotation.set_text(
+            f'{x[int(sel.index)]}: {values[int(sel.index)]:,.2f}'))
+
+    ax_ttm.set_title(title, fontsize=18)
+    ax_ttm.set_ylabel('Trailing 12 Months')
+    ax_ttm.grid(axis='y', linewidth=0.25)
+    ax_ttm.legend()
+
+    ax_yoy.axhline(0, color='gray', linewidth=0.5)
+    ax_yoy.set_ylabel('Year over Year (%)')
+    ax_yoy.grid(axis='y', linewidth=0.25)
+    ax_yoy.legend()
+    plt.setp(ax_yoy.get_xticklabels(), rotation=45)
+
+    fig.tight_layout()
+    return fig
+
+
+def build_option_charts(option, start_date=None, end_date=None, backend=DEFAULT_BACKEND):
+    """
+    Build the figures of one Display Chart option without showing them.
+
+    Parameters:
+    option (str): One of CHART_OPTIONS.
+    start_date (str): First month, 'YYYY-MM'. Not used by UNDATED_OPTIONS.
+    end_date (str): Last month, 'YYYY-MM'. Not used by UNDATED_OPTIONS.
+    backend (str): Forecasting backend of the prediction charts.
+
+    Returns:
+    list of (str, Figure): Name and matplotlib or Plotly figure of each 
+    chart. Empty when the source tables have no rows for the option.
+    """
+    if option not in CHART_OPTIONS:
+        raise ValueError(f"{option!r} is not a Display Chart option.")
+
+    start_date, end_date = normalize_month(start_date), normalize_month(end_date)
+
+    monthly_data = None
+    operating_cost_metrics = None
+    if option in {'Monthly', 'Yearly', 'Disposal', 'Quickbooks', 'Sales',
+                  'Predictions(Matplot)', 'Predictions(Plotly)'}:
+        metrics = financial_metrics_engine.get(start_date, end_date)
+        monthly_data = metrics['monthly_data']
+        operating_cost_metrics = metrics['operating_cost']
+
+    if option == 'Monthly':
+        labels = ['Payroll', 'Expenses']
+        sizes = [
+            operating_cost_metrics['monthly_payroll_avg'],
+            operating_cost_metrics['monthly_expenses_avg'],
+        ]
+        return [("TDC Monthly Expenses", plot_pie_chart("TDC Monthly Expenses", labels, sizes))]
+
+    if option == 'Yearly':
+        labels = ['Payroll', 'Expenses']
+        sizes = [
+            operating_cost_metrics['yearly_payroll_total'],
+            operating_cost_metrics['yearly_expenses_total'],
+        ]
+        return [("TDC Yearly Expenses", plot_pie_chart("TDC Yearly Expenses", labels, sizes))]
+
+    if option == "Equipment":
+        equipment_values = fetch_equipment_values()
+
+        if not equipment_values:
+            return []
+
+        labels = list(equipment_values.keys())
+        values = list(equipment_values.values())
+        return [("Equipment Values", plot_pie_chart("Equipment Values", labels, values))]
+
+    if option in ('Disposal', 'Quickbooks', 'Sales'):
+        column, title = {
+            'Disposal': ('monthly_disposal_cost', "Disposal Costs"),
+            'Quickbooks': ('quickbooks_monthly_expenses', "Quickbooks Expenses"),
+            'Sales': ('monthly_sales', "Monthly Sales"),
+        }[option]
+        monthly_values = monthly_data[column]
+        title = f"{title} from {start_date} to {end_date}"
+        return [(title, plot_bar_chart(title, 
+                                       list(monthly_values.keys()), 
+                                       list(monthly_values.values()),
+                                       len(monthly_values)))]
+
+    if option == 'Revenue':
+        revenue = get_yearly_revenue()
+
+        if not revenue:
+            return []
+
+        labels = list(revenue.keys())
+        total_revenue = [revenue[year]["revenue"] for year in revenue]
+        net_profit = [revenue[year]["net profit"] for year in revenue]
+        return [("Revenue and Net Profit by Year", 
+                 plot_line_chart("Revenue and Net Profit by Year", labels, 
+                                 total_revenue, net_profit, "Total Revenue", 
+                                 "Net Profit"))]
+
+    if option in ('Predictions(Matplot)', 'Predictions(Plotly)'):
+        # Predict all dictionaries in parallel, then plot each one
+        data_dicts = [monthly_data['quickbooks_monthly_expenses'], monthly_data['monthly_payroll'], 
+                      monthly_data['monthly_disposal_cost'], monthly_data['monthly_sales']]
+        column_names = ['Quickbooks Monthly Expenses', 'Monthly Payroll', 
+                        'Monthly Disposal Cost', 'Monthly Sales']
+        if option == 'Predictions(Matplot)':
+            return predict_and_plot_with_matplot(data_dicts, column_names, backend=backend)
+        return [("Predictions", predict_and_plot_with_plotly(data_dicts, column_names, 
+                                                             backend=backend))]
+
+    if option == 'Rolling 12 Months':
+        analytics = get_rolling_analytics(monthly_numbers_cache, start_date, end_date)
+
+        if analytics.empty:
+            return []
+
+        title = f"Trailing 12 Months from {start_date} to {end_date}"
+        return [(title, plot_rolling_chart(title, analytics))]
+
+    # Project Predictions(Plotly)
+    forecast_table = forecast_project_revenue(start_date, end_date)
+    return [("Project Predictions", plot_project_forecasts_with_plotly(forecast_table))]
 
 
 def display_chart():
@@ -593,124 +830,36 @@ def display_chart():
     - 'Quickbooks': Displays a bar chart of Quickbooks expenses for the past 12 months.
     - 'Predictions(Matplot)': Predicts and plots data for various categories using Matplotlib.
     - 'Predictions(Plotly)': Predicts and plots data for various categories using Plotly.
+    - 'Project Predictions(Plotly)': Predicts awarded revenue per project type 
+    and per estimator using Plotly.
+    - 'Rolling 12 Months': Displays trailing-twelve-month operating cost, 
+    payroll, and sales with their year-over-year change.
 
     Each chart is displayed in a new figure window with appropriate titles and
-    labels. 
+    labels. The figures themselves come from build_option_charts(), which 
+    batch_report.py also uses to save them without a window.
     """
     try:
         option = options.get()
-        monthly_data_options = {
-            'Monthly', 'Yearly', 'Disposal', 'Quickbooks', 'Sales',
-            'Predictions(Matplot)', 'Predictions(Plotly)'
-        }
-        monthly_data = None
-        operating_cost_metrics = None
-
-        if option in monthly_data_options:
-            monthly_data = get_monthly_numbers_dicts_by_date_range()
-            operating_cost_metrics = get_operating_cost_metrics(monthly_data)
-
-        if option == 'Monthly':
-            labels = ['Payroll', 'Expenses']
-            sizes = [
-                operating_cost_metrics['monthly_payroll_avg'],
-                operating_cost_metrics['monthly_expenses_avg'],
-            ]
-            plot_pie_chart("TDC Monthly Expenses", labels, sizes)
-
-        elif option == 'Yearly':
-            labels = ['Payroll', 'Expenses']
-            sizes = [
-                operating_cost_metrics['yearly_payroll_total'],
-                operating_cost_metrics['yearly_expenses_total'],
-            ]
-            plot_pie_chart("TDC Yearly Expenses", labels, sizes)
-
-        elif option == "Equipment":
-            equipment_values = fetch_equipment_values()
-
-            if not equipment_values:
-                messagebox.showwarning(
-                    "No Results",
-                    "No truck data was returned from the trucks table.",
-                )
-                return
-
-            labels = list(equipment_values.keys())
-            values = list(equipment_values.values())
-            plot_pie_chart("Equipment Values", labels, values)
-
-        elif option == 'Disposal':
-            start_date, end_date = get_required_date_range()
-
-            monthly_disposal_cost = monthly_data['monthly_disposal_cost']
-            labels = list(monthly_disposal_cost.keys())
-            values = list(monthly_disposal_cost.values())
-            plot_bar_chart(f"Disposal Costs from {start_date} to {end_date}", 
-                           labels, 
-                           values,
-                           len(monthly_disposal_cost))
-
-        elif option == 'Revenue':
-            labels = list(revenue.keys())
-            total_revenue = [revenue[year]["revenue"] for year in revenue]
-            net_profit = [revenue[year]["net profit"] for year in revenue]
-            plot_line_chart("Revenue and Net Profit by Year", labels, 
-                            total_revenue, net_profit, "Total Revenue", 
-                            "Net Profit")
-
-        elif option == 'Quickbooks':
-            start_date, end_date = get_required_date_range()
-
-            quickbooks_monthly_expenses = monthly_data['quickbooks_monthly_expenses']
-            labels = list(quickbooks_monthly_expenses.keys())
-            values = list(quickbooks_monthly_expenses.values())
-            plot_bar_chart(f"Quickbooks Expenses from {start_date} to {end_date}", 
-                           labels, 
-                           values,
-                           len(quickbooks_monthly_expenses))
-
-        elif option == 'Sales':
-            start_date, end_date = get_required_date_range()
-
-            monthly_sales = monthly_data['monthly_sales']
-            labels = list(monthly_sales.keys())
-            values = list(monthly_sales.values())
-            plot_bar_chart(f"Monthly Sales from {start_date} to {end_date}", 
-                           labels, 
-                           values,
-                           len(monthly_sales))
-
-        elif option == 'Predictions(Matplot)':
-            quickbooks_monthly_expenses = monthly_data['quickbooks_monthly_expenses']
-            monthly_payroll = monthly_data['monthly_payroll']
-            monthly_disposal_cost = monthly_data['monthly_disposal_cost']
-            monthly_sales = monthly_data['monthly_sales']
-            # Predict and plot for each dictionary
-            predict_and_plot_with_matplot(quickbooks_monthly_expenses, 
-                                          'Quickbooks Monthly Expenses')
-            predict_and_plot_with_matplot(monthly_payroll, 
-                                          'Monthly Payroll')
-            predict_and_plot_with_matplot(monthly_disposal_cost, 
-                                          'Monthly Disposal Cost')
-            predict_and_plot_with_matplot(monthly_sales,
-                                          'Monthly Sales')
-
-        elif option == 'Predictions(Plotly)':
-            quickbooks_monthly_expenses = monthly_data['quickbooks_monthly_expenses']
-            monthly_payroll = monthly_data['monthly_payroll']
-            monthly_disposal_cost = monthly_data['monthly_disposal_cost']
-            monthly_sales = monthly_data['monthly_sales']
-            # Predict and plot for each dictionary
-            data_dicts = [quickbooks_monthly_expenses, monthly_payroll, 
-                          monthly_disposal_cost, monthly_sales]
-            column_names = ['Quickbooks Monthly Expenses', 'Monthly Payroll', 
-                            'Monthly Disposal Cost', 'Monthly Sales']
-            predict_and_plot_with_plotly(data_dicts, column_names)
-
-        else:
+
+        if option not in CHART_OPTIONS:
             messagebox.showwarning("No Results", 
                     "Sorry, we do not have a chart for that option to display.")
+            return
+
+        start_date, end_date = get_option_date_range(option)
+        charts = build_option_charts(option, start_date, end_date)
+
+        if not charts:
+            messagebox.showwarning("No Results", NO_RESULTS_MESSAGES.get(option, NO_MONTHLY_NUMBERS_MESSAGE))
+            return
+
+        # Plotly figures open in the browser; matplotlib figures share one show()
+        for _, fig in charts:
+            if isinstance(fig, go.Figure):
+                fig.show()
+        if any(not isinstance(fig, go.Figure) for _, fig in charts):
+            plt.show()
             
     except Exception:
         logger.exception("Failed to generate chart")
@@ -744,6 +893,8 @@ if __name__=="__main__":
                                 "Daily", 
                                 "Monthly", 
                                 "Yearly", 
+                                "Yearly Summary",
+                                "Quarterly Summary",
                                 "Trucks", 
                                 "Equipment", 
                                 "Disposal",
@@ -752,6 +903,9 @@ if __name__=="__main__":
                                 "Sales",
                                 "Predictions(Matplot)",
                                 "Predictions(Plotly)",
+                                "Project Predictions(Plotly)",
+                                "Rolling 12 Months",
+                                "Hourly Rate Simulation",
                                     ]
                                 )
 
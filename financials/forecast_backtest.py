@@ -0,0 +1,195 @@
+import argparse
+import logging
+import os
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from postgresql import get_db_connection
+from forecasting import FORECAST_BACKENDS
+from forecast_benchmark import BACKEND_FITTERS, load_monthly_series, \
+    mean_absolute_percentage_error, monthly_numbers_to_series
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Rolling-origin backtest of the forecasting backends on monthly_numbers.
+#
+# For every column, backend, and horizon, the forecast origin walks forward
+# one month at a time: fit on every month up to the origin, predict the
+# next `horizon` months, and score against what actually happened. Each
+# fold runs in a worker process and records its wall time, peak Python
+# memory, MAE, and MAPE. All folds are written to one CSV so a forecaster
+# change can be judged on speed and accuracy together.
+#
+# Usage (from the financials directory):
+#   python forecast_backtest.py
+#   python forecast_backtest.py --csv ../data/monthly_numbers_sample_data_(2026-08-01).csv
+#   python forecast_backtest.py --horizons 1 3 6 --min-train 12 --output backtest.csv
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+DEFAULT_HORIZONS = (1, 3, 6)
+DEFAULT_MIN_TRAIN_MONTHS = 6
+RESULTS_FILE = "forecast_backtest_results.csv"
+RESULT_COLUMNS = ["backend", "column", "horizon", "origin", "train_months",
+                  "fit_predict_seconds", "peak_memory_mb", "mae", "mape"]
+
+
+def fetch_monthly_numbers():
+    """Fetch every monthly_numbers row, oldest month first."""
+    query = """
+        SELECT year_month, disposalcost, expense, sales, payroll
+        FROM monthly_numbers
+        ORDER BY year_month;
+    """
+    with get_db_connection() as conn:
+        monthly_numbers = pd.read_sql_query(query, conn)
+
+    for column in ["disposalcost", "expense", "sales", "payroll"]:
+        monthly_numbers[column] = pd.to_numeric(monthly_numbers[column],
+                                                errors="coerce").fillna(0.0)
+    return monthly_numbers
+
+
+def build_folds(series_by_column, horizons=DEFAULT_HORIZONS,
+                min_train_months=DEFAULT_MIN_TRAIN_MONTHS, backends=FORECAST_BACKENDS):
+    """
+    List every (backend, column, horizon, origin) fold to evaluate.
+
+    origin is the number of months fitted; the fold predicts months
+    origin .. origin + horizon - 1.
+    """
+    return [
+        (backend, column, horizon, origin)
+        for column, data in series_by_column.items()
+        for horizon in horizons
+        for origin in range(min_train_months, len(data) - horizon + 1)
+        for backend in backends
+    ]
+
+
+def run_fold(backend, column, data, horizon, origin):
+    """
+    Fit one backend on the first `origin` months and score the next `horizon`.
+
+    Peak memory is measured with tracemalloc, so it covers Python and numpy
+    allocations in this worker but not the separate cmdstan process Prophet
+    launches for its optimization.
+
+    Returns:
+    dict: One results row with RESULT_COLUMNS.
+    """
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    train = data.iloc[:origin]
+    actual = data["y"].iloc[origin:origin + horizon].to_numpy(dtype=float)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    forecast = BACKEND_FITTERS[backend](train, horizon)
+    elapsed = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    predicted = forecast["yhat"].tail(horizon).to_numpy(dtype=float)
+    return {
+        "backend": backend,
+        "column": column,
+        "horizon": horizon,
+        "origin": str(data["ds"].iloc[origin - 1].strftime("%Y-%m")),
+        "train_months": origin,
+        "fit_predict_seconds": elapsed,
+        "peak_memory_mb": peak_bytes / 1024 ** 2,
+        "mae": float(np.mean(np.abs(actual - predicted))),
+        "mape": mean_absolute_percentage_error(actual, predicted),
+    }
+
+
+def run_backtest(series_by_column, horizons=DEFAULT_HORIZONS,
+                 min_train_months=DEFAULT_MIN_TRAIN_MONTHS, backends=FORECAST_BACKENDS,
+                 max_workers=None):
+    """
+    Run every fold in a process pool.
+
+    Parameters:
+    series_by_column (dict): Column name -> ds/y DataFrame.
+    horizons (iterable of int): Months ahead to forecast.
+    min_train_months (int): Months fitted at the first origin.
+    backends (iterable of str): Backends to compare.
+    max_workers (int, optional): Worker process limit. Defaults to the CPU
+    count.
+
+    Returns:
+    DataFrame: One row per fold with RESULT_COLUMNS.
+    """
+    folds = build_folds(series_by_column, horizons, min_train_months, backends)
+    if not folds:
+        logger.warning("Not enough history for a %d-month minimum training window",
+                       min_train_months)
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers <= 1:
+        records = [run_fold(backend, column, series_by_column[column], horizon, origin)
+                   for backend, column, horizon, origin in folds]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_fold, backend, column, series_by_column[column],
+                                       horizon, origin)
+                       for backend, column, horizon, origin in folds]
+            records = [future.result() for future in futures]
+
+    return pd.DataFrame(records, columns=RESULT_COLUMNS)
+
+
+def summarize_backtest(results):
+    """Average time, memory, and error per backend and horizon."""
+    return results.groupby(["backend", "horizon"]).agg(
+        folds=("mae", "size"),
+        mean_seconds=("fit_predict_seconds", "mean"),
+        peak_memory_mb=("peak_memory_mb", "max"),
+        mae=("mae", "mean"),
+        mape=("mape", "mean"),
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Rolling-origin backtest of forecast backends.")
+    parser.add_argument("--csv", help="Read monthly_numbers from this CSV instead of PostgreSQL.")
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(DEFAULT_HORIZONS),
+                        help="Months ahead to forecast.")
+    parser.add_argument("--min-train", type=int, default=DEFAULT_MIN_TRAIN_MONTHS,
+                        help="Months fitted at the first forecast origin.")
+    parser.add_argument("--backends", nargs="+", choices=FORECAST_BACKENDS,
+                        default=list(FORECAST_BACKENDS), help="Backends to compare.")
+    parser.add_argument("--workers", type=int, help="Worker processes for the folds.")
+    parser.add_argument("--output", default=RESULTS_FILE, help="Results CSV file.")
+    args = parser.parse_args()
+
+    if args.csv:
+        series_by_column = load_monthly_series(args.csv)
+    else:
+        series_by_column = monthly_numbers_to_series(fetch_monthly_numbers())
+
+    results = run_backtest(series_by_column, args.horizons, args.min_train, args.backends,
+                           args.workers)
+    results.to_csv(args.output, index=False)
+
+    print("\n")
+    print("Backtest Summary".center(60, "-"))
+    print(summarize_backtest(results).to_string(float_format=lambda value: f"{value:,.4f}"))
+    print(f"\n{len(results)} folds saved to {args.output}")
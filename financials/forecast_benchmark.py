@@ -0,0 +1,119 @@
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from forecasting import FORECAST_BACKENDS, fit_holt_winters_forecast, fit_prophet_forecast
+
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Compares the forecasting backends on monthly_numbers data.
+#
+# The last --holdout months of each column are hidden, each backend is
+# fitted on the rest, and the fit time and MAPE on the hidden months are
+# reported. No cache is used, so every run is a cold fit.
+#
+# Usage (from the financials directory):
+#   python forecast_benchmark.py
+#   python forecast_benchmark.py --csv ../data/monthly_numbers_sample_data_(2026-08-01).csv
+#   python forecast_benchmark.py --holdout 6 --repeat 5
+# ========================================================================== #
+
+SAMPLE_CSV = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data",
+    "monthly_numbers_sample_data_(2026-08-01).csv",
+)
+BACKEND_FITTERS = {
+    "prophet": fit_prophet_forecast,
+    "holt_winters": fit_holt_winters_forecast,
+}
+
+
+def load_monthly_series(csv_path):
+    """Read a monthly_numbers export into {column: ds/y DataFrame}."""
+    return monthly_numbers_to_series(pd.read_csv(csv_path))
+
+
+def monthly_numbers_to_series(monthly_numbers):
+    """Split monthly_numbers rows into {column: ds/y DataFrame}, oldest month first."""
+    monthly_numbers = monthly_numbers.sort_values("year_month")
+    dates = pd.to_datetime(monthly_numbers["year_month"].astype(str))
+    return {
+        column: pd.DataFrame({"ds": dates, "y": monthly_numbers[column].astype(float)})
+        .reset_index(drop=True)
+        for column in monthly_numbers.columns if column != "year_month"
+    }
+
+
+def mean_absolute_percentage_error(actual, predicted):
+    """MAPE in percent, ignoring months where the actual value is zero."""
+    actual, predicted = np.asarray(actual, dtype=float), np.asarray(predicted, dtype=float)
+    nonzero = actual != 0
+    if not nonzero.any():
+        return float("nan")
+    return float(np.mean(np.abs((actual[nonzero] - predicted[nonzero]) / actual[nonzero])) * 100)
+
+
+def benchmark_backends(series_by_column, holdout=3, repeat=1, backends=FORECAST_BACKENDS):
+    """
+    Fit every backend on every column and score it on the held-out months.
+
+    Parameters:
+    series_by_column (dict): Column name -> ds/y DataFrame.
+    holdout (int): Number of trailing months to predict.
+    repeat (int): Fits per backend and column; the fastest time is kept.
+    backends (iterable of str): Backends to compare.
+
+    Returns:
+    DataFrame: backend, column, train_months, fit_seconds, and mape rows.
+    """
+    records = []
+    for column, data in series_by_column.items():
+        train, test = data.iloc[:-holdout], data.iloc[-holdout:]
+
+        for backend in backends:
+            fit_forecast = BACKEND_FITTERS[backend]
+            fit_times = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                forecast = fit_forecast(train, holdout)
+                fit_times.append(time.perf_counter() - started)
+
+            records.append({
+                "backend": backend,
+                "column": column,
+                "train_months": len(train),
+                "fit_seconds": min(fit_times),
+                "mape": mean_absolute_percentage_error(test["y"], forecast["yhat"].tail(holdout)),
+            })
+
+    return pd.DataFrame(records)
+
+
+if __name__ == "__main__":
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Compare forecast backend speed and accuracy.")
+    parser.add_argument("--csv", default=SAMPLE_CSV, help="monthly_numbers CSV export.")
+    parser.add_argument("--holdout", type=int, default=3, help="Trailing months to predict.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fits per backend and column.")
+    args = parser.parse_args()
+
+    results = benchmark_backends(load_monthly_series(args.csv), args.holdout, args.repeat)
+
+    print("\n")
+    print("Per Column".center(60, "-"))
+    print(results.to_string(index=False, float_format=lambda value: f"{value:,.4f}"))
+
+    print("\n")
+    print("Summary".center(60, "-"))
+    summary = results.groupby("backend").agg(
+        total_fit_seconds=("fit_seconds", "sum"),
+        mean_mape=("mape", "mean"),
+    )
+    print(summary.to_string(float_format=lambda value: f"{value:,.4f}"))
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import os
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# On-disk cache of fitted forecasts.
+#
+# Entries are keyed by a hash of the series values, its date range, the
+# forecast horizon, and the model settings, so a new month only misses the
+# cache for the series whose data actually changed. Each entry holds the
+# forecast frame as CSV and the serialized Prophet model as JSON. The least
+# recently used entries are removed once the cache grows past max_entries.
+#
+# The most recent model for each named series is also kept, so the next
+# refit of that series can be warm-started from it.
+# ========================================================================== #
+
+FORECAST_CACHE_DIR = os.getenv(
+    "FORECAST_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".demolition_estimating", "forecast_cache"),
+)
+MAX_CACHE_ENTRIES = 200
+
+
+def make_forecast_key(data, future_months, settings=None, backend="prophet"):
+    """
+    Hash a series and its forecast options into a cache key.
+
+    Parameters:
+    data (DataFrame): Prophet ds/y frame that will be fitted.
+    future_months (int): Forecast horizon in months.
+    settings (dict, optional): Model settings passed to the forecaster.
+    backend (str): Forecasting backend name.
+
+    Returns:
+    str: Hex digest identifying this exact fit.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(
+        {"backend": backend, "future_months": future_months, "settings": settings or {}},
+        sort_keys=True,
+        default=str,
+    ).encode("utf-8"))
+    digest.update(pd.to_datetime(data["ds"]).to_numpy("datetime64[ns]").tobytes())
+    digest.update(data["y"].to_numpy(dtype="float64").tobytes())
+    return digest.hexdigest()
+
+
+class ForecastCache:
+    """
+    Least-recently-used forecast cache stored in a directory on disk.
+
+    Attributes:
+    - cache_dir (str): Directory holding the cached entries.
+    - max_entries (int): Number of entries kept before evicting the oldest.
+    """
+    def __init__(self, cache_dir=FORECAST_CACHE_DIR, max_entries=MAX_CACHE_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def _forecast_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.forecast.csv")
+
+    def _model_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.model.json")
+
+    def _latest_model_path(self, series_name, settings=None):
+        digest = hashlib.sha256(json.dumps(
+            {"series": series_name, "settings": settings or {}}, sort_keys=True, default=str
+        ).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.latest.json")
+
+    def get(self, key):
+        """
+        Return (forecast, model_json) for a key, or None on a cache miss.
+
+        A hit refreshes the entry's access time for LRU eviction. model_json
+        is None when the entry was stored without a model.
+        """
+        forecast_path = self._forecast_path(key)
+        if not os.path.exists(forecast_path):
+            return None
+
+        try:
+            forecast = pd.read_csv(forecast_path, parse_dates=["ds"])
+            model_json = None
+            if os.path.exists(self._model_path(key)):
+                with open(self._model_path(key), "r", encoding="utf-8") as model_file:
+                    model_json = model_file.read()
+            os.utime(forecast_path)
+        except (OSError, ValueError):
+            logger.warning("Discarding unreadable forecast cache entry %s", key)
+            self.remove(key)
+            return None
+
+        return forecast, model_json
+
+    def put(self, key, forecast, model_json=None):
+        """Store a forecast frame (and optional serialized model) under a key."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write to temporary files first so a reader never sees a partial entry.
+        if model_json is not None:
+            temp_model_path = f"{self._model_path(key)}.tmp"
+            with open(temp_model_path, "w", encoding="utf-8") as model_file:
+                model_file.write(model_json)
+            os.replace(temp_model_path, self._model_path(key))
+
+        temp_forecast_path = f"{self._forecast_path(key)}.tmp"
+        forecast.to_csv(temp_forecast_path, index=False)
+        os.replace(temp_forecast_path, self._forecast_path(key))
+
+        self.evict()
+
+    def get_latest_model(self, series_name, settings=None):
+        """Return the last serialized model stored for a series, or None."""
+        latest_path = self._latest_model_path(series_name, settings)
+        if not os.path.exists(latest_path):
+            return None
+        try:
+            with open(latest_path, "r", encoding="utf-8") as model_file:
+                return model_file.read()
+        except OSError:
+            return None
+
+    def put_latest_model(self, series_name, model_json, settings=None):
+        """Remember the most recent fitted model for a series."""
+        if model_json is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        latest_path = self._latest_model_path(series_name, settings)
+        with open(f"{latest_path}.tmp", "w", encoding="utf-8") as model_file:
+            model_file.write(model_json)
+        os.replace(f"{latest_path}.tmp", latest_path)
+
+    def remove(self, key):
+        """Delete a single cache entry."""
+        for path in (self._forecast_path(key), self._model_path(key)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def evict(self):
+        """Remove the least recently used entries beyond max_entries."""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        entries = [
+            (os.path.getmtime(os.path.join(self.cache_dir, file_name)),
+             file_name[:-len(".forecast.csv")])
+            for file_name in os.listdir(self.cache_dir)
+            if file_name.endswith(".forecast.csv")
+        ]
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, key in entries[:len(entries) - self.max_entries]:
+            self.remove(key)
+
+    def clear(self):
+        """Remove every cache entry."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith((".forecast.csv", ".model.json", ".latest.json")):
+                os.remove(os.path.join(self.cache_dir, file_name))
@@ -0,0 +1,263 @@
+import os
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+from prophet.serialize import model_from_json, model_to_json
+
+from forecast_cache import make_forecast_key
+from holt_winters import fit_holt_winters
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Forecast runner for the monthly financial series in financials_main.py.
+#
+# Prophet fits are CPU-bound Stan optimizations, so threads do not help.
+# run_forecasts() fits every series in its own worker process and returns
+# the forecasts once they are all done, leaving the charting to the caller.
+# Given a ForecastCache, series whose data has not changed are served from
+# disk and only the rest are refitted. With warm_start=True, each refit is
+# initialized from the Stan parameters of that series' last fitted model.
+#
+# backend='holt_winters' swaps Prophet for the numpy model in
+# holt_winters.py, which fits in milliseconds and needs no worker processes.
+# ========================================================================== #
+
+DEFAULT_FUTURE_MONTHS = 3
+PROPHET_SETTINGS = {}
+FORECAST_BACKENDS = ('prophet', 'holt_winters')
+DEFAULT_BACKEND = 'prophet'
+FORECAST_COLUMNS = ['ds', 'yhat', 'yhat_lower', 'yhat_upper']
+
+
+def prepare_series(data_dict, history_months=None):
+    """
+    Convert a {year_month: value} dictionary into a Prophet ds/y DataFrame.
+
+    Parameters:
+    data_dict (dict): Monthly values keyed by 'YYYY-MM'.
+    history_months (int, optional): Keep only the most recent months.
+
+    Returns:
+    DataFrame: Columns 'ds' (datetime) and 'y'.
+    """
+    data = pd.DataFrame(list(data_dict.items()), columns=['ds', 'y'])
+    data['ds'] = pd.to_datetime(data['ds'])
+    if history_months:
+        data = data.tail(history_months)
+    return data.reset_index(drop=True)
+
+
+def warm_start_params(model_json, data, settings=None):
+    """
+    Build a Prophet `init` dictionary from a previously fitted model.
+
+    The changepoint vector is resized to the number of changepoints Prophet
+    will place on the new history, since that grows with the series.
+
+    Parameters:
+    model_json (str): Model serialized with model_to_json.
+    data (DataFrame): The ds/y frame about to be fitted.
+    settings (dict, optional): Keyword arguments for Prophet().
+
+    Returns:
+    dict: Initial values for k, m, sigma_obs, delta, and beta.
+    """
+    settings = PROPHET_SETTINGS if settings is None else settings
+    previous_model = model_from_json(model_json)
+
+    init = {name: float(previous_model.params[name][0][0]) for name in ['k', 'm', 'sigma_obs']}
+    init['beta'] = np.asarray(previous_model.params['beta'][0], dtype=float)
+
+    delta = np.asarray(previous_model.params['delta'][0], dtype=float)
+    history_size = int(np.floor(len(data) * settings.get('changepoint_range', 0.8)))
+    num_changepoints = max(min(settings.get('n_changepoints', 25), history_size - 1), 1)
+    init['delta'] = np.pad(delta, (0, max(num_changepoints - len(delta), 0)))[:num_changepoints]
+    return init
+
+
+def _fit_is_valid(model, forecast):
+    """Return False when an optimization produced non-finite parameters or predictions."""
+    params_finite = all(np.all(np.isfinite(model.params[name]))
+                        for name in ['k', 'm', 'delta', 'beta', 'sigma_obs'])
+    return params_finite and bool(np.all(np.isfinite(forecast['yhat'])))
+
+
+def fit_prophet_forecast(data, future_months=DEFAULT_FUTURE_MONTHS, settings=None,
+                         return_model_json=False, init_model_json=None):
+    """
+    Fit Prophet on one series and predict the history plus future months.
+
+    Parameters:
+    data (DataFrame): Prophet ds/y frame.
+    future_months (int): Number of future months to predict.
+    settings (dict, optional): Keyword arguments for Prophet(). Defaults to
+    PROPHET_SETTINGS.
+    return_model_json (bool): Also return the fitted model serialized with 
+    prophet.serialize.model_to_json.
+    init_model_json (str, optional): A previous fit of the same series. Its
+    parameters seed the optimizer; a cold fit is run if that fails or 
+    diverges.
+
+    Returns:
+    DataFrame: ds, yhat, yhat_lower, and yhat_upper for every month, or a
+    (forecast, model_json) tuple when return_model_json is True.
+    """
+    settings = PROPHET_SETTINGS if settings is None else settings
+    model = forecast = None
+
+    if init_model_json is not None:
+        try:
+            model = Prophet(**settings)
+            model.fit(data, init=warm_start_params(init_model_json, data, settings))
+            forecast = model.predict(
+                model.make_future_dataframe(periods=future_months, freq='ME')
+            )[FORECAST_COLUMNS]
+            if not _fit_is_valid(model, forecast):
+                raise ValueError("Warm-started fit produced non-finite values.")
+        except Exception:
+            logger.warning("Warm-started Prophet fit failed; refitting from a cold start",
+                           exc_info=True)
+            model = forecast = None
+
+    if model is None:
+        model = Prophet(**settings)
+        model.fit(data)
+
+        future = model.make_future_dataframe(periods=future_months, freq='ME')
+        forecast = model.predict(future)[FORECAST_COLUMNS]
+
+    if return_model_json:
+        return forecast, model_to_json(model)
+    return forecast
+
+
+def future_month_dates(last_date, future_months):
+    """Return the month-end dates Prophet's make_future_dataframe(freq='ME') would add."""
+    dates = pd.date_range(start=last_date, periods=future_months + 1, freq='ME')
+    return dates[dates > last_date][:future_months]
+
+
+def fit_holt_winters_forecast(data, future_months=DEFAULT_FUTURE_MONTHS, settings=None,
+                              return_model_json=False):
+    """
+    Fit the numpy Holt-Winters model on one series.
+
+    Takes the same arguments and returns the same frame as
+    fit_prophet_forecast(), so the charts do not depend on the backend.
+
+    Parameters:
+    data (DataFrame): Prophet ds/y frame.
+    future_months (int): Number of future months to predict.
+    settings (dict, optional): Keyword arguments for fit_holt_winters(),
+    such as season_length.
+    return_model_json (bool): Also return the chosen smoothing parameters as
+    a JSON string.
+
+    Returns:
+    DataFrame: ds, yhat, yhat_lower, and yhat_upper for every month, or a
+    (forecast, model_json) tuple when return_model_json is True.
+    """
+    fit = fit_holt_winters(data['y'].to_numpy(dtype=float), future_months, **(settings or {}))
+    history_margin = fit['upper'][0] - fit['forecast'][0] if future_months else 0.0
+
+    forecast = pd.DataFrame({
+        'ds': list(data['ds']) + list(future_month_dates(data['ds'].iloc[-1], future_months)),
+        'yhat': np.concatenate([fit['fitted'], fit['forecast']]),
+        'yhat_lower': np.concatenate([fit['fitted'] - history_margin, fit['lower']]),
+        'yhat_upper': np.concatenate([fit['fitted'] + history_margin, fit['upper']]),
+    })
+
+    if return_model_json:
+        parameters = {name: float(fit[name]) for name in ['alpha', 'beta', 'gamma', 'phi', 'sigma']}
+        return forecast, json.dumps(parameters)
+    return forecast
+
+
+def run_forecasts(series, future_months=DEFAULT_FUTURE_MONTHS, max_workers=None, cache=None,
+                  settings=None, warm_start=False, backend=DEFAULT_BACKEND):
+    """
+    Fit every series concurrently in a process pool.
+
+    Parameters:
+    series (list of tuple): (column_name, data) pairs, where data is a
+    Prophet ds/y DataFrame from prepare_series().
+    future_months (int): Number of future months to predict.
+    max_workers (int, optional): Worker process limit. Defaults to one
+    process per series that needs fitting, capped at the CPU count.
+    cache (ForecastCache, optional): Cache to read from and store into.
+    settings (dict, optional): Keyword arguments for Prophet().
+    warm_start (bool): Seed each refit with the last model the cache holds
+    for that series name. Requires a cache and the Prophet backend.
+    backend (str): 'prophet' or 'holt_winters'.
+
+    Returns:
+    list of tuple: (column_name, data, forecast) in the same order as the
+    input series.
+    """
+    if backend not in FORECAST_BACKENDS:
+        raise ValueError(f"Unknown forecast backend '{backend}'.")
+
+    if backend == 'prophet':
+        settings = PROPHET_SETTINGS if settings is None else settings
+    forecasts = [None] * len(series)
+    keys = [None] * len(series)
+
+    if cache is not None:
+        for index, (_, data) in enumerate(series):
+            keys[index] = make_forecast_key(data, future_months, settings, backend)
+            cached = cache.get(keys[index])
+            if cached is not None:
+                forecasts[index] = cached[0]
+
+    pending = [index for index, forecast in enumerate(forecasts) if forecast is None]
+    if pending and backend == 'holt_winters':
+        # Each fit takes milliseconds, so there is nothing to gain from workers.
+        for index in pending:
+            forecast, model_json = fit_holt_winters_forecast(series[index][1], future_months,
+                                                             settings, return_model_json=True)
+            forecasts[index] = forecast
+            if cache is not None:
+                cache.put(keys[index], forecast, model_json)
+    elif pending:
+        init_models = [None] * len(pending)
+        if warm_start and cache is not None:
+            init_models = [cache.get_latest_model(series[index][0], settings) for index in pending]
+
+        for index, (forecast, model_json) in zip(
+            pending, fit_in_process_pool([series[index][1] for index in pending],
+                                         future_months, settings, max_workers, init_models)
+        ):
+            forecasts[index] = forecast
+            if cache is not None:
+                cache.put(keys[index], forecast, model_json)
+                cache.put_latest_model(series[index][0], model_json, settings)
+
+    return [(column_name, data, forecast)
+            for (column_name, data), forecast in zip(series, forecasts)]
+
+
+def fit_in_process_pool(datasets, future_months, settings, max_workers=None, init_models=None):
+    """Fit Prophet on each dataset in parallel and return (forecast, model_json) pairs."""
+    if init_models is None:
+        init_models = [None] * len(datasets)
+    if max_workers is None:
+        max_workers = min(len(datasets), os.cpu_count() or 1)
+
+    # Skip the process start-up cost when there is nothing to run in parallel.
+    if max_workers <= 1 or len(datasets) == 1:
+        return [fit_prophet_forecast(data, future_months, settings, True, init_model_json)
+                for data, init_model_json in zip(datasets, init_models)]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fit_prophet_forecast, data, future_months, settings, True,
+                                   init_model_json)
+                   for data, init_model_json in zip(datasets, init_models)]
+        return [future.result() for future in futures]
@@ -0,0 +1,182 @@
+import numpy as np
+
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Pure-numpy Holt-Winters forecaster (ETS with additive errors, damped
+# additive trend, and additive seasonality).
+#
+# Monthly series here are 12 to 60 points long, so instead of a numerical
+# optimizer every combination in a small smoothing-parameter grid is run at
+# once: the recursion loops over months, but each step updates a
+# (series x grid) array. The grid point with the lowest one-step-ahead
+# squared error is kept for each series. Several series of the same length
+# can be fitted together by stacking them as rows.
+#
+# Seasonality is only used when there are at least two full seasons of
+# history; shorter series fall back to a damped trend.
+# ========================================================================== #
+
+SEASON_LENGTH = 12
+
+# z-score of an 80% prediction interval, matching Prophet's default
+# interval_width so both backends draw comparable bands.
+INTERVAL_Z = 1.2816
+
+ALPHA_GRID = np.linspace(0.05, 0.95, 10)
+# The trend and seasonal rates are searched as fractions of their admissible
+# range: beta = alpha * beta_fraction and gamma = (1 - alpha) * gamma_fraction.
+BETA_FRACTION_GRID = np.array([0.0, 0.05, 0.1, 0.2, 0.4])
+GAMMA_FRACTION_GRID = np.array([0.0, 0.1, 0.2, 0.35, 0.5])
+PHI_GRID = np.array([0.8, 0.9, 0.95, 0.98])
+
+
+def _parameter_grid(seasonal):
+    """Return flat alpha, beta, gamma, and phi arrays for every grid point."""
+    gamma_fractions = GAMMA_FRACTION_GRID if seasonal else np.array([0.0])
+    alpha, beta_fraction, gamma_fraction, phi = (
+        grid.ravel() for grid in np.meshgrid(ALPHA_GRID, BETA_FRACTION_GRID,
+                                             gamma_fractions, PHI_GRID, indexing="ij")
+    )
+    return alpha, alpha * beta_fraction, (1 - alpha) * gamma_fraction, phi
+
+
+def _initial_states(values, season_length):
+    """
+    Estimate the starting level, trend, and seasonal indices of each row.
+
+    Returns:
+    tuple: level (S,), trend (S,), and season (S, season_length) arrays.
+    """
+    num_points = values.shape[1]
+
+    if season_length > 1:
+        first_season = values[:, :season_length].mean(axis=1)
+        second_season = values[:, season_length:2 * season_length].mean(axis=1)
+        trend = (second_season - first_season) / season_length
+        season = values[:, :season_length] - first_season[:, None]
+        return first_season, trend, season
+
+    trend_points = min(num_points, 4)
+    if trend_points > 1:
+        trend = (values[:, trend_points - 1] - values[:, 0]) / (trend_points - 1)
+    else:
+        trend = np.zeros(values.shape[0])
+    return values[:, 0].copy(), trend, np.zeros((values.shape[0], 1))
+
+
+def _run_recursion(values, alpha, beta, gamma, phi, level, trend, season, keep_fitted=False):
+    """
+    Run the ETS(A, Ad, A) error-correction recursion.
+
+    values has shape (S, n). The parameters and starting states broadcast
+    against a trailing grid axis, so level and trend are (S, G) and season
+    is (S, G, m).
+
+    Returns:
+    tuple: (sse, level, trend, season, fitted) where fitted is None unless
+    keep_fitted is True.
+    """
+    season_length = season.shape[-1]
+    level, trend, season = level.copy(), trend.copy(), season.copy()
+    sse = np.zeros(np.broadcast(level, alpha).shape)
+    fitted = np.empty(values.shape) if keep_fitted else None
+
+    for t in range(values.shape[1]):
+        season_index = t % season_length
+        damped_trend = phi * trend
+        prediction = level + damped_trend + season[..., season_index]
+        error = values[:, t, None] - prediction
+
+        level = level + damped_trend + alpha * error
+        trend = damped_trend + beta * error
+        season[..., season_index] += gamma * error
+        sse += error ** 2
+
+        if keep_fitted:
+            fitted[:, t] = prediction[:, 0]
+
+    return sse, level, trend, season, fitted
+
+
+def fit_holt_winters(values, future_months=3, season_length=SEASON_LENGTH):
+    """
+    Fit a damped Holt-Winters model to each row and forecast ahead.
+
+    Parameters:
+    values (array-like): Shape (n,) for one series or (S, n) for S series of
+    the same length, oldest month first. Missing months should be filled
+    before fitting.
+    future_months (int): Number of months to forecast.
+    season_length (int): Months per season. Seasonality is dropped when the
+    history is shorter than two seasons.
+
+    Returns:
+    dict: 'fitted' (S, n) one-step-ahead predictions, 'forecast', 'lower',
+    and 'upper' (S, future_months), 'sigma' (S,), and the chosen 'alpha',
+    'beta', 'gamma', and 'phi' (S,). Arrays lose the leading axis when a 1-D
+    series was given.
+    """
+    values = np.asarray(values, dtype=float)
+    single_series = values.ndim == 1
+    values = np.atleast_2d(values)
+    num_series, num_points = values.shape
+    if num_points == 0:
+        raise ValueError("Cannot fit a forecast to an empty series.")
+
+    if season_length is None or num_points < 2 * season_length:
+        season_length = 1
+    seasonal = season_length > 1
+
+    level, trend, season = _initial_states(values, season_length)
+
+    # Score every grid point for every series in one pass.
+    alpha, beta, gamma, phi = _parameter_grid(seasonal)
+    sse = _run_recursion(
+        values, alpha, beta, gamma, phi,
+        np.repeat(level[:, None], len(alpha), axis=1),
+        np.repeat(trend[:, None], len(alpha), axis=1),
+        np.repeat(season[:, None, :], len(alpha), axis=1),
+    )[0]
+    sse = np.where(np.isfinite(sse), sse, np.inf)
+    best = sse.argmin(axis=1)
+
+    # Rerun the chosen parameters to keep the fitted values and final states.
+    alpha, beta, gamma, phi = (grid[best][:, None] for grid in (alpha, beta, gamma, phi))
+    sse, level, trend, season, fitted = _run_recursion(
+        values, alpha, beta, gamma, phi,
+        level[:, None], trend[:, None], season[:, None, :], keep_fitted=True,
+    )
+    level, trend, season = level[:, 0], trend[:, 0], season[:, 0]
+    alpha, beta, gamma, phi = alpha[:, 0], beta[:, 0], gamma[:, 0], phi[:, 0]
+    sigma = np.sqrt(sse[:, 0] / num_points)
+
+    steps = np.arange(1, future_months + 1)
+    damping = np.cumsum(phi[:, None] ** steps, axis=1)
+    season_index = (num_points + steps - 1) % season_length
+    forecast = level[:, None] + damping * trend[:, None] + season[:, season_index]
+
+    # h-step variance of ETS(A, Ad, A): sigma^2 * (1 + sum of c_j^2, j < h).
+    coefficients = alpha[:, None] + beta[:, None] * damping
+    if seasonal:
+        coefficients = coefficients + gamma[:, None] * (steps % season_length == 0)
+    variance_factor = 1 + np.concatenate(
+        [np.zeros((num_series, 1)), np.cumsum(coefficients ** 2, axis=1)[:, :-1]], axis=1
+    )
+    margin = INTERVAL_Z * sigma[:, None] * np.sqrt(variance_factor)
+
+    result = {
+        "fitted": fitted,
+        "forecast": forecast,
+        "lower": forecast - margin,
+        "upper": forecast + margin,
+        "sigma": sigma,
+        "alpha": alpha,
+        "beta": beta,
+        "gamma": gamma,
+        "phi": phi,
+    }
+    if single_series:
+        result = {name: array[0] for name, array in result.items()}
+    return result
@@ -0,0 +1,112 @@
+import holidays
+import numpy as np
+
+from financial_metrics import DAILY_WORK_HOURS, NUM_EMPLOYEES, PROFIT_MARGIN, WORK_DAYS_IN_MONTH
+
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Monte Carlo simulation of the break-even hourly rate.
+#
+# The Daily option's hourly rate uses average payroll and expenses with
+# fixed work days and headcount. Here each scenario instead draws:
+#   - monthly payroll and expenses together from a normal distribution with
+#     the historical means and covariance of the selected months,
+#   - work days from the weekday counts of those same calendar months, less
+#     US federal holidays, rescaled so their mean is WORK_DAYS_IN_MONTH. The
+#     Daily option's rate divides by that same 20-day month, so the
+#     simulation keeps the month-to-month spread but is centred on it,
+#   - headcount from a normal distribution around NUM_EMPLOYEES
+#     (monthly_numbers has no headcount column, so its spread is a setting).
+#
+# Scenarios are evaluated as numpy arrays in chunks of CHUNK_SIZE so memory
+# stays bounded no matter how many are requested.
+# ========================================================================== #
+
+NUM_SCENARIOS = 1_000_000
+CHUNK_SIZE = 250_000
+HEADCOUNT_SPREAD = 0.05
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def business_days_in_months(year_months):
+    """Return the Monday-Friday count of each 'YYYY-MM' month, less US federal holidays."""
+    month_starts = np.asarray(year_months, dtype='datetime64[M]')
+    years = np.unique(month_starts.astype('datetime64[Y]').astype(int) + 1970)
+    holiday_dates = np.array(sorted(holidays.US(years=years.tolist())), dtype='datetime64[D]')
+    return np.busday_count(month_starts.astype('datetime64[D]'),
+                           (month_starts + 1).astype('datetime64[D]'),
+                           holidays=holiday_dates)
+
+
+def simulate_hourly_rates(year_months, payroll, expenses, num_scenarios=NUM_SCENARIOS,
+                          chunk_size=CHUNK_SIZE, headcount_spread=HEADCOUNT_SPREAD,
+                          num_employees=NUM_EMPLOYEES, work_days_mean=WORK_DAYS_IN_MONTH,
+                          seed=None):
+    """
+    Simulate the break-even hourly rate per employee.
+
+    Parameters:
+    year_months (array-like): 'YYYY-MM' of each historical month.
+    payroll (array-like): Monthly payroll for the same months.
+    expenses (array-like): Monthly Quickbooks expenses for the same months.
+    num_scenarios (int): Number of scenarios to evaluate.
+    chunk_size (int): Scenarios evaluated per numpy batch.
+    headcount_spread (float): Standard deviation of headcount as a fraction
+    of num_employees.
+    num_employees (int): Expected headcount.
+    work_days_mean (float): Mean work days per month the sampled calendar
+    months are rescaled to.
+    seed (int, optional): Random seed for repeatable results.
+
+    Returns:
+    ndarray: Break-even hourly rate of every scenario (before profit margin).
+    """
+    payroll = np.asarray(payroll, dtype=float)
+    expenses = np.asarray(expenses, dtype=float)
+    if len(payroll) == 0:
+        raise ValueError("At least one month of payroll and expenses is required.")
+    if num_employees <= 0:
+        raise ValueError("num_employees must be greater than zero.")
+
+    rng = np.random.default_rng(seed)
+    cost_mean = np.array([payroll.mean(), expenses.mean()])
+    cost_covariance = np.cov(np.vstack([payroll, expenses])) if len(payroll) > 1 \
+        else np.zeros((2, 2))
+    work_days = business_days_in_months(year_months)
+    work_days = work_days * (work_days_mean / work_days.mean())
+
+    rates = np.empty(num_scenarios)
+    for start in range(0, num_scenarios, chunk_size):
+        size = min(chunk_size, num_scenarios - start)
+
+        costs = rng.multivariate_normal(cost_mean, cost_covariance, size=size,
+                                        method='eigh').clip(min=0).sum(axis=1)
+        days = rng.choice(work_days, size=size)
+        headcount = np.maximum(
+            np.rint(rng.normal(num_employees, num_employees * headcount_spread, size=size)), 1
+        )
+
+        rates[start:start + size] = costs / days / headcount / DAILY_WORK_HOURS
+
+    return rates
+
+
+def summarize_hourly_rates(rates, percentiles=PERCENTILES, profit_margin=PROFIT_MARGIN):
+    """
+    Summarize simulated rates as percentile bands.
+
+    Returns:
+    dict: 'mean' and 'std' of the break-even rate, and 'bands' mapping each
+    percentile to (break-even rate, rate with profit margin).
+    """
+    bands = np.percentile(rates, percentiles)
+    return {
+        'mean': round(float(rates.mean()), 2),
+        'std': round(float(rates.std()), 2),
+        'bands': {
+            percentile: (round(float(rate), 2), round(float(rate * profit_margin), 2))
+            for percentile, rate in zip(percentiles, bands)
+        },
+    }
@@ -0,0 +1,139 @@
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from postgresql import get_db_connection
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# In-memory copy of the whole monthly_numbers table.
+#
+# The table holds one row per month and changes about once a month, so it is
+# loaded once into a sorted year_month array and a (month x column) value
+# matrix. A [start, end] range is found with two binary searches and
+# returned as a slice (a view, not a copy) of those arrays, so trying
+# different date ranges costs no database round trips.
+#
+# The copy is refreshed when it is older than TTL_SECONDS, or sooner when a
+# cheap max(year_month) check, run at most every CHECK_INTERVAL_SECONDS,
+# shows a new month was added.
+# ========================================================================== #
+
+MONTHLY_NUMBERS_COLUMNS = (
+    'monthly_disposal_cost',
+    'quickbooks_monthly_expenses',
+    'monthly_sales',
+    'monthly_payroll',
+)
+TTL_SECONDS = 60 * 60
+CHECK_INTERVAL_SECONDS = 60
+
+
+class MonthlyNumbersCache:
+    """
+    Whole-table monthly_numbers cache answering date ranges as array slices.
+
+    Attributes:
+    - ttl_seconds (float): Age at which the table is reloaded regardless.
+    - check_interval_seconds (float): Minimum time between max(year_month)
+    checks against the database.
+    - year_months (ndarray): Sorted 'YYYY-MM' strings, one per row.
+    - values (ndarray): (row x MONTHLY_NUMBERS_COLUMNS) float matrix.
+    - version (int): Incremented on every reload so callers can tell when
+    results derived from an older copy are stale.
+    """
+    def __init__(self, ttl_seconds=TTL_SECONDS, check_interval_seconds=CHECK_INTERVAL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.year_months = None
+        self.values = None
+        self.version = 0
+        self.loaded_at = 0.0
+        self.checked_at = 0.0
+
+    def load(self):
+        """Read the whole table into the sorted arrays."""
+        query = """
+            SELECT
+                year_month,
+                disposalcost AS monthly_disposal_cost,
+                expense AS quickbooks_monthly_expenses,
+                sales AS monthly_sales,
+                payroll AS monthly_payroll
+            FROM monthly_numbers
+            ORDER BY year_month;
+        """
+
+        with get_db_connection() as conn:
+            df = pd.read_sql_query(query, conn)
+
+        self.year_months = df['year_month'].astype(str).str[:7].to_numpy(dtype=str)
+        self.values = np.ascontiguousarray(
+            df[list(MONTHLY_NUMBERS_COLUMNS)].apply(pd.to_numeric, errors='coerce')
+            .fillna(0.0).to_numpy(dtype=float)
+        )
+        self.version += 1
+        self.loaded_at = self.checked_at = time.monotonic()
+        logger.debug("Loaded %d monthly_numbers rows (version %d)", len(self.year_months),
+                     self.version)
+
+    def fetch_latest_month(self):
+        """Return max(year_month) from the database as 'YYYY-MM', or None for an empty table."""
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT MAX(year_month) FROM monthly_numbers;")
+                latest_month = cur.fetchone()[0]
+        return None if latest_month is None else str(latest_month)[:7]
+
+    def refresh_if_stale(self):
+        """
+        Reload the table when it was never loaded, has outlived the TTL, or
+        has gained a new latest month.
+
+        Returns:
+        int: The current version.
+        """
+        now = time.monotonic()
+        if self.year_months is None or now - self.loaded_at >= self.ttl_seconds:
+            self.load()
+        elif now - self.checked_at >= self.check_interval_seconds:
+            self.checked_at = now
+            cached_latest = self.year_months[-1] if len(self.year_months) else None
+            if self.fetch_latest_month() != cached_latest:
+                self.load()
+        return self.version
+
+    def get_range(self, start_month, end_month):
+        """
+        Return the rows between two months, inclusive.
+
+        Parameters:
+        start_month (str): 'YYYY-MM'.
+        end_month (str): 'YYYY-MM'.
+
+        Returns:
+        tuple: (year_months, values) views into the cached arrays. Do not
+        modify them in place.
+        """
+        self.refresh_if_stale()
+        start = np.searchsorted(self.year_months, start_month, side='left')
+        end = np.searchsorted(self.year_months, end_month, side='right')
+        return self.year_months[start:end], self.values[start:end]
+
+    def get_range_frame(self, start_month, end_month):
+        """Return get_range() as a DataFrame with year_month and MONTHLY_NUMBERS_COLUMNS."""
+        year_months, values = self.get_range(start_month, end_month)
+        df = pd.DataFrame(values, columns=list(MONTHLY_NUMBERS_COLUMNS), copy=False)
+        df.insert(0, 'year_month', year_months)
+        return df
+
+    def invalidate(self):
+        """Force a reload on the next request, e.g. after writing to monthly_numbers."""
+        self.year_months = None
+        self.values = None
@@ -0,0 +1,242 @@
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from postgresql import get_db_connection
+from forecasting import DEFAULT_FUTURE_MONTHS, FORECAST_BACKENDS, prepare_series, \
+    run_forecasts
+from holt_winters import fit_holt_winters
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Revenue forecasts per project type (project_description) and per
+# estimator, built from awarded bids in the project table.
+#
+# One GROUP BY GROUPING SETS query returns monthly revenue for both
+# dimensions. The series are laid out as rows of one (series x month)
+# matrix over a shared month range, with months that had no awards set to
+# zero. The Holt-Winters backend fits that whole matrix in a single
+# vectorized pass; Prophet fits each row in the forecasting process pool.
+#
+# Usage (from the financials directory):
+#   python project_forecasting.py
+#   python project_forecasting.py --start 2024-01 --end 2025-12 --output forecasts.csv
+#   python project_forecasting.py --backend prophet
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+PROJECT_DIMENSIONS = ('project_description', 'estimator')
+DEFAULT_PROJECT_BACKEND = 'holt_winters'
+UNSPECIFIED_SERIES = 'Unspecified'
+TIDY_COLUMNS = ['dimension', 'series_name', 'ds', 'y', 'yhat', 'yhat_lower', 'yhat_upper',
+                'is_forecast']
+
+# =========================================================================== #
+# ======================== Get Data from PostgreSQL ========================= #
+# =========================================================================== #
+
+def fetch_project_revenue_by_month(start_month=None, end_month=None):
+    """
+    Fetch monthly awarded revenue per project type and per estimator.
+
+    Parameters:
+    start_month (str, optional): First month to include, 'YYYY-MM'.
+    end_month (str, optional): Last month to include, 'YYYY-MM'.
+
+    Returns:
+    DataFrame: dimension ('project_description' or 'estimator'),
+    series_name, month (first day of the month), revenue, and project_count.
+    """
+    query = """
+        SELECT
+            CASE WHEN GROUPING(project_description) = 0
+                 THEN 'project_description' ELSE 'estimator' END AS dimension,
+            COALESCE(
+                CASE WHEN GROUPING(project_description) = 0
+                     THEN project_description ELSE estimator END,
+                %(unspecified)s
+            ) AS series_name,
+            date_trunc('month', awarded_date)::date AS month,
+            SUM(bid_price) AS revenue,
+            COUNT(*) AS project_count
+        FROM project
+        WHERE awarded_date IS NOT NULL
+          AND (%(start_date)s::date IS NULL OR awarded_date >= %(start_date)s::date)
+          AND (%(end_date)s::date IS NULL
+               OR awarded_date < (%(end_date)s::date + INTERVAL '1 month'))
+        GROUP BY GROUPING SETS (
+            (date_trunc('month', awarded_date), project_description),
+            (date_trunc('month', awarded_date), estimator)
+        )
+        ORDER BY dimension, series_name, month;
+    """
+    params = {
+        "unspecified": UNSPECIFIED_SERIES,
+        "start_date": f"{start_month}-01" if start_month else None,
+        "end_date": f"{end_month}-01" if end_month else None,
+    }
+
+    with get_db_connection() as conn:
+        revenue_by_month = pd.read_sql_query(query, conn, params=params)
+
+    revenue_by_month['month'] = pd.to_datetime(revenue_by_month['month'])
+    revenue_by_month['revenue'] = pd.to_numeric(revenue_by_month['revenue'],
+                                                errors='coerce').fillna(0.0)
+    return revenue_by_month
+
+# =========================================================================== #
+# ============================ Batched Forecasts ============================ #
+# =========================================================================== #
+
+def build_series_matrix(revenue_by_month, start_month=None, end_month=None):
+    """
+    Lay out every (dimension, series_name) as a row over a shared month range.
+
+    Parameters:
+    revenue_by_month (DataFrame): Output of fetch_project_revenue_by_month().
+    start_month (str, optional): 'YYYY-MM' to start the range at, even if
+    the first months have no awards.
+    end_month (str, optional): 'YYYY-MM' to end the range at, so the
+    forecast starts after the selected period rather than the last award.
+
+    Returns:
+    tuple: (series_keys, months, matrix) where series_keys is a list of
+    (dimension, series_name), months a DatetimeIndex, and matrix an
+    (len(series_keys), len(months)) float array with zeros for empty months.
+    """
+    first_month = pd.Timestamp(str(start_month)) if start_month else revenue_by_month['month'].min()
+    last_month = pd.Timestamp(str(end_month)) if end_month else revenue_by_month['month'].max()
+    months = pd.date_range(first_month, last_month, freq='MS')
+
+    pivot = revenue_by_month.pivot_table(
+        index=['dimension', 'series_name'], columns='month', values='revenue',
+        aggfunc='sum', fill_value=0.0,
+    ).reindex(columns=months, fill_value=0.0)
+
+    return list(pivot.index), months, pivot.to_numpy(dtype=float)
+
+
+def forecast_series_matrix(series_keys, months, matrix, future_months=DEFAULT_FUTURE_MONTHS,
+                           backend=DEFAULT_PROJECT_BACKEND, cache=None):
+    """
+    Forecast every row of a series matrix and return a tidy table.
+
+    Parameters:
+    series_keys (list of tuple): (dimension, series_name) for each row.
+    months (DatetimeIndex): Month of each column.
+    matrix (ndarray): (series x month) revenue values.
+    future_months (int): Number of future months to predict.
+    backend (str): 'holt_winters' fits all rows in one vectorized pass;
+    'prophet' fits each row in the forecasting process pool.
+    cache (ForecastCache, optional): Cache used by the Prophet backend.
+
+    Returns:
+    DataFrame: One row per series and month with TIDY_COLUMNS. y is NaN and
+    is_forecast True for the future months. Predicted revenue is clipped at
+    zero.
+    """
+    if backend not in FORECAST_BACKENDS:
+        raise ValueError(f"Unknown forecast backend '{backend}'.")
+    if not series_keys:
+        return pd.DataFrame(columns=TIDY_COLUMNS)
+
+    # Month starts like the history, not the month ends Prophet's charts use
+    future_dates = pd.date_range(months[-1] + pd.offsets.MonthBegin(1), periods=future_months,
+                                 freq='MS')
+    num_series = len(series_keys)
+
+    if backend == 'holt_winters':
+        fit = fit_holt_winters(matrix, future_months)
+        yhat = np.hstack([fit['fitted'], fit['forecast']])
+        history_margin = (fit['upper'][:, :1] - fit['forecast'][:, :1]) if future_months \
+            else np.zeros((num_series, 1))
+        yhat_lower = np.hstack([fit['fitted'] - history_margin, fit['lower']])
+        yhat_upper = np.hstack([fit['fitted'] + history_margin, fit['upper']])
+    else:
+        series = [
+            (f"{dimension}: {series_name}",
+             prepare_series(dict(zip(months.strftime('%Y-%m'), row))))
+            for (dimension, series_name), row in zip(series_keys, matrix)
+        ]
+        forecasts = [forecast for _, _, forecast in
+                     run_forecasts(series, future_months, cache=cache, backend='prophet')]
+        yhat, yhat_lower, yhat_upper = (
+            np.vstack([forecast[column].to_numpy() for forecast in forecasts])
+            for column in ['yhat', 'yhat_lower', 'yhat_upper']
+        )
+
+    num_dates = len(months) + len(future_dates)
+    dimensions, series_names = zip(*series_keys)
+    tidy = pd.DataFrame({
+        'dimension': np.repeat(dimensions, num_dates),
+        'series_name': np.repeat(series_names, num_dates),
+        'ds': np.tile(np.concatenate([months.to_numpy(), future_dates.to_numpy()]), num_series),
+        'y': np.hstack([matrix, np.full((num_series, len(future_dates)), np.nan)]).ravel(),
+        'yhat': np.clip(yhat, 0, None).ravel(),
+        'yhat_lower': np.clip(yhat_lower, 0, None).ravel(),
+        'yhat_upper': np.clip(yhat_upper, 0, None).ravel(),
+        'is_forecast': np.tile(np.arange(num_dates) >= len(months), num_series),
+    })
+    return tidy[TIDY_COLUMNS]
+
+
+def forecast_project_revenue(start_month=None, end_month=None,
+                             future_months=DEFAULT_FUTURE_MONTHS,
+                             backend=DEFAULT_PROJECT_BACKEND, cache=None):
+    """
+    Fetch project revenue and forecast every project type and estimator.
+
+    Parameters:
+    start_month (str, optional): First history month, 'YYYY-MM'.
+    end_month (str, optional): Last history month, 'YYYY-MM'.
+    future_months (int): Number of future months to predict.
+    backend (str): 'holt_winters' (default) or 'prophet'.
+    cache (ForecastCache, optional): Cache used by the Prophet backend.
+
+    Returns:
+    DataFrame: Tidy forecast table, see forecast_series_matrix().
+    """
+    revenue_by_month = fetch_project_revenue_by_month(start_month, end_month)
+    if revenue_by_month.empty:
+        raise ValueError("No awarded projects found for the selected date range.")
+
+    series_keys, months, matrix = build_series_matrix(revenue_by_month, start_month, end_month)
+    return forecast_series_matrix(series_keys, months, matrix, future_months, backend, cache)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Forecast revenue per project type and estimator.")
+    parser.add_argument("--start", help="First history month, YYYY-MM.")
+    parser.add_argument("--end", help="Last history month, YYYY-MM.")
+    parser.add_argument("--future-months", type=int, default=DEFAULT_FUTURE_MONTHS,
+                        help="Number of months to forecast.")
+    parser.add_argument("--backend", choices=FORECAST_BACKENDS, default=DEFAULT_PROJECT_BACKEND,
+                        help="Forecasting backend.")
+    parser.add_argument("--output", help="Write the tidy forecast table to this CSV file.")
+    args = parser.parse_args()
+
+    forecast_table = forecast_project_revenue(args.start, args.end, args.future_months,
+                                              args.backend)
+
+    print("\n")
+    print("Forecast Revenue".center(60, "-"))
+    future_rows = forecast_table[forecast_table['is_forecast']]
+    print(future_rows.pivot_table(index=['dimension', 'series_name'], columns='ds',
+                                  values='yhat').round(0).to_string())
+
+    if args.output:
+        forecast_table.to_csv(args.output, index=False)
+        print(f"\nForecast table saved to {args.output}")
@@ -0,0 +1,302 @@
+import argparse
+import csv
+import logging
+import os
+
+import pandas as pd
+from openpyxl import load_workbook
+from psycopg2.extras import execute_values
+
+from postgresql import get_db_connection
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Imports a QuickBooks transaction export (CSV, or XLSX read with openpyxl
+# read-only mode) into monthly_numbers.expense.
+#
+# The export is read CHUNK_ROWS rows at a time. Each chunk's dates and
+# amounts are parsed as whole columns and summed per year_month with one
+# groupby, and the chunk totals are added into a running per-month total,
+# so memory depends on the chunk size and the number of months rather
+# than the number of transactions.
+#
+# QuickBooks reports start with title rows (company name, report name,
+# date range) and contain subtotal rows without a date. The header row is
+# found by its column names, and rows without a valid date or amount are
+# skipped.
+#
+# Imported months have their expense replaced by the export's total, so
+# importing the same file twice gives the same result. Months not in the
+# export are left alone. New months are inserted with zero for the other
+# columns. The financial_rollup triggers pick up the change; the financials
+# GUI sees it when its monthly_numbers copy next reloads.
+#
+# Usage (from the financials directory):
+#   python quickbooks_import.py transactions.csv --dry-run
+#   python quickbooks_import.py general_ledger.xlsx --accounts "Fuel" "Repairs"
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+CHUNK_ROWS = 100_000
+HEADER_SEARCH_ROWS = 50
+DATE_COLUMN = "Date"
+AMOUNT_COLUMN = "Amount"
+ACCOUNT_COLUMN = "Account"
+DATE_FORMAT = "%m/%d/%Y"
+
+# =========================================================================== #
+# ============================= Reading the Export ========================== #
+# =========================================================================== #
+
+def find_header_row(rows, required_columns):
+    """
+    Return the index of the first row containing every required column name.
+
+    Parameters:
+    rows (iterable): Rows of cell values, as lists or tuples.
+    required_columns (list of str): Column names the header must contain.
+
+    Returns:
+    tuple: (row index, header as a list of stripped strings).
+    """
+    for index, row in enumerate(rows):
+        if index >= HEADER_SEARCH_ROWS:
+            break
+        header = [str(value).strip() if value is not None else "" for value in row]
+        if all(column in header for column in required_columns):
+            return index, header
+
+    raise ValueError(f"No header row with columns {', '.join(required_columns)} in the "
+                     f"first {HEADER_SEARCH_ROWS} rows.")
+
+
+def iter_csv_chunks(path, columns, chunk_rows=CHUNK_ROWS):
+    """Yield DataFrames of the given columns, chunk_rows rows at a time."""
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        header_row, _ = find_header_row(csv.reader(file), columns)
+
+    yield from pd.read_csv(path, skiprows=header_row, usecols=columns, dtype=str,
+                           chunksize=chunk_rows, encoding="utf-8-sig", skipinitialspace=True)
+
+
+def iter_xlsx_chunks(path, columns, chunk_rows=CHUNK_ROWS, sheet_name=None):
+    """Yield DataFrames of the given columns from a sheet opened in read-only mode."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.active
+        rows = worksheet.iter_rows(values_only=True)
+        _, header = find_header_row(rows, columns)
+        positions = [header.index(column) for column in columns]
+
+        chunk = []
+        for row in rows:
+            chunk.append([row[position] if position < len(row) else None
+                          for position in positions])
+            if len(chunk) == chunk_rows:
+                yield pd.DataFrame(chunk, columns=columns)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=columns)
+    finally:
+        workbook.close()
+
+
+def iter_transaction_chunks(path, columns, chunk_rows=CHUNK_ROWS, sheet_name=None):
+    """Yield chunks of a .csv or .xlsx export."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return iter_csv_chunks(path, columns, chunk_rows)
+    if extension in (".xlsx", ".xlsm"):
+        return iter_xlsx_chunks(path, columns, chunk_rows, sheet_name)
+    raise ValueError(f"Unsupported export type '{extension}'; use .csv or .xlsx.")
+
+# =========================================================================== #
+# ================================ Aggregation ============================== #
+# =========================================================================== #
+
+def parse_amounts(amounts):
+    """Parse amounts such as '1,234.50', '$-20.00', or '(75.00)' to floats (NaN if invalid)."""
+    values = pd.to_numeric(amounts, errors="coerce")
+
+    # Only amounts with currency signs, thousands separators, or parentheses
+    # go through the slower string cleanup
+    formatted = values.isna() & amounts.notna()
+    if formatted.any():
+        text = amounts[formatted].astype(str).str.replace(r"[$,\s]", "", regex=True)
+        negative = text.str.startswith("(")
+        cleaned = pd.to_numeric(text.str.strip("()"), errors="coerce")
+        values[formatted] = cleaned.where(~negative, -cleaned)
+    return values.astype(float)
+
+
+def aggregate_chunk(chunk, date_column=DATE_COLUMN, amount_column=AMOUNT_COLUMN,
+                    date_format=DATE_FORMAT, account_column=None, accounts=None):
+    """
+    Sum one chunk of transactions per month.
+
+    Returns:
+    Series: Total amount indexed by the first day of each month.
+    """
+    if accounts:
+        chunk = chunk[chunk[account_column].astype(str).str.strip().isin(accounts)]
+
+    # Text dates use date_format; datetimes from Excel cells pass through
+    dates = pd.to_datetime(chunk[date_column], format=date_format, errors="coerce")
+    amounts = parse_amounts(chunk[amount_column])
+
+    valid = (dates.notna() & amounts.notna()).to_numpy()
+    months = dates.to_numpy()[valid].astype('datetime64[M]')
+    return amounts[valid].groupby(months).sum()
+
+
+def aggregate_transactions(chunks, **aggregate_options):
+    """
+    Sum every chunk into one total per month.
+
+    Parameters:
+    chunks (iterable of DataFrame): From iter_transaction_chunks().
+    aggregate_options: Passed to aggregate_chunk().
+
+    Returns:
+    tuple: (Series of totals indexed by 'YYYY-MM' in month order, number
+    of rows read).
+    """
+    totals = pd.Series(dtype=float)
+    rows_read = 0
+    for chunk in chunks:
+        rows_read += len(chunk)
+        totals = totals.add(aggregate_chunk(chunk, **aggregate_options), fill_value=0.0)
+        logger.debug("Aggregated %d rows into %d months", rows_read, len(totals))
+    totals = totals.sort_index()
+    totals.index = pd.DatetimeIndex(totals.index).strftime('%Y-%m')
+    return totals, rows_read
+
+# =========================================================================== #
+# ============================ Write to PostgreSQL ========================== #
+# =========================================================================== #
+
+def upsert_monthly_expenses(monthly_totals):
+    """
+    Set monthly_numbers.expense for every month in monthly_totals.
+
+    Parameters:
+    monthly_totals (Series): Expense total indexed by 'YYYY-MM'.
+
+    Returns:
+    dict: Number of months "updated" and "inserted".
+    """
+    rows = [(year_month, round(float(total), 2)) for year_month, total in monthly_totals.items()]
+    result = {"updated": 0, "inserted": 0}
+    if not rows:
+        return result
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            result["updated"] = len(execute_values(
+                cur,
+                """
+                UPDATE monthly_numbers AS mn
+                SET expense = v.expense
+                FROM (VALUES %s) AS v(year_month, expense)
+                WHERE mn.year_month::text = v.year_month
+                RETURNING mn.year_month;
+                """,
+                rows,
+                template="(%s, %s::numeric)",
+                fetch=True,
+            ))
+            result["inserted"] = len(execute_values(
+                cur,
+                """
+                INSERT INTO monthly_numbers (year_month, expense, sales, payroll, disposalcost)
+                SELECT v.year_month, v.expense, 0, 0, 0
+                FROM (VALUES %s) AS v(year_month, expense)
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM monthly_numbers mn WHERE mn.year_month::text = v.year_month
+                )
+                RETURNING year_month;
+                """,
+                rows,
+                template="(%s, %s::numeric)",
+                fetch=True,
+            ))
+        conn.commit()
+
+    return result
+
+
+def import_quickbooks_export(path, dry_run=False, chunk_rows=CHUNK_ROWS, sheet_name=None,
+                             date_column=DATE_COLUMN, amount_column=AMOUNT_COLUMN,
+                             date_format=DATE_FORMAT, account_column=ACCOUNT_COLUMN,
+                             accounts=None):
+    """
+    Aggregate a QuickBooks export by month and write it to monthly_numbers.
+
+    Parameters:
+    path (str): .csv or .xlsx transaction export.
+    dry_run (bool): Only aggregate; do not write to PostgreSQL.
+    chunk_rows (int): Rows read per chunk.
+    sheet_name (str, optional): Worksheet of an .xlsx export. Defaults to
+    the active sheet.
+    date_column (str): Header of the transaction date column.
+    amount_column (str): Header of the amount column.
+    date_format (str): strptime format of text dates.
+    account_column (str): Header of the account column, used with accounts.
+    accounts (list of str, optional): Only import these accounts.
+
+    Returns:
+    dict: "monthly_totals" (Series), "rows_read", and the "updated" and
+    "inserted" month counts.
+    """
+    columns = [date_column, amount_column] + ([account_column] if accounts else [])
+    chunks = iter_transaction_chunks(path, columns, chunk_rows, sheet_name)
+    monthly_totals, rows_read = aggregate_transactions(
+        chunks, date_column=date_column, amount_column=amount_column, date_format=date_format,
+        account_column=account_column, accounts=set(accounts or []),
+    )
+    logger.info("Read %d rows covering %d months from %s", rows_read, len(monthly_totals), path)
+
+    result = {"monthly_totals": monthly_totals, "rows_read": rows_read,
+              "updated": 0, "inserted": 0}
+    if not dry_run:
+        result.update(upsert_monthly_expenses(monthly_totals))
+    return result
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(
+        description="Import QuickBooks transactions into monthly_numbers.expense.")
+    parser.add_argument("path", help="QuickBooks export, .csv or .xlsx.")
+    parser.add_argument("--sheet", help="Worksheet of an .xlsx export. Defaults to the active one.")
+    parser.add_argument("--date-column", default=DATE_COLUMN, help="Transaction date header.")
+    parser.add_argument("--amount-column", default=AMOUNT_COLUMN, help="Amount header.")
+    parser.add_argument("--date-format", default=DATE_FORMAT, help="Format of text dates.")
+    parser.add_argument("--account-column", default=ACCOUNT_COLUMN, help="Account header.")
+    parser.add_argument("--accounts", nargs="+", help="Only import these accounts.")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Rows read per chunk.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the monthly totals without writing them.")
+    args = parser.parse_args()
+
+    result = import_quickbooks_export(args.path, args.dry_run, args.chunk_rows, args.sheet,
+                                      args.date_column, args.amount_column, args.date_format,
+                                      args.account_column, args.accounts)
+
+    print("\n")
+    print("QuickBooks Monthly Expenses".center(40, "-"))
+    for year_month, total in result["monthly_totals"].items():
+        print(f"{year_month} = {total:,.2f}")
+    print(f"\n{result['rows_read']:,} rows read")
+    if not args.dry_run:
+        print(f"{result['updated']} months updated, {result['inserted']} months inserted")
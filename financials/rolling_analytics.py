@@ -0,0 +1,168 @@
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from monthly_numbers_cache import MonthlyNumbersCache
+
+
+logger = logging.getLogger(__name__)
+
+# ========================================================================== #
+# ================================== INFO ================================== #
+# ========================================================================== #
+# Rolling-window analytics over the whole monthly_numbers history.
+#
+# Trailing-twelve-month (TTM) totals for every month come from one
+# cumulative sum: each window total is the difference of two prefix sums,
+# so all windows cost O(n) together. Month-over-month and year-over-year
+# changes are shifted differences of the same arrays. Months missing from
+# the table stay NaN, and a window is only reported once all of its months
+# are present.
+#
+# Usage (from the financials directory):
+#   python rolling_analytics.py --output rolling_analytics.csv
+# ========================================================================== #
+# ================================== TODO ================================== #
+# ========================================================================== #
+# TODO:
+# Add PostgreSQL variables to .env before running program.
+# See postgresql.py for required parameters.
+# ========================================================================== #
+
+TRAILING_MONTHS = 12
+ROLLING_METRICS = ('operating_cost', 'payroll', 'sales')
+
+
+def monthly_metric_matrix(year_months, values):
+    """
+    Lay the monthly_numbers rows out on a gap-free month axis.
+
+    Parameters:
+    year_months (ndarray): Sorted 'YYYY-MM' strings.
+    values (ndarray): (row x MONTHLY_NUMBERS_COLUMNS) matrix from
+    MonthlyNumbersCache.
+
+    Returns:
+    tuple: (months, matrix) where months is a PeriodIndex covering every
+    month from the first to the last row and matrix is (month x
+    ROLLING_METRICS) with NaN for months that have no row.
+    """
+    periods = pd.PeriodIndex(year_months, freq='M')
+    months = pd.period_range(periods.min(), periods.max(), freq='M')
+
+    # MONTHLY_NUMBERS_COLUMNS order: disposal, expenses, sales, payroll
+    disposal, expenses, sales, payroll = values.T
+    matrix = np.full((len(months), len(ROLLING_METRICS)), np.nan)
+    rows = (periods - months[0]).map(lambda offset: offset.n).to_numpy()
+    matrix[rows] = np.column_stack([payroll + expenses, payroll, sales])
+    return months, matrix
+
+
+def trailing_sums(matrix, window=TRAILING_MONTHS):
+    """
+    Sum every trailing window of each column with prefix sums.
+
+    Returns:
+    ndarray: Same shape as matrix; rows without `window` months of complete
+    history are NaN.
+    """
+    present = ~np.isnan(matrix)
+    zero_row = np.zeros((1, matrix.shape[1]))
+    value_sums = np.vstack([zero_row, np.cumsum(np.where(present, matrix, 0.0), axis=0)])
+    count_sums = np.vstack([zero_row, np.cumsum(present, axis=0)])
+
+    totals = np.full(matrix.shape, np.nan)
+    if len(matrix) >= window:
+        window_totals = value_sums[window:] - value_sums[:-window]
+        complete = (count_sums[window:] - count_sums[:-window]) == window
+        totals[window - 1:] = np.where(complete, window_totals, np.nan)
+    return totals
+
+
+def lagged_change(matrix, lag):
+    """Return (matrix[t] - matrix[t - lag], percent change) with NaN where undefined."""
+    change = np.full(matrix.shape, np.nan)
+    percent = np.full(matrix.shape, np.nan)
+    if len(matrix) > lag:
+        previous = matrix[:-lag]
+        change[lag:] = matrix[lag:] - previous
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent[lag:] = np.where(previous != 0, change[lag:] / np.abs(previous) * 100, np.nan)
+    return change, percent
+
+
+def compute_rolling_analytics(year_months, values, window=TRAILING_MONTHS):
+    """
+    Compute TTM totals and MoM/YoY changes for every month of history.
+
+    Parameters:
+    year_months (ndarray): Sorted 'YYYY-MM' strings.
+    values (ndarray): (row x MONTHLY_NUMBERS_COLUMNS) matrix.
+    window (int): Trailing window length in months.
+
+    Returns:
+    DataFrame: year_month plus, for each of ROLLING_METRICS, the monthly
+    value, ttm_<metric>, <metric>_mom_change, <metric>_mom_pct,
+    <metric>_yoy_change, and <metric>_yoy_pct.
+    """
+    if len(year_months) == 0:
+        raise ValueError("No monthly_numbers records to analyze.")
+
+    months, matrix = monthly_metric_matrix(year_months, values)
+    ttm = trailing_sums(matrix, window)
+    mom_change, mom_pct = lagged_change(matrix, 1)
+    yoy_change, yoy_pct = lagged_change(matrix, 12)
+
+    columns = {'year_month': months.strftime('%Y-%m')}
+    for index, metric in enumerate(ROLLING_METRICS):
+        columns[metric] = matrix[:, index]
+        columns[f'ttm_{metric}'] = ttm[:, index]
+        columns[f'{metric}_mom_change'] = mom_change[:, index]
+        columns[f'{metric}_mom_pct'] = mom_pct[:, index]
+        columns[f'{metric}_yoy_change'] = yoy_change[:, index]
+        columns[f'{metric}_yoy_pct'] = yoy_pct[:, index]
+    return pd.DataFrame(columns)
+
+
+def get_rolling_analytics(monthly_numbers_cache, start_month=None, end_month=None,
+                          window=TRAILING_MONTHS):
+    """
+    Compute rolling analytics from the cached table and keep a date range.
+
+    Windows are computed over the full history first, so the first months
+    of the range still get a complete trailing window.
+    """
+    monthly_numbers_cache.refresh_if_stale()
+    analytics = compute_rolling_analytics(monthly_numbers_cache.year_months,
+                                          monthly_numbers_cache.values, window)
+    in_range = np.ones(len(analytics), dtype=bool)
+    if start_month:
+        in_range &= analytics['year_month'].to_numpy(dtype=str) >= start_month
+    if end_month:
+        in_range &= analytics['year_month'].to_numpy(dtype=str) <= end_month
+    return analytics[in_range].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Trailing-twelve-month and MoM/YoY analytics.")
+    parser.add_argument("--start", help="First month to report, YYYY-MM.")
+    parser.add_argument("--end", help="Last month to report, YYYY-MM.")
+    parser.add_argument("--window", type=int, default=TRAILING_MONTHS,
+                        help="Trailing window length in months.")
+    parser.add_argument("--output", help="Write the analytics table to this CSV file.")
+    args = parser.parse_args()
+
+    analytics = get_rolling_analytics(MonthlyNumbersCache(), args.start, args.end, args.window)
+
+    print("\n")
+    print("Trailing Totals".center(60, "-"))
+    print(analytics[['year_month'] + [f'ttm_{metric}' for metric in ROLLING_METRICS]]
+          .to_string(index=False, float_format=lambda value: f"{value:,.2f}"))
+
+    if args.output:
+        analytics.to_csv(args.output, index=False)
+        print(f"\nAnalytics saved to {args.output}")
@@ -0,0 +1,75 @@
+-- ========================================================================== --
+-- Contact book full-text search
+-- ========================================================================== --
+-- Adds a weighted tsvector to client rows covering the company name, client
+-- names, email, and phone digits. Triggers keep it current when either a
+-- client or its company changes, and a GIN index serves ranked lookups from
+-- estimate_project/contact_book.py.
+--
+-- Run once against the estimating database:
+--   psql -d your_database_name -f sql_database_layouts/contact_search.sql
+-- ========================================================================== --
+
+ALTER TABLE client ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+CREATE OR REPLACE FUNCTION client_search_vector(
+    company_name TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    email TEXT,
+    phone TEXT
+) RETURNS tsvector
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT
+        setweight(to_tsvector('simple', COALESCE(company_name, '')), 'A')
+        || setweight(to_tsvector('simple', concat_ws(' ', first_name, last_name)), 'A')
+        || setweight(to_tsvector('simple', COALESCE(email, '')), 'B')
+        || setweight(to_tsvector('simple', translate(COALESCE(email, ''), '@._-', '    ')), 'B')
+        || setweight(to_tsvector('simple', regexp_replace(COALESCE(phone, ''), '\D', '', 'g')), 'C')
+$$;
+
+-- Client rows: recompute on insert or when any searchable column changes.
+CREATE OR REPLACE FUNCTION client_search_vector_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := client_search_vector(
+        (SELECT company_name FROM company WHERE company_id = NEW.company_id),
+        NEW.first_name,
+        NEW.last_name,
+        NEW.email,
+        NEW.phone
+    );
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS client_search_vector_update ON client;
+CREATE TRIGGER client_search_vector_update
+    BEFORE INSERT OR UPDATE OF company_id, first_name, last_name, email, phone
+    ON client
+    FOR EACH ROW EXECUTE FUNCTION client_search_vector_trigger();
+
+-- Company rows: a rename has to flow into every client of that company.
+CREATE OR REPLACE FUNCTION company_search_vector_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE client
+    SET search_vector = client_search_vector(NEW.company_name, first_name, last_name, email, phone)
+    WHERE company_id = NEW.company_id;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS company_search_vector_update ON company;
+CREATE TRIGGER company_search_vector_update
+    AFTER INSERT OR UPDATE OF company_name
+    ON company
+    FOR EACH ROW EXECUTE FUNCTION company_search_vector_trigger();
+
+-- Backfill existing rows.
+UPDATE client AS c
+SET search_vector = client_search_vector(co.company_name, c.first_name, c.last_name, c.email, c.phone)
+FROM company co
+WHERE co.company_id = c.company_id;
+
+CREATE INDEX IF NOT EXISTS client_search_vector_idx ON client USING GIN (search_vector);
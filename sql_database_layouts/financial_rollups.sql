@@ -0,0 +1,188 @@
+-- ========================================================================== --
+-- Financial rollups
+-- ========================================================================== --
+-- Month, quarter, and year totals of monthly_numbers (sales, expense,
+-- payroll, disposalcost) and of awarded projects (count, bid_price,
+-- job_cost), read by financials/financial_rollups.py.
+--
+-- Triggers on monthly_numbers and project record which months changed in
+-- financial_rollup_dirty. refresh_financial_rollups() recomputes only those
+-- months, then the quarters and years that contain them, from the month
+-- rows, so a new month or project never rescans the full history.
+--
+-- Run once against the estimating database:
+--   psql -d your_database_name -f sql_database_layouts/financial_rollups.sql
+-- ========================================================================== --
+
+CREATE TABLE IF NOT EXISTS financial_rollup (
+    period_type     VARCHAR(10)     NOT NULL,   -- 'month', 'quarter', or 'year'
+    period_start    DATE            NOT NULL,
+    months          INTEGER         NOT NULL DEFAULT 0,
+    sales           NUMERIC(14, 2)  NOT NULL DEFAULT 0,
+    expense         NUMERIC(14, 2)  NOT NULL DEFAULT 0,
+    payroll         NUMERIC(14, 2)  NOT NULL DEFAULT 0,
+    disposalcost    NUMERIC(14, 2)  NOT NULL DEFAULT 0,
+    project_count   INTEGER         NOT NULL DEFAULT 0,
+    bid_total       NUMERIC(14, 2)  NOT NULL DEFAULT 0,
+    job_cost_total  NUMERIC(14, 2)  NOT NULL DEFAULT 0,
+    refreshed_at    TIMESTAMPTZ     NOT NULL DEFAULT now(),
+    PRIMARY KEY (period_type, period_start)
+);
+
+CREATE TABLE IF NOT EXISTS financial_rollup_dirty (
+    month DATE PRIMARY KEY
+);
+
+-- Queue the old and new month of every changed row.
+CREATE OR REPLACE FUNCTION monthly_numbers_rollup_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO financial_rollup_dirty (month)
+        VALUES (to_date(OLD.year_month::text, 'YYYY-MM'))
+        ON CONFLICT DO NOTHING;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO financial_rollup_dirty (month)
+        VALUES (to_date(NEW.year_month::text, 'YYYY-MM'))
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS monthly_numbers_rollup_update ON monthly_numbers;
+CREATE TRIGGER monthly_numbers_rollup_update
+    AFTER INSERT OR UPDATE OR DELETE ON monthly_numbers
+    FOR EACH ROW EXECUTE FUNCTION monthly_numbers_rollup_trigger();
+
+CREATE OR REPLACE FUNCTION project_rollup_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.awarded_date IS NOT NULL THEN
+        INSERT INTO financial_rollup_dirty (month)
+        VALUES (date_trunc('month', OLD.awarded_date)::date)
+        ON CONFLICT DO NOTHING;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.awarded_date IS NOT NULL THEN
+        INSERT INTO financial_rollup_dirty (month)
+        VALUES (date_trunc('month', NEW.awarded_date)::date)
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS project_rollup_update ON project;
+CREATE TRIGGER project_rollup_update
+    AFTER INSERT OR UPDATE OF awarded_date, bid_price, job_cost OR DELETE ON project
+    FOR EACH ROW EXECUTE FUNCTION project_rollup_trigger();
+
+-- Recompute the queued months and their quarters and years. Returns the
+-- number of months refreshed.
+CREATE OR REPLACE FUNCTION refresh_financial_rollups() RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    dirty_months DATE[];
+    first_month DATE;
+    last_month DATE;
+    rollup_period TEXT;
+BEGIN
+    WITH claimed AS (
+        DELETE FROM financial_rollup_dirty RETURNING month
+    )
+    SELECT array_agg(DISTINCT month) INTO dirty_months FROM claimed;
+
+    IF dirty_months IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    -- Range bounds let the source scans use indexes on year_month/awarded_date.
+    SELECT min(dirty.month), max(dirty.month) INTO first_month, last_month
+    FROM unnest(dirty_months) AS dirty(month);
+
+    DELETE FROM financial_rollup
+    WHERE period_type = 'month' AND period_start = ANY(dirty_months);
+
+    INSERT INTO financial_rollup (
+        period_type, period_start, months, sales, expense, payroll, disposalcost,
+        project_count, bid_total, job_cost_total
+    )
+    SELECT
+        'month',
+        dirty.month,
+        COALESCE(mn.months, 0),
+        COALESCE(mn.sales, 0),
+        COALESCE(mn.expense, 0),
+        COALESCE(mn.payroll, 0),
+        COALESCE(mn.disposalcost, 0),
+        COALESCE(p.project_count, 0),
+        COALESCE(p.bid_total, 0),
+        COALESCE(p.job_cost_total, 0)
+    FROM unnest(dirty_months) AS dirty(month)
+    LEFT JOIN (
+        SELECT
+            to_date(year_month::text, 'YYYY-MM') AS month,
+            COUNT(*) AS months,
+            SUM(sales) AS sales,
+            SUM(expense) AS expense,
+            SUM(payroll) AS payroll,
+            SUM(disposalcost) AS disposalcost
+        FROM monthly_numbers
+        WHERE year_month::text >= to_char(first_month, 'YYYY-MM')
+          AND year_month::text < to_char(last_month + INTERVAL '1 month', 'YYYY-MM')
+          AND to_date(year_month::text, 'YYYY-MM') = ANY(dirty_months)
+        GROUP BY 1
+    ) AS mn ON mn.month = dirty.month
+    LEFT JOIN (
+        SELECT
+            date_trunc('month', awarded_date)::date AS month,
+            COUNT(*) AS project_count,
+            SUM(bid_price) AS bid_total,
+            SUM(job_cost) AS job_cost_total
+        FROM project
+        WHERE awarded_date >= first_month
+          AND awarded_date < last_month + INTERVAL '1 month'
+          AND date_trunc('month', awarded_date)::date = ANY(dirty_months)
+        GROUP BY 1
+    ) AS p ON p.month = dirty.month
+    WHERE mn.month IS NOT NULL OR p.month IS NOT NULL;
+
+    FOREACH rollup_period IN ARRAY ARRAY['quarter', 'year'] LOOP
+        DELETE FROM financial_rollup
+        WHERE period_type = rollup_period
+          AND period_start IN (
+              SELECT date_trunc(rollup_period, dirty.month)::date
+              FROM unnest(dirty_months) AS dirty(month)
+          );
+
+        INSERT INTO financial_rollup (
+            period_type, period_start, months, sales, expense, payroll, disposalcost,
+            project_count, bid_total, job_cost_total
+        )
+        SELECT
+            rollup_period,
+            date_trunc(rollup_period, period_start)::date,
+            SUM(months), SUM(sales), SUM(expense), SUM(payroll), SUM(disposalcost),
+            SUM(project_count), SUM(bid_total), SUM(job_cost_total)
+        FROM financial_rollup
+        WHERE period_type = 'month'
+          AND date_trunc(rollup_period, period_start)::date IN (
+              SELECT date_trunc(rollup_period, dirty.month)::date
+              FROM unnest(dirty_months) AS dirty(month)
+          )
+        GROUP BY 2;
+    END LOOP;
+
+    RETURN array_length(dirty_months, 1);
+END;
+$$;
+
+-- Backfill: queue every month that already has data, then build the rollups.
+INSERT INTO financial_rollup_dirty (month)
+SELECT to_date(year_month::text, 'YYYY-MM') FROM monthly_numbers
+UNION
+SELECT date_trunc('month', awarded_date)::date FROM project WHERE awarded_date IS NOT NULL
+ON CONFLICT DO NOTHING;
+
+SELECT refresh_financial_rollups();
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "financials"))
+
+from financial_metrics import DAILY_WORK_HOURS, NUM_EMPLOYEES, WORK_DAYS_IN_MONTH  # noqa: E402
+from hourly_rate_simulation import business_days_in_months, simulate_hourly_rates  # noqa: E402
+
+SAMPLE_DATA = os.path.join(REPO_DIR, "data", "monthly_numbers_sample_data_(2026-08-01).csv")
+
+
+def test_business_days_exclude_federal_holidays():
+    # January 2026: 22 weekdays less New Year's Day and MLK Day
+    assert business_days_in_months(["2026-01"]).tolist() == [20]
+
+
+def test_simulated_median_matches_daily_option_rate():
+    monthly_numbers = pd.read_csv(SAMPLE_DATA)
+    payroll = monthly_numbers["payroll"].to_numpy(dtype=float)
+    expenses = monthly_numbers["expense"].to_numpy(dtype=float)
+
+    rates = simulate_hourly_rates(monthly_numbers["year_month"].astype(str), payroll, expenses,
+                                  num_scenarios=200_000, seed=7)
+    deterministic_rate = (payroll.mean() + expenses.mean()) / WORK_DAYS_IN_MONTH \
+        / NUM_EMPLOYEES / DAILY_WORK_HOURS
+
+    assert np.median(rates) == pytest.approx(deterministic_rate, rel=0.02)
@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "estimate_project"))
+
+from json_import import iter_json_array  # noqa: E402
+
+ITEMS = [
+    {"client": "Zoë Núñez", "company": "Café Démolition", "phone": "555-0100"},
+    {"client": "éè \\ \"quoted\"", "emoji": "\U0001F3D7", "rate": "$1,450.00"},
+    1500.0, -2.5e-3, 1e5, True, False, None, "tab\tnew\nline", [], {},
+]
+
+
+@pytest.fixture
+def escaped_json_file(tmp_path):
+    path = tmp_path / "contacts.json"
+    # ensure_ascii writes every non-ASCII character as a \uXXXX escape
+    path.write_text(json.dumps(ITEMS), encoding="utf-8")
+    return path
+
+
+def test_items_split_at_every_chunk_size(escaped_json_file):
+    text_length = len(escaped_json_file.read_text(encoding="utf-8"))
+    for chunk_size in range(1, text_length + 2):
+        assert list(iter_json_array(escaped_json_file, chunk_size)) == ITEMS, chunk_size
+
+
+def test_large_export_with_escapes_at_default_chunk_size(tmp_path):
+    path = tmp_path / "contacts.json"
+    contacts = [{"client": f"Zoë Núñez {i}", "company": "Café Démolition"} for i in range(20_000)]
+    path.write_text(json.dumps(contacts), encoding="utf-8")
+    assert list(iter_json_array(path)) == contacts
+
+
+@pytest.mark.parametrize("text", ["[1 2]", "[1,,2]", "[,1]", "[1,]", "[1, {\"a\": x}, 3]",
+                                  "[1, 2", "{\"a\": 1}"])
+def test_malformed_arrays_raise(tmp_path, text):
+    path = tmp_path / "bad.json"
+    path.write_text(text, encoding="utf-8")
+    for chunk_size in (1, 2, 3, 64):
+        with pytest.raises(ValueError):
+            list(iter_json_array(path, chunk_size))